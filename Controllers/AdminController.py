@@ -1,76 +1,130 @@
-from Models.Database import Database
+import datetime
+
+from Models.Database import Database, get_shared_database
 from Models.ResidentModel import ResidentModel
 from Models.VehicleModel import VehicleModel
 from Models.ViolationModel import ViolationModel
 from Models.PaymentModel import PaymentModel
+from Models.DashboardSummaryModel import DashboardSummaryModel, MONTHS
+from Models.ChangeFeedModel import ChangeFeedModel
+from Controllers.Utility.SearchIndex import SearchIndex
+
+
+# Years offered by the dashboard's year filter (the current one and earlier)
+DASHBOARD_YEARS = 6
+
+
+def _resident_full_name(resident: dict) -> str:
+    first = resident.get('first_name', '') or ''
+    middle = resident.get('middle_name', '') or ''
+    last = resident.get('last_name', '') or ''
+    return f"{first} {middle} {last}"
 
 
 class AdminController:
     """Handles admin dashboard and operations business logic"""
 
-    def __init__(self, admin_data: dict):
+    def __init__(self, admin_data: dict, db: Database = None):
         self.admin_data = admin_data
-        self.db = Database(host='localhost', database='RoadEyeDB', user='root', password='')
+        self.db = db or get_shared_database()
         self.resident_model = ResidentModel(self.db)
         self.vehicle_model = VehicleModel(self.db)
         self.violation_model = ViolationModel(self.db)
         self.payment_model = PaymentModel(self.db)
+        self.summary_model = DashboardSummaryModel(self.db)
+        self.change_model = ChangeFeedModel(self.db)
+        self.resident_index = SearchIndex(['ResidentID', _resident_full_name, 'ContactNo', 'Address'])
 
     def initialize_database(self):
-        """Check and apply database migrations"""
-        return self.db.check_and_migrate()
+        """Check and apply database migrations, then prune the change log"""
+        success, message = self.db.check_and_migrate()
+        if success:
+            self.summary_model.ensure_tables()
+            self.change_model.prune()
+        return success, message
+
+    def rebuild_dashboard_summary(self):
+        """Regenerate the materialized dashboard summary from scratch"""
+        return self.summary_model.rebuild()
+
+    def get_cache_statistics(self):
+        """Query cache hit/miss counters for diagnostics"""
+        return self.db.query_cache.stats()
 
     def get_dashboard_statistics(self):
         """Get all statistics for admin dashboard"""
-        total_violations, unpaid_violations = self.violation_model.get_violation_statistics()
-        paid_violations = total_violations - unpaid_violations
-
-        payment_stats = self.payment_model.get_payment_statistics()
+        # O(1) read from the materialized summary when it has been built
+        summary = self.summary_model.get_summary()
+        if summary:
+            return {
+                'total_violations': summary['total_violations'],
+                'paid_violations': summary['paid_violations'],
+                'unpaid_violations': summary['unpaid_violations'],
+                'total_revenue': summary['total_revenue'],
+                'total_residents': summary['total_residents'],
+                'total_vehicles': summary['total_vehicles']
+            }
+
+        # Counts and revenue come back from one aggregate query
+        summary = self.violation_model.get_violation_summary()
 
         total_residents = self.resident_model.get_total_residents()
         total_vehicles = self.vehicle_model.get_total_vehicles()
 
         return {
-            'total_violations': total_violations,
-            'paid_violations': paid_violations,
-            'unpaid_violations': unpaid_violations,
-            'total_revenue': payment_stats['total_revenue'],
+            'total_violations': summary['total_violations'],
+            'paid_violations': summary['paid_count'],
+            'unpaid_violations': summary['unpaid_count'],
+            'total_revenue': summary['total_revenue'],
             'total_residents': total_residents,
             'total_vehicles': total_vehicles
         }
 
     def get_monthly_chart_data(self, year: int = None):
         """Get monthly violations data for dashboard chart, filtered by year"""
-        return self.violation_model.get_monthly_violations(year=year)
+        filter_year = year if year else datetime.date.today().year
+        monthly_data = self.summary_model.get_monthly_counts(filter_year)
+        if monthly_data is not None:
+            return monthly_data
+
+        # One grouped query covers every year in the filter, so switching years reuses it
+        last_year = datetime.date.today().year
+        first_year = last_year - DASHBOARD_YEARS + 1
+        if not first_year <= filter_year <= last_year:
+            first_year = last_year = filter_year
+        series = self.violation_model.get_violation_time_series(
+            datetime.date(first_year, 1, 1), datetime.date(last_year + 1, 1, 1), 'month'
+        )
+        return {
+            MONTHS[month_start.month - 1]: count
+            for month_start, count in zip(series['buckets'], series['counts'])
+            if month_start.year == filter_year
+        }
 
     def get_all_residents(self):
         """Get all residents with statistics"""
         return self.resident_model.get_all_residents()
 
+    def get_residents_by_ids(self, resident_ids):
+        """Get current rows for changed residents (see ChangeFeedController)"""
+        return self.resident_model.get_all_residents(tuple(sorted(resident_ids)))
+
     def get_resident_details(self, resident_id: str):
         """Get detailed resident information"""
         resident = self.resident_model.get_resident_details(resident_id)
         vehicles = self.resident_model.get_resident_vehicles(resident_id)
         return resident, vehicles
 
-    def search_residents(self, residents: list, search_text: str):
-        """Filter residents based on search text — supports separate name fields"""
-        if not search_text:
-            return residents
-
-        search_lower = search_text.lower()
-        filtered = []
-
-        for resident in residents:
-            first = resident.get('first_name', '') or ''
-            middle = resident.get('middle_name', '') or ''
-            last = resident.get('last_name', '') or ''
-            full_name = f"{first} {middle} {last}".lower()
+    def find_residents(self, residents: list, search_text: str):
+        """
+        Row ids of residents matching the search text (ID, name, contact or address)
 
-            if (search_lower in str(resident.get('ResidentID', '')).lower() or
-                    search_lower in full_name or
-                    search_lower in str(resident.get('ContactNo', '')).lower() or
-                    search_lower in str(resident.get('Address', '')).lower()):
-                filtered.append(resident)
+        Returns:
+            set or None: Positions in residents, None when nothing is filtered
+        """
+        self.resident_index.ensure(residents)
+        return self.resident_index.search(search_text)
 
-        return filtered
\ No newline at end of file
+    def search_residents(self, residents: list, search_text: str):
+        """Filter residents based on search text — supports separate name fields"""
+        return self.resident_index.select(self.find_residents(residents, search_text))
\ No newline at end of file
@@ -2,7 +2,7 @@
 Controllers/AuthController.py
 Authentication and registration business logic (extracted from RoadEyeMain.py and SignUpWindow.py)
 """
-from Models.Database import Database
+from Models.Database import Database, get_shared_database
 from Models.UserModel import UserModel
 from Controllers.Utility.ValidationHelper import ValidationHelper
 
@@ -10,8 +10,8 @@ from Controllers.Utility.ValidationHelper import ValidationHelper
 class AuthController:
     """Handles authentication and registration business logic"""
 
-    def __init__(self):
-        self.db = Database(host='localhost', database='RoadEyeDB', user='root', password='')
+    def __init__(self, db: Database = None):
+        self.db = db or get_shared_database()
         self.user_model = UserModel(self.db)
 
     def login(self, username: str, password: str):
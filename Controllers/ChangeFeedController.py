@@ -0,0 +1,138 @@
+import time
+
+from Models.Database import Database, get_shared_database
+from Models.ChangeFeedModel import ChangeFeedModel, CHANGE_LOG_RETENTION_HOURS
+
+
+# How often an open window asks for changes made by other clients
+CHANGE_POLL_INTERVAL_MS = 5000
+
+# More changes than this since the last poll: reload instead of patching
+MAX_CHANGES_PER_POLL = 1000
+
+# A missing ChangeID may belong to a write that has not committed yet; it
+# is looked for again until this long after it was noticed (a rolled-back
+# write leaves a gap for good)
+CHANGE_GAP_GRACE_SECONDS = 60
+
+# Recent entries checked for such gaps when a window starts from the end of the log
+RESTART_LOOKBACK = 100
+
+# Base tables the materialized dashboard tables are derived from; their
+# writers update the summaries in the same transaction
+DASHBOARD_SOURCE_TABLES = {'violations', 'payments', 'vehicles', 'residents'}
+DASHBOARD_SUMMARY_TABLES = ('dashboard_summary', 'violation_monthly_counts')
+
+
+class ChangeFeedController:
+    """
+    Tracks one window's position in the change log
+
+    ChangeIDs are taken when a write inserts its entry but only become
+    visible when it commits, so a later ID can show up first. version is
+    therefore the ID up to which every entry has been delivered (or given
+    up on); entries after it that were already delivered are remembered
+    and skipped when they are read again.
+    """
+
+    def __init__(self, db: Database = None, clock=time.time):
+        self.db = db or get_shared_database()
+        self.change_model = ChangeFeedModel(self.db)
+        self.clock = clock
+        self.version = None
+        self._delivered = set()  # ChangeIDs after version already returned
+        self._gaps = {}  # ChangeID missing after version -> when it was noticed
+        self._last_read = None
+
+    def poll(self):
+        """
+        Records changed since the previous poll
+
+        The first call only records the current position.
+
+        Returns:
+            dict or None: Table name -> set of changed RecordIDs (empty when
+                          nothing changed); None when too much changed to
+                          patch, so everything should be reloaded
+        """
+        now = self.clock()
+        if self.version is None:
+            self._restart(now)
+            return {}
+
+        if now - self._last_read > CHANGE_LOG_RETENTION_HOURS * 3600:
+            # Entries this window has not read yet may have been pruned
+            return self._reload(now)
+
+        changes = self.change_model.get_changes_since(self.version, MAX_CHANGES_PER_POLL)
+        if changes is None:
+            return {}
+        self._last_read = now
+        if len(changes) >= MAX_CHANGES_PER_POLL:
+            return self._reload(now)
+
+        changes = [change for change in changes if change['ChangeID'] not in self._delivered]
+        self._delivered.update(change['ChangeID'] for change in changes)
+        self._advance(now)
+        if not changes:
+            return {}
+
+        changed = {}
+        for change in changes:
+            changed.setdefault(change['TableName'], set()).add(change['RecordID'])
+
+        # Writes by other clients never invalidated this process's cache
+        invalidated = set(changed)
+        if invalidated & DASHBOARD_SOURCE_TABLES:
+            invalidated.update(DASHBOARD_SUMMARY_TABLES)
+        self.db.query_cache.invalidate(*invalidated)
+        return changed
+
+    def _reload(self, now):
+        """Start again from the end of the log; the caller reloads everything"""
+        if not self._restart(now):
+            return {}
+        self.db.query_cache.clear()
+        return None
+
+    def _restart(self, now) -> bool:
+        """
+        Position the feed at the end of the log
+
+        The last RESTART_LOOKBACK IDs count as delivered (their writes are
+        already in what the window loads) except the ones not visible yet,
+        which are watched as gaps.
+        """
+        version = self.change_model.get_current_version()
+        if version is None:
+            return False
+        start = max(0, version - RESTART_LOOKBACK)
+        recent = self.change_model.get_changes_since(start, RESTART_LOOKBACK)
+        if recent is None:
+            return False
+
+        self.version = start
+        self._delivered = {change['ChangeID'] for change in recent}
+        self._gaps = {}
+        self._last_read = now
+        self._advance(now)
+        return True
+
+    def _advance(self, now):
+        """Note the new gaps, then move version past delivered IDs and expired gaps"""
+        highest = max(self._delivered, default=self.version)
+        for change_id in range(self.version + 1, highest):
+            if change_id not in self._delivered:
+                self._gaps.setdefault(change_id, now)
+        for change_id in self._delivered.intersection(self._gaps):
+            del self._gaps[change_id]
+
+        while True:
+            next_id = self.version + 1
+            if next_id in self._delivered:
+                self._delivered.remove(next_id)
+            elif next_id in self._gaps and now - self._gaps[next_id] >= CHANGE_GAP_GRACE_SECONDS:
+                del self._gaps[next_id]
+            else:
+                break
+            self.version = next_id
@@ -0,0 +1,183 @@
+import re
+import time
+from datetime import datetime
+
+from Models.Database import Database, get_shared_database
+from Models.ViolationModel import ViolationModel
+from Models.VehicleModel import VehicleModel
+from Controllers.Utility.DetectionReader import read_detections
+
+
+# Detections validated and inserted per transaction
+INGEST_CHUNK_SIZE = 5000
+
+# Accepted input field names (compared without case, spaces or underscores)
+DETECTION_FIELDS = {
+    'plate': ('plateno', 'platenodetected', 'plate', 'platenumber'),
+    'violation_type': ('violationtypeid', 'violationtype', 'violationname', 'type'),
+    'date': ('violationdate', 'date', 'timestamp', 'detectedat'),
+    'speed': ('speed',),
+    'location': ('location', 'camera', 'cameraid'),
+}
+
+_PLATE_SEPARATORS = re.compile(r'[\s\-]+')
+
+
+def normalize_plate(plate_no: str) -> str:
+    """Plate number as cameras and registrations are compared (ABC-123 == abc 123)"""
+    return _PLATE_SEPARATORS.sub('', str(plate_no)).upper()
+
+
+def _parse_date(value) -> datetime:
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    text = str(value).strip()
+    if text.endswith('Z'):
+        text = text[:-1]
+    return datetime.fromisoformat(text)
+
+
+class IngestionController:
+    """Bulk violation ingestion for camera/ANPR detection batches"""
+
+    def __init__(self, db: Database = None):
+        self.db = db or get_shared_database()
+        self.violation_model = ViolationModel(self.db)
+        self.vehicle_model = VehicleModel(self.db)
+        self._plates = None
+        self._plate_index = {}
+        self._types = {}
+
+    def ingest_file(self, path: str, file_format: str = None, chunk_size: int = INGEST_CHUNK_SIZE):
+        """Stream a CSV or JSONL detection file into the violations table (see ingest)"""
+        return self.ingest(read_detections(path, file_format), chunk_size)
+
+    def ingest(self, detections, chunk_size: int = INGEST_CHUNK_SIZE):
+        """
+        Validate and insert detections in chunked transactions
+
+        Args:
+            detections: (line number, record, error) tuples as yielded by
+                        read_detections
+            chunk_size: Detections per batch (one transaction each)
+
+        Returns:
+            dict: read, inserted, rejected, seconds, rows_per_second and
+                  batches - one dict per batch with first_line, last_line,
+                  read, inserted, errors ([{'line', 'error'}]) and failed
+                  (the database error if the whole batch was rolled back)
+        """
+        report = {'read': 0, 'inserted': 0, 'rejected': 0, 'batches': []}
+        start = time.perf_counter()
+        self._load_reference_data()
+
+        batch = []
+        for detection in detections:
+            batch.append(detection)
+            if len(batch) >= chunk_size:
+                self._ingest_batch(batch, report)
+                batch = []
+        if batch:
+            self._ingest_batch(batch, report)
+
+        report['seconds'] = time.perf_counter() - start
+        report['rows_per_second'] = report['inserted'] / report['seconds'] if report['seconds'] else 0.0
+        return report
+
+    def _load_reference_data(self):
+        """Refresh the plate index (only when the vehicles changed) and violation types"""
+        plates = self.vehicle_model.get_plate_numbers()
+        if plates is not self._plates:
+            self._plates = plates
+            self._plate_index = {normalize_plate(plate_no): vehicle_id for plate_no, vehicle_id in plates}
+
+        self._types = {}
+        for violation_type in self.violation_model.get_violation_types():
+            type_id = violation_type['ViolationTypeID']
+            self._types[type_id.lower()] = type_id
+            self._types[violation_type['ViolationName'].strip().lower()] = type_id
+
+    def _ingest_batch(self, batch: list, report: dict):
+        rows = []
+        errors = []
+        for line_no, record, error in batch:
+            if error is None:
+                try:
+                    rows.append(self._prepare(record))
+                except ValueError as e:
+                    error = str(e)
+            if error is not None:
+                errors.append({'line': line_no, 'error': error})
+
+        failed = None
+        if rows:
+            try:
+                violation_ids = self.db.id_allocator.next_ids('violations', len(rows))
+            except Exception as e:
+                failed = f"Could not reserve violation IDs: {str(e)}"
+            else:
+                rows = [(violation_id,) + row for violation_id, row in zip(violation_ids, rows)]
+                success, message = self.violation_model.add_violations_bulk(rows)
+                if not success:
+                    failed = message
+
+        inserted = len(rows) if failed is None else 0
+        report['read'] += len(batch)
+        report['inserted'] += inserted
+        report['rejected'] += len(batch) - inserted
+        report['batches'].append({
+            'first_line': batch[0][0],
+            'last_line': batch[-1][0],
+            'read': len(batch),
+            'inserted': inserted,
+            'errors': errors,
+            'failed': failed
+        })
+
+    def _prepare(self, record: dict) -> tuple:
+        """
+        Row for add_violations_bulk without its ViolationID
+
+        Raises:
+            ValueError: The detection is incomplete or does not resolve
+        """
+        fields = {}
+        for key, value in record.items():
+            if key is None or value is None or (isinstance(value, str) and not value.strip()):
+                continue
+            fields[str(key).replace('_', '').replace(' ', '').lower()] = value
+
+        def field(name, required=True):
+            for alias in DETECTION_FIELDS[name]:
+                if alias in fields:
+                    return fields[alias]
+            if required:
+                raise ValueError(f"Missing {name.replace('_', ' ')}")
+            return None
+
+        plate = str(field('plate')).strip()
+        vehicle_id = self._plate_index.get(normalize_plate(plate))
+        if vehicle_id is None:
+            raise ValueError(f"Unregistered plate: {plate}")
+
+        violation_type = str(field('violation_type')).strip()
+        violation_type_id = self._types.get(violation_type.lower())
+        if violation_type_id is None:
+            raise ValueError(f"Unknown violation type: {violation_type}")
+
+        date_value = field('date')
+        try:
+            violation_date = _parse_date(date_value)
+        except (TypeError, ValueError, OverflowError, OSError):
+            raise ValueError(f"Invalid date: {date_value}")
+
+        speed = field('speed', required=False)
+        if speed is not None:
+            try:
+                speed = round(float(speed), 2)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid speed: {speed}")
+
+        location = str(field('location', required=False) or '').strip()[:100]
+
+        return vehicle_id, violation_type_id, speed, location, violation_date, plate[:20]
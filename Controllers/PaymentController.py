@@ -1,4 +1,4 @@
-from Models.Database import Database
+from Models.Database import Database, get_shared_database
 from Models.PaymentModel import PaymentModel
 from Controllers.Utility.ValidationHelper import ValidationHelper
 
@@ -6,8 +6,8 @@ from Controllers.Utility.ValidationHelper import ValidationHelper
 class PaymentController:
     """Handles payment processing business logic"""
 
-    def __init__(self):
-        self.db = Database(host='localhost', database='RoadEyeDB', user='root', password='')
+    def __init__(self, db: Database = None):
+        self.db = db or get_shared_database()
         self.payment_model = PaymentModel(self.db)
 
     def validate_payment_form(self, form_data: dict) -> tuple:
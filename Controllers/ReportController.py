@@ -1,56 +1,277 @@
-from Models.Database import Database
+import os
+import tempfile
+from datetime import date, timedelta
+from itertools import chain
+
+from Models.Database import Database, get_shared_database
+from Models.ReportArtifacts import ReportArtifactStore
 from Models.ReportModel import ReportModel
 from Models.PaymentModel import PaymentModel
-from Controllers.Utility.PDFGenerator import PDFGenerator
+from Models.ViolationModel import ViolationModel
+
+
+# How far back the trend and revenue reports look at each granularity
+TREND_YEARS = 6
+TREND_WEEKS = 52
+TREND_DAYS = 90
+
+# Revenue analytics granularities prebuild_reports builds ahead of time
+PREBUILT_REVENUE_GRANULARITIES = ('day', 'month')
+
+
+def trend_period(granularity: str):
+    """
+    (start_date, end_date) the trend reports cover: the last TREND_YEARS
+    calendar years by month, TREND_WEEKS weeks by week or TREND_DAYS days
+    by day, up to and including today
+    """
+    today = date.today()
+    if granularity == 'month':
+        return date(today.year - TREND_YEARS + 1, 1, 1), date(today.year + 1, 1, 1)
+    if granularity == 'week':
+        return today - timedelta(weeks=TREND_WEEKS - 1, days=today.weekday()), today + timedelta(days=1)
+    return today - timedelta(days=TREND_DAYS - 1), today + timedelta(days=1)
 
 
 class ReportController:
     """Handles report generation business logic"""
 
-    def __init__(self):
-        self.db = Database(host='localhost', database='RoadEyeDB', user='root', password='')
+    def __init__(self, db: Database = None, artifacts: ReportArtifactStore = None):
+        self.db = db or get_shared_database()
+        self.artifacts = artifacts or ReportArtifactStore()
         self.report_model = ReportModel(self.db)
         self.payment_model = PaymentModel(self.db)
+        self.violation_model = ViolationModel(self.db)
+
+    # ---------- pre-built reports ----------
+    def _artifact_tag(self, *period):
+        """Tag of the reports built from the current data (and period); None if unknown"""
+        version = self.report_model.get_data_version()
+        if version is None:
+            return None
+        return '_'.join([version] + [f"{day:%Y%m%d}" for day in period])
 
+    def _snapshot(self, name: str, tag: str, load):
+        """
+        The stored snapshot of a report when tag is current, else load(),
+        which is stored unless a query failed while loading it
+        """
+        if tag is not None:
+            found, data = self.artifacts.load_snapshot(name, tag)
+            if found:
+                return data
+
+        failures = self.db.query_cache.failure_count()
+        data = load()
+        if tag is not None and self.db.query_cache.failure_count() == failures:
+            self.artifacts.save_snapshot(name, tag, data)
+        return data
+
+    def _export_pdf(self, name: str, tag: str, file_path: str, generate):
+        """
+        Write a report's PDF to file_path: a copy of the stored PDF when
+        tag is current, else generate(file_path), which is then stored
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        if tag is not None and self.artifacts.copy_pdf(name, tag, file_path):
+            return True, "PDF exported from the pre-built report"
+
+        success, message = generate(file_path)
+        if success and tag is not None:
+            self.artifacts.save_pdf(name, tag, file_path)
+        return success, message
+
+    def prebuild_reports(self, granularities: tuple = PREBUILT_REVENUE_GRANULARITIES):
+        """
+        Build the stored reports that are not current: the violations
+        report (data and PDF), the payment report and the revenue
+        analytics (data and PDF) at each granularity
+
+        Returns:
+            list: (report: str, success: bool, message: str) per artifact
+        """
+        tag = self._artifact_tag()
+        if tag is None:
+            return [("All reports", False, "Data version unavailable; nothing was built")]
+
+        # (report, artifact name, tag, get the data, export the PDF to a path or None)
+        reports = [
+            ("Violations report", 'violations', tag,
+             self.get_violations_report_data, self.export_violations_report_to_pdf),
+            ("Payment report", 'payments', tag, self.get_payment_report_data, None),
+        ]
+        for granularity in granularities:
+            reports.append((
+                f"Revenue analytics ({granularity})", f"revenue_{granularity}",
+                self._artifact_tag(*trend_period(granularity)),
+                lambda granularity=granularity: self.get_revenue_analytics(granularity),
+                lambda path, granularity=granularity: self.export_revenue_report_to_pdf(path, granularity)
+            ))
+
+        results = []
+        for report, name, artifact_tag, load, export in reports:
+            if artifact_tag is None:
+                results.append((report, False, "Data version unavailable"))
+                continue
+            if self.artifacts.has_snapshot(name, artifact_tag):
+                results.append((f"{report} data", True, "Up to date"))
+            else:
+                load()
+                built = self.artifacts.has_snapshot(name, artifact_tag)
+                results.append((f"{report} data", built, "Built" if built else "Not stored (see the log)"))
+
+            if export is None:
+                continue
+            if self.artifacts.has_pdf(name, artifact_tag):
+                results.append((f"{report} PDF", True, "Up to date"))
+                continue
+            # The export stores its own copy; the file it writes is only scratch
+            fd, path = tempfile.mkstemp(suffix='.pdf')
+            os.close(fd)
+            try:
+                success, message = export(path)
+            finally:
+                os.remove(path)
+            results.append((f"{report} PDF", success, message))
+        return results
+
+    # ---------- reports ----------
     def get_violations_report_data(self):
         """
         Get all violations data for report
 
+        Served from the pre-built snapshot while the data is unchanged.
+
         Returns:
             list: List of violation dictionaries
         """
-        return self.report_model.get_violations_report_data()
+        return self._snapshot('violations', self._artifact_tag(), self.report_model.get_violations_report_data)
 
-    def export_violations_report_to_pdf(self, file_path: str, violations_data: list):
+    def export_violations_report_to_pdf(self, file_path: str, violations_data: list = None,
+                                        progress=None):
         """
         Export violations report to PDF
 
         Args:
             file_path: Path where PDF will be saved
-            violations_data: List of violation dictionaries
+            violations_data: List of violation dictionaries; None exports the
+                             whole report: the pre-built PDF while the data is
+                             unchanged, else streamed from the database while
+                             the PDF is laid out
+            progress: Optional progress(rows_read, pages_rendered) callback
+                      (see PDFGenerator.generate_violations_report)
 
         Returns:
             tuple: (success: bool, message: str)
         """
-        if not violations_data:
-            return False, "No data to export"
+        if violations_data is not None:
+            # Imported here so reportlab only loads once a report is exported
+            from Controllers.Utility.PDFGenerator import PDFGenerator
 
-        return PDFGenerator.generate_violations_report(file_path, violations_data)
+            if not violations_data:
+                return False, "No data to export"
+            return PDFGenerator.generate_violations_report(file_path, violations_data, progress)
+
+        return self._export_pdf(
+            'violations', self._artifact_tag(), file_path,
+            lambda path: self._stream_violations_report_to_pdf(path, progress)
+        )
+
+    def _stream_violations_report_to_pdf(self, file_path: str, progress=None):
+        from Controllers.Utility.PDFGenerator import PDFGenerator
+
+        rows = self.report_model.iter_violations_report_data()
+        try:
+            first = next(rows, None)
+            if first is None:
+                return False, "No data to export"
+            return PDFGenerator.generate_violations_report(file_path, chain([first], rows), progress)
+        except Exception as e:
+            return False, f"Report data error: {str(e)}"
+        finally:
+            # Hands the connection back even if the export stopped part-way
+            rows.close()
+
+    def get_violation_trend(self, granularity: str = 'month'):
+        """
+        Violation counts per violation type over the trend report's period
+
+        Args:
+            granularity: 'day', 'week' or 'month' (see trend_period)
+
+        Returns:
+            dict: The ViolationModel.get_violation_time_series result plus
+                  type_names (ViolationTypeID -> ViolationName)
+        """
+        start_date, end_date = trend_period(granularity)
+        series = self.violation_model.get_violation_time_series(
+            start_date, end_date, granularity, by_type=True
+        )
+        type_names = {
+            violation_type['ViolationTypeID']: violation_type['ViolationName']
+            for violation_type in self.violation_model.get_violation_types()
+        }
+        # The series is shared through the query cache; extend a copy
+        return dict(series, type_names=type_names)
+
+    def get_revenue_analytics(self, granularity: str = 'month'):
+        """
+        Revenue by period and payment type, collection rate and days-to-pay
+
+        Args:
+            granularity: 'day', 'week' or 'month' (see trend_period)
+
+        Returns:
+            dict or None: See ReportModel.get_revenue_analytics (served
+                          from the pre-built snapshot while the data is
+                          unchanged)
+        """
+        start_date, end_date = trend_period(granularity)
+        return self._snapshot(
+            f"revenue_{granularity}", self._artifact_tag(start_date, end_date),
+            lambda: self.report_model.get_revenue_analytics(start_date, end_date, granularity)
+        )
+
+    def export_revenue_report_to_pdf(self, file_path: str, granularity: str = 'month'):
+        """
+        Export the revenue analytics to PDF
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        def generate(path):
+            # Imported here so reportlab only loads once a report is exported
+            from Controllers.Utility.PDFGenerator import PDFGenerator
+
+            analytics = self.get_revenue_analytics(granularity)
+            if analytics is None:
+                return False, "Could not load the revenue analytics"
+            return PDFGenerator.generate_revenue_report(path, analytics)
+
+        start_date, end_date = trend_period(granularity)
+        return self._export_pdf(
+            f"revenue_{granularity}", self._artifact_tag(start_date, end_date), file_path, generate
+        )
 
     def get_payment_report_data(self):
         """
         Get payment report data and statistics
 
+        Served from the pre-built snapshot while the data is unchanged.
+
         Returns:
             tuple: (statistics_dict, recent_payments_list)
         """
-        # Get statistics
-        stats = self.report_model.get_payment_report_statistics()
-
-        # Get recent payments
-        recent_payments = self.payment_model.get_all_payment_history(limit=10)
+        def load():
+            return {
+                'statistics': self.report_model.get_payment_report_statistics(),
+                'recent_payments': self.payment_model.get_all_payment_history(limit=10)
+            }
 
-        return stats, recent_payments
+        report = self._snapshot('payments', self._artifact_tag(), load)
+        return report['statistics'], report['recent_payments']
 
     def calculate_report_statistics(self, violations: list):
         """
@@ -1,16 +1,29 @@
-from Models.Database import Database
+from Models.Database import Database, get_shared_database
 from Models.ViolationModel import ViolationModel
 from Models.PaymentModel import PaymentModel
+from Controllers.Utility.SearchIndex import SearchIndex
+
+
+# Resident pages that list (and search) the resident's violations
+VIOLATION_PAGES = ('violations', 'history')
 
 
 class ResidentController:
     """Handles resident dashboard business logic"""
 
-    def __init__(self, user_data: dict):
+    def __init__(self, user_data: dict, db: Database = None):
         self.user_data = user_data
-        self.db = Database(host='localhost', database='RoadEyeDB', user='root', password='')
+        self.db = db or get_shared_database()
         self.violation_model = ViolationModel(self.db)
         self.payment_model = PaymentModel(self.db)
+        # One index per page, so switching pages does not rebuild a shared one
+        self.violation_indexes = {
+            page: SearchIndex(
+                ['violation_id', 'plate_no', 'violation_type'],
+                facets={'status': 'status', 'year': lambda v: str(v.get('date', ''))[:4]}
+            )
+            for page in VIOLATION_PAGES
+        }
 
     def get_dashboard_stats(self):
         """Get statistics for resident dashboard"""
@@ -34,12 +47,41 @@ class ResidentController:
         resident_id = self.user_data['ResidentID']
         return self.violation_model.get_user_violations(resident_id)
 
+    def get_violations_by_ids(self, violation_ids):
+        """Get current rows for changed violations, keeping only this resident's"""
+        resident_id = self.user_data['ResidentID']
+        return self.violation_model.get_user_violations(resident_id, tuple(sorted(violation_ids)))
+
     def get_payment_history(self):
         """Get payment history for resident"""
         resident_id = self.user_data['ResidentID']
         return self.payment_model.get_payment_history(resident_id)
 
-    def filter_violations(self, violations: list, search_text: str, status_filter: str):
+    def find_violations(self, violations: list, search_text: str, status_filter: str = "All",
+                        year: str = None, page: str = 'violations'):
+        """
+        Row ids of violations matching the search text and facets
+
+        Args:
+            violations: List of all violations
+            search_text: Search query (violation ID, plate or type)
+            status_filter: Status filter ("All", "Paid", "Unpaid")
+            year: Year filter ("All Years"/None or YYYY)
+            page: Page whose list this is (one of VIOLATION_PAGES)
+
+        Returns:
+            set or None: Positions in violations, None when nothing is filtered
+        """
+        violation_index = self.violation_indexes[page]
+        violation_index.ensure(violations)
+        return violation_index.search(
+            search_text,
+            status=None if status_filter == "All" else status_filter,
+            year=None if not year or year == "All Years" else year
+        )
+
+    def filter_violations(self, violations: list, search_text: str, status_filter: str,
+                          year: str = None, page: str = 'violations'):
         """
         Filter violations based on search and status
 
@@ -47,25 +89,11 @@ class ResidentController:
             violations: List of all violations
             search_text: Search query
             status_filter: Status filter ("All", "Paid", "Unpaid")
+            year: Optional year filter ("All Years" or YYYY)
+            page: Page whose list this is (one of VIOLATION_PAGES)
 
         Returns:
             Filtered list of violations
         """
-        filtered = []
-        search_lower = search_text.lower()
-
-        for violation in violations:
-            # Status filter
-            if status_filter != "All" and violation['status'] != status_filter:
-                continue
-
-            # Search filter
-            if search_text:
-                if (search_lower not in violation['violation_id'].lower() and
-                        search_lower not in violation['plate_no'].lower() and
-                        search_lower not in violation['violation_type'].lower()):
-                    continue
-
-            filtered.append(violation)
-
-        return filtered
\ No newline at end of file
+        row_ids = self.find_violations(violations, search_text, status_filter, year, page)
+        return self.violation_indexes[page].select(row_ids)
\ No newline at end of file
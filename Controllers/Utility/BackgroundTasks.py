@@ -0,0 +1,395 @@
+"""
+Utility/BackgroundTasks.py
+Runs work on QThreadPool workers and hands results back to the GUI thread
+"""
+import time
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from Models.Database import DEFAULT_DATABASE_CONFIG
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class BackgroundTask(QRunnable):
+    """
+    Calls fn(*args) on a pool thread
+
+    The signals object is created on the GUI thread, so slots of GUI
+    objects connected to finished(result) / failed(message) run there.
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        # Lifetime is managed from Python so a finished task can still be cancelled/compared
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.cancelled = False
+        self.signals = _TaskSignals()
+
+    def cancel(self):
+        """Skip the task if it has not started; drop its result if it has"""
+        self.cancelled = True
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            print(f"Background task error: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        if not self.cancelled:
+            self.signals.finished.emit(result)
+
+
+class JobCancelled(Exception):
+    """Raised by BackgroundJob.report once the job has been cancelled"""
+
+
+class _JobSignals(QObject):
+    started = pyqtSignal()
+    progress = pyqtSignal(dict)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class BackgroundJob(QRunnable):
+    """
+    Calls fn(job, *args) on a pool thread for work that takes a while
+
+    fn calls job.report(**counters) as it goes: the counters are emitted
+    as progress(dict), at most every PROGRESS_INTERVAL seconds, and once
+    cancel() has been called report raises JobCancelled so fn stops at its
+    next checkpoint. The job ends with exactly one of finished(result),
+    failed(message) or cancelled().
+    """
+
+    PROGRESS_INTERVAL = 0.2
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.cancelled = False
+        self.signals = _JobSignals()
+        self._last_report = 0.0
+
+    def cancel(self):
+        self.cancelled = True
+
+    def report(self, **counters):
+        """Publish progress; raises JobCancelled if the job was cancelled"""
+        if self.cancelled:
+            raise JobCancelled()
+        now = time.monotonic()
+        if now - self._last_report >= self.PROGRESS_INTERVAL:
+            self._last_report = now
+            self.signals.progress.emit(counters)
+
+    def run(self):
+        if self.cancelled:
+            self.signals.cancelled.emit()
+            return
+        self.signals.started.emit()
+        try:
+            result = self.fn(self, *self.args)
+        except JobCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            print(f"Background job error: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        if self.cancelled:
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(result)
+
+
+# Every worker may hold a pooled database connection at the same time
+SEARCH_THREADS = 1  # one: searches share SearchIndex objects
+JOB_THREADS = 1
+# Connections left over for the GUI thread's own queries
+GUI_CONNECTIONS = 1
+
+
+def load_threads_for(pool_size: int) -> int:
+    """Load workers that fit in pool_size connections beside the other workers and the GUI thread"""
+    return max(1, pool_size - SEARCH_THREADS - JOB_THREADS - GUI_CONNECTIONS)
+
+
+_load_threads = load_threads_for(DEFAULT_DATABASE_CONFIG['pool_size'])
+_search_pool = None
+_load_pool = None
+_job_pool = None
+
+
+def search_pool() -> QThreadPool:
+    """Single worker shared by all searches, so a SearchIndex is never used concurrently"""
+    global _search_pool
+    if _search_pool is None:
+        _search_pool = QThreadPool()
+        _search_pool.setMaxThreadCount(SEARCH_THREADS)
+    return _search_pool
+
+
+def load_pool() -> QThreadPool:
+    """Workers for independent data loads (one pooled connection each)"""
+    global _load_pool
+    if _load_pool is None:
+        _load_pool = QThreadPool()
+        _load_pool.setMaxThreadCount(_load_threads)
+    return _load_pool
+
+
+def configure_thread_pools(pool_size: int):
+    """Size the load pool for a database connection pool of pool_size"""
+    global _load_threads
+    _load_threads = load_threads_for(pool_size)
+    if _load_pool is not None:
+        _load_pool.setMaxThreadCount(_load_threads)
+
+
+def job_pool() -> QThreadPool:
+    """Worker for long jobs such as report exports, so they queue instead of piling up"""
+    global _job_pool
+    if _job_pool is None:
+        _job_pool = QThreadPool()
+        _job_pool.setMaxThreadCount(JOB_THREADS)
+    return _job_pool
+
+
+class DataLoader(QObject):
+    """
+    Runs independent data loads concurrently
+
+    load(fetch, deliver, *args) runs fetch(*args) on the load pool and
+    calls deliver(result) on the GUI thread as soon as that result
+    arrives, whatever order the loads finish in. A failed load is
+    printed and its deliver is never called; failed(message) is called
+    instead if given.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = []  # (task, deliver, failed)
+
+    def load(self, fetch, deliver, *args, failed=None):
+        task = BackgroundTask(fetch, *args)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        self._pending.append((task, deliver, failed))
+        load_pool().start(task)
+
+    def cancel(self):
+        """Drop every load that has not delivered yet"""
+        for task, _, _ in self._pending:
+            task.cancel()
+            load_pool().tryTake(task)
+        self._pending = []
+
+    def _take(self, signals):
+        for entry in self._pending:
+            if entry[0].signals is signals:
+                self._pending.remove(entry)
+                return entry
+        return None
+
+    def _on_finished(self, result):
+        entry = self._take(self.sender())
+        if entry is not None:
+            entry[1](result)
+
+    def _on_failed(self, message: str):
+        entry = self._take(self.sender())
+        if entry is not None and entry[2] is not None:
+            entry[2](message)
+
+
+class DebouncedSearch(QObject):
+    """
+    Search pipeline for a search box
+
+    request(*args) restarts a short debounce timer; when it fires,
+    search(*args) runs on the search worker and its result is passed to
+    deliver(result) on the GUI thread. Only the latest request is
+    delivered: a superseded task still waiting in the pool is taken back,
+    and the result of one already running is dropped.
+
+    Arguments are captured when the request is made, so search() never
+    reads widgets from the worker thread.
+    """
+
+    DEFAULT_DELAY_MS = 250
+
+    def __init__(self, search, deliver, delay_ms: int = DEFAULT_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.search = search
+        self.deliver = deliver
+        self._args = ()
+        self._task = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._start)
+
+    def request(self, *args):
+        """Search after the user stops typing for the debounce delay"""
+        self._args = args
+        self._timer.start()
+
+    def request_now(self, *args):
+        """Search without waiting (filter combo boxes, refreshes)"""
+        self._args = args
+        self._timer.stop()
+        self._start()
+
+    def cancel(self):
+        self._timer.stop()
+        self._cancel_task()
+
+    def is_pending(self) -> bool:
+        """True while a requested result has not been delivered yet"""
+        return self._timer.isActive() or self._task is not None
+
+    def _start(self):
+        self._cancel_task()
+        task = BackgroundTask(self.search, *self._args)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        self._task = task
+        search_pool().start(task)
+
+    def _cancel_task(self):
+        if self._task is not None:
+            self._task.cancel()
+            search_pool().tryTake(self._task)
+            self._task = None
+
+    def _is_current(self) -> bool:
+        return self._task is not None and self.sender() is self._task.signals
+
+    def _on_finished(self, result):
+        if not self._is_current():
+            return
+        self._task = None
+        self.deliver(result)
+
+    def _on_failed(self, message: str):
+        if self._is_current():
+            self._task = None
+
+
+class PeriodicTask(QObject):
+    """
+    Runs fetch() on the load pool every interval_ms and passes the result
+    to deliver(result) on the GUI thread
+
+    Runs never overlap: run_now() while a run is in flight schedules one
+    more run right after it instead.
+    """
+
+    def __init__(self, fetch, deliver, interval_ms: int, parent=None):
+        super().__init__(parent)
+        self.fetch = fetch
+        self.deliver = deliver
+        self._task = None
+        self._run_again = False
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.run_now)
+
+    def start(self):
+        self._timer.start()
+        self.run_now()
+
+    def stop(self):
+        self._timer.stop()
+        self._run_again = False
+
+    def run_now(self):
+        if self._task is not None:
+            self._run_again = True
+            return
+        task = BackgroundTask(self.fetch)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_done)
+        self._task = task
+        load_pool().start(task)
+
+    def _on_finished(self, result):
+        self.deliver(result)
+        self._on_done()
+
+    def _on_done(self, *args):
+        self._task = None
+        if self._run_again:
+            self._run_again = False
+            self.run_now()
+
+
+class JobQueue(QObject):
+    """
+    Long jobs (report exports) run one after another in submission order
+
+    submit(fn, *args) queues fn(job, *args) (see BackgroundJob) on the job
+    worker and returns an id. The queue's signals carry that id, all on
+    the GUI thread: started(id), progress(id, counters), then exactly one
+    of finished(id, result), failed(id, message) or cancelled(id).
+    """
+
+    started = pyqtSignal(int)
+    progress = pyqtSignal(int, dict)
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+    cancelled = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = {}  # id -> BackgroundJob, until it ends
+        self._next_id = 1
+
+    def submit(self, fn, *args) -> int:
+        job_id = self._next_id
+        self._next_id += 1
+
+        job = BackgroundJob(fn, *args)
+        job.signals.started.connect(lambda: self.started.emit(job_id))
+        job.signals.progress.connect(lambda counters: self.progress.emit(job_id, counters))
+        job.signals.finished.connect(lambda result: self._end(job_id, self.finished, result))
+        job.signals.failed.connect(lambda message: self._end(job_id, self.failed, message))
+        job.signals.cancelled.connect(lambda: self._end(job_id, self.cancelled))
+        self._jobs[job_id] = job
+        job_pool().start(job)
+        return job_id
+
+    def cancel(self, job_id: int):
+        """Drop a queued job, or make a running one stop at its next progress report"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job.cancel()
+        if job_pool().tryTake(job):
+            self._end(job_id, self.cancelled)
+
+    def cancel_all(self):
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+
+    def pending(self) -> int:
+        """Jobs queued or running"""
+        return len(self._jobs)
+
+    def _end(self, job_id: int, signal, *args):
+        if self._jobs.pop(job_id, None) is not None:
+            signal.emit(job_id, *args)
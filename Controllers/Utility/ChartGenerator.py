@@ -3,57 +3,65 @@ Utility/ChartGenerator.py
 Chart generation utilities
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
+from collections import OrderedDict
+
 from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator, PercentFormatter
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 
 
-class ChartGenerator:
-    """Helper class for generating charts"""
+# Rendered frames kept per chart, least recently shown dropped first
+CHART_FRAME_CACHE_SIZE = 12
 
-    @staticmethod
-    def create_monthly_violations_chart(
-            monthly_data: dict,
-            title: str = "Monthly Violations Overview"
-    ):
-        # Create DataFrame
-        df = pd.DataFrame(
-            list(monthly_data.items()),
-            columns=["Month", "Violations"]
-        )
+# Line colors for the per-type series of the trend chart (the total is gold)
+TREND_TYPE_COLORS = ["#2196f3", "#4caf50", "#f44336", "#ff9800", "#9c27b0",
+                     "#00bcd4", "#8bc34a", "#e91e63", "#795548", "#9e9e9e"]
+
+# Bucket label format per time series granularity
+TREND_LABEL_FORMATS = {'day': "%d %b", 'week': "%d %b %Y", 'month': "%b %Y"}
+
+
+class MonthlyViolationsChart(FigureCanvas):
+    """
+    Monthly violations bar chart that keeps one Figure and updates in place
+
+    The axes, grid and labels are drawn once; set_data only moves the bar
+    heights and value labels and blits them over the cached background.
+    Every rendered frame is cached under the key it was shown for (such
+    as ('admin', 2024)), so switching back to a year already seen is a
+    single restore_region. A new y-axis scale or a resize falls back to a
+    full draw, which refreshes the caches.
+    """
 
+    def __init__(self, title: str = "Monthly Violations Overview"):
         # Create matplotlib figure (slightly taller)
         fig = Figure(figsize=(12, 6.5), facecolor="#363636")
-        ax = fig.add_subplot(111)
+        super().__init__(fig)
+        self.ax = fig.add_subplot(111)
 
-        # Background colors
-        ax.set_facecolor("#363636")
-        fig.patch.set_facecolor("#363636")
+        self._months = ()
+        self._bars = []
+        self._value_labels = []
+        self._key = None
+        self._values = None
+        self._backgrounds = {}  # y-axis top -> figure without the bars
+        self._frames = OrderedDict()  # (key, values) -> rendered figure
+        self._cache_size = None
 
-        # Bar chart
-        bars = ax.bar(
-            df["Month"],
-            df["Violations"],
-            color="#e8bb41",
-            edgecolor="#d4a838",
-            linewidth=1.5
+        self._style_axes(title)
+        self.mpl_connect('draw_event', self._on_draw)
+
+        self.setStyleSheet(
+            "background-color: #363636; border-radius: 12px;"
         )
 
-        # Value labels
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(
-                    bar.get_x() + bar.get_width() / 2,
-                    height,
-                    str(int(height)),
-                    ha="center",
-                    va="bottom",
-                    color="#ffffff",
-                    fontweight="bold",
-                    fontsize=10
-                )
+    def _style_axes(self, title: str):
+        ax = self.ax
+        fig = self.figure
+
+        # Background colors
+        ax.set_facecolor("#363636")
+        fig.patch.set_facecolor("#363636")
 
         # Labels and title
         ax.set_xlabel(
@@ -80,7 +88,8 @@ class ChartGenerator:
             )
         # Ticks and spines
         ax.tick_params(colors="#ffffff", labelsize=11)
-        plt.setp(ax.get_xticklabels(), rotation=0)
+        for label in ax.get_xticklabels():
+            label.set_rotation(0)
 
         for spine in ax.spines.values():
             spine.set_color("#5a5a5a")
@@ -102,23 +111,284 @@ class ChartGenerator:
         top=0.88,
         bottom=0.22)
 
-        # Canvas for PyQt6
+    def _create_bars(self, months: tuple):
+        """Bars and value labels, animated so full draws leave them to _draw_bars"""
+        for artist in self._bars + self._value_labels:
+            artist.remove()
+
+        positions = range(len(months))
+        self._bars = list(self.ax.bar(
+            positions,
+            [0] * len(months),
+            color="#e8bb41",
+            edgecolor="#d4a838",
+            linewidth=1.5,
+            animated=True
+        ))
+        self._value_labels = [
+            self.ax.text(
+                position,
+                0,
+                "",
+                ha="center",
+                va="bottom",
+                color="#ffffff",
+                fontweight="bold",
+                fontsize=10,
+                animated=True,
+                visible=False
+            )
+            for position in positions
+        ]
+        self.ax.set_xticks(list(positions), list(months))
+        self._months = months
+        self._backgrounds.clear()
+        self._frames.clear()
+
+    @staticmethod
+    def _y_top(values: tuple) -> float:
+        """Y-axis top rounded to a tick, so years with similar peaks share a background"""
+        peak = max(values, default=0) * 1.05
+        return float(MaxNLocator(nbins=8, integer=True).tick_values(0, peak or 1)[-1])
+
+    def set_data(self, monthly_data: dict, key=None):
+        """
+        Show month -> violation count data
+
+        Args:
+            monthly_data: Month name -> count, in display order
+            key: What the data is for (e.g. ('admin', year)); frames are
+                 cached per key and can be brought back with show_cached
+        """
+        months = tuple(monthly_data)
+        values = tuple(int(count) for count in monthly_data.values())
+        if months != self._months:
+            self._create_bars(months)
+
+        self._key = key
+        self._values = values
+        for bar, label, height in zip(self._bars, self._value_labels, values):
+            bar.set_height(height)
+            label.set_y(height)
+            label.set_text(str(height))
+            label.set_visible(height > 0)
+
+        y_top = self._y_top(values)
+        self.ax.set_ylim(0, y_top)
+        self._check_cache_size()
+
+        frame = self._frames.get((key, values))
+        if frame is not None:
+            self._frames.move_to_end((key, values))
+            self._show_frame(frame)
+            return
+
+        background = self._backgrounds.get(y_top)
+        if background is None:
+            # Tick labels change with the scale; _on_draw renders the bars
+            self.draw()
+            return
+
+        self.restore_region(background)
+        self._draw_bars()
+        self._cache_frame()
+        self.blit(self.figure.bbox)
+
+    def show_cached(self, key) -> bool:
+        """Show the last frame rendered for key, if any (e.g. while its data reloads)"""
+        self._check_cache_size()
+        for (frame_key, values), frame in reversed(self._frames.items()):
+            if frame_key == key:
+                if key != self._key or values != self._values:
+                    self.set_data(dict(zip(self._months, values)), key)
+                return True
+        return False
+
+    def _show_frame(self, frame):
+        self.restore_region(frame)
+        self.blit(self.figure.bbox)
+
+    def _on_draw(self, event):
+        """Full draws (first show, resize, new scale) exclude the bars: cache, then add them"""
+        self._check_cache_size()
+        self._backgrounds[self.ax.get_ylim()[1]] = self.copy_from_bbox(self.figure.bbox)
+        self._draw_bars()
+        if self._values is not None:
+            self._cache_frame()
+
+    def _draw_bars(self):
+        for artist in self._bars + self._value_labels:
+            self.ax.draw_artist(artist)
+
+    def _cache_frame(self):
+        self._frames[(self._key, self._values)] = self.copy_from_bbox(self.figure.bbox)
+        self._frames.move_to_end((self._key, self._values))
+        while len(self._frames) > CHART_FRAME_CACHE_SIZE:
+            self._frames.popitem(last=False)
+
+    def _check_cache_size(self):
+        """Cached regions are only valid for the canvas size they were taken at"""
+        size = tuple(self.figure.bbox.size)
+        if size != self._cache_size:
+            self._cache_size = size
+            self._backgrounds.clear()
+            self._frames.clear()
+
+
+class ChartGenerator:
+    """Helper class for generating charts"""
+
+    @staticmethod
+    def create_monthly_violations_chart(
+            monthly_data: dict = None,
+            title: str = "Monthly Violations Overview"
+    ):
+        """Chart widget (see MonthlyViolationsChart), showing monthly_data if given"""
+        chart = MonthlyViolationsChart(title)
+        if monthly_data is not None:
+            chart.set_data(monthly_data)
+        return chart
+
+    @staticmethod
+    def create_violation_trend_chart(series: dict):
+        """
+        Line chart of a violation time series: the total and, when the
+        series has by_type, one line per violation type
+
+        Args:
+            series: ViolationModel.get_violation_time_series result, with
+                    optional type_names (ViolationTypeID -> name)
+        """
+        fig = Figure(figsize=(12, 6.5), facecolor="#363636")
+        ax = fig.add_subplot(111)
+        ax.set_facecolor("#363636")
+
+        positions = range(len(series['buckets']))
+        type_names = series.get('type_names', {})
+        by_type = sorted(series.get('by_type', {}).items(), key=lambda item: -sum(item[1]))
+        for (type_id, counts), color in zip(by_type, TREND_TYPE_COLORS):
+            ax.plot(positions, counts, color=color, linewidth=1.2,
+                    label=type_names.get(type_id, type_id))
+        ax.plot(positions, series['counts'], color="#e8bb41", linewidth=2.5, label="All violations")
+
+        label_format = TREND_LABEL_FORMATS[series['granularity']]
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=12, integer=True))
+        ax.xaxis.set_major_formatter(
+            lambda x, pos: series['buckets'][int(x)].strftime(label_format)
+            if 0 <= int(x) < len(series['buckets']) else ""
+        )
+        ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.set_ylim(bottom=0)
+
+        ax.set_ylabel(
+            "Number of Violations",
+            color="#ffffff",
+            fontsize=13,
+            fontweight="bold",
+            labelpad=14
+        )
+        ax.tick_params(colors="#ffffff", labelsize=10)
+        for spine in ax.spines.values():
+            spine.set_color("#5a5a5a")
+        ax.grid(True, alpha=0.2, color="#ffffff", linestyle="--", linewidth=0.5)
+        ax.set_axisbelow(True)
+
+        # Legend in a row above the plot, clear of the lines
+        legend = ax.legend(loc="lower left", bbox_to_anchor=(0, 1.01), ncol=min(len(by_type) + 1, 6),
+                           fontsize=9, facecolor="#2a2a2a", edgecolor="#5a5a5a")
+        for text in legend.get_texts():
+            text.set_color("#ffffff")
+
+        fig.subplots_adjust(left=0.07, right=0.98, top=0.9, bottom=0.12)
+
         canvas = FigureCanvas(fig)
         canvas.setStyleSheet(
             "background-color: #363636; border-radius: 12px;"
         )
+        return canvas
+
+    @staticmethod
+    def create_revenue_chart(analytics: dict):
+        """
+        Revenue analytics chart: revenue per period stacked by payment type
+        with the collection rate on a second axis, and the days-to-pay
+        histogram beside it
+
+        Args:
+            analytics: ReportModel.get_revenue_analytics result
+        """
+        fig = Figure(figsize=(12, 6.5), facecolor="#363636")
+        grid = fig.add_gridspec(1, 2, width_ratios=[3, 1], wspace=0.28)
+        revenue_ax = fig.add_subplot(grid[0])
+        histogram_ax = fig.add_subplot(grid[1])
+        rate_ax = revenue_ax.twinx()
+
+        buckets = analytics['buckets']
+        positions = range(len(buckets))
+        bottom = [0.0] * len(buckets)
+        by_type = sorted(analytics['revenue_by_type'].items(), key=lambda item: -sum(item[1]))
+        for (payment_type, revenue), color in zip(by_type, TREND_TYPE_COLORS):
+            revenue_ax.bar(positions, revenue, bottom=bottom, color=color, width=0.8, label=payment_type)
+            bottom = [base + value for base, value in zip(bottom, revenue)]
 
+        # Gaps where nothing was issued in a period
+        rate = [value if value is not None else float('nan') for value in analytics['collection_rate']]
+        rate_ax.plot(positions, rate, color="#e8bb41", linewidth=2.0, marker="o", markersize=3,
+                     label="Collection rate")
+        rate_ax.set_ylim(0, 1.05)
+        rate_ax.yaxis.set_major_formatter(PercentFormatter(1.0))
+
+        label_format = TREND_LABEL_FORMATS[analytics['granularity']]
+        revenue_ax.xaxis.set_major_locator(MaxNLocator(nbins=10, integer=True))
+        revenue_ax.xaxis.set_major_formatter(
+            lambda x, pos: buckets[int(x)].strftime(label_format) if 0 <= int(x) < len(buckets) else ""
+        )
+        revenue_ax.yaxis.set_major_formatter(lambda y, pos: f"₱{y:,.0f}")
+        revenue_ax.set_ylabel("Revenue", color="#ffffff", fontsize=12, fontweight="bold", labelpad=10)
+
+        labels = analytics['days_to_pay_bins']
+        histogram_ax.barh(range(len(labels)), analytics['days_to_pay_histogram'],
+                          color="#e8bb41", edgecolor="#d4a838")
+        histogram_ax.set_yticks(range(len(labels)), labels)
+        histogram_ax.invert_yaxis()
+        histogram_ax.xaxis.set_major_locator(MaxNLocator(nbins=4, integer=True))
+        histogram_ax.set_title("Days to pay", color="#ffffff", fontsize=12, fontweight="bold")
+
+        for ax in (revenue_ax, rate_ax, histogram_ax):
+            ax.set_facecolor("#363636")
+            ax.tick_params(colors="#ffffff", labelsize=9)
+            for spine in ax.spines.values():
+                spine.set_color("#5a5a5a")
+        for ax in (revenue_ax, histogram_ax):
+            ax.grid(True, alpha=0.2, color="#ffffff", linestyle="--", linewidth=0.5)
+            ax.set_axisbelow(True)
+
+        # One legend for the bars and the rate line, in a row above the plot
+        handles, names = revenue_ax.get_legend_handles_labels()
+        rate_handles, rate_names = rate_ax.get_legend_handles_labels()
+        legend = revenue_ax.legend(handles + rate_handles, names + rate_names, loc="lower left",
+                                   bbox_to_anchor=(0, 1.01), ncol=min(len(names) + 1, 6),
+                                   fontsize=9, facecolor="#2a2a2a", edgecolor="#5a5a5a")
+        for text in legend.get_texts():
+            text.set_color("#ffffff")
+
+        fig.subplots_adjust(left=0.08, right=0.98, top=0.9, bottom=0.1)
+
+        canvas = FigureCanvas(fig)
+        canvas.setStyleSheet(
+            "background-color: #363636; border-radius: 12px;"
+        )
         return canvas
 
     @staticmethod
-    def create_admin_dashboard_chart(monthly_data: dict):
+    def create_admin_dashboard_chart(monthly_data: dict = None):
         return ChartGenerator.create_monthly_violations_chart(
             monthly_data,
             title=""
         )
 
     @staticmethod
-    def create_resident_dashboard_chart(monthly_data: dict):
+    def create_resident_dashboard_chart(monthly_data: dict = None):
         return ChartGenerator.create_monthly_violations_chart(
             monthly_data,
             title=""
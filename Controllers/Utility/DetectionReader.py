@@ -0,0 +1,54 @@
+"""
+Utility/DetectionReader.py
+Streaming reader for camera/ANPR detection files (CSV or JSON Lines)
+"""
+import csv
+import json
+import os
+
+
+DETECTION_FORMATS = ('csv', 'jsonl')
+
+
+def detection_format(path: str) -> str:
+    """Guess the file format from its extension (.jsonl/.ndjson/.json, else CSV)"""
+    extension = os.path.splitext(path)[1].lower()
+    return 'jsonl' if extension in ('.jsonl', '.ndjson', '.json') else 'csv'
+
+
+def read_detections(path: str, file_format: str = None):
+    """
+    Yield one (line number, record, error) per detection without loading the file
+
+    record is a dict of the row's fields (None if it could not be parsed),
+    error is None or a message saying why the line is unreadable. Blank
+    lines are skipped.
+    """
+    file_format = file_format or detection_format(path)
+    if file_format not in DETECTION_FORMATS:
+        raise ValueError(f"Unsupported detection format: {file_format}")
+
+    with open(path, newline='', encoding='utf-8-sig') as handle:
+        if file_format == 'csv':
+            reader = csv.DictReader(handle)
+            for record in reader:
+                if not any(record.values()):
+                    continue
+                if None in record:
+                    yield reader.line_num, None, "Too many fields"
+                else:
+                    yield reader.line_num, record, None
+            return
+
+        for line_no, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_no, None, f"Invalid JSON: {e}"
+                continue
+            if isinstance(record, dict):
+                yield line_no, record, None
+            else:
+                yield line_no, None, "Expected a JSON object"
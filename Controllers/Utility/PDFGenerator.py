@@ -2,13 +2,18 @@
 Utility/PDFGenerator.py
 PDF report generation utilities with SAFE pie chart (with fallback)
 """
+import zlib
 from datetime import datetime
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import (
+    SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Flowable
+)
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfdoc import PDFArray, PDFDictionary, PDFName, PDFStream
 
 # Try to import chart libraries - if they fail, we'll use text-based fallback
 CHARTS_AVAILABLE = True
@@ -112,39 +117,10 @@ class PDFGenerator:
         return visual_table
 
     @staticmethod
-    def generate_violations_report(file_path: str, violations: list):
-        """
-        Generate PDF report for violations with SAFE pie chart
-
-        Args:
-            file_path: Path where PDF will be saved
-            violations: List of violation dictionaries
-        """
-        try:
-            # Calculate statistics
-            total_violations = len(violations)
-            paid_count = sum(1 for v in violations if v['PaymentStatus'] == 'PAID')
-            unpaid_count = total_violations - paid_count
-            total_revenue = sum(float(v['FineAmount']) for v in violations if v['PaymentStatus'] == 'PAID')
-            pending_revenue = sum(float(v['FineAmount']) for v in violations if v['PaymentStatus'] != 'PAID')
-
-            # Create PDF document in landscape mode
-            doc = SimpleDocTemplate(
-                file_path,
-                pagesize=landscape(A4),
-                rightMargin=30,
-                leftMargin=30,
-                topMargin=30,
-                bottomMargin=30
-            )
-
-            # Container for PDF elements
-            elements = []
-
-            # Define styles
-            styles = getSampleStyleSheet()
-
-            title_style = ParagraphStyle(
+    def _report_styles():
+        styles = getSampleStyleSheet()
+        return {
+            'title': ParagraphStyle(
                 'CustomTitle',
                 parent=styles['Heading1'],
                 fontSize=24,
@@ -152,9 +128,8 @@ class PDFGenerator:
                 spaceAfter=20,
                 alignment=TA_CENTER,
                 fontName='Helvetica-Bold'
-            )
-
-            heading_style = ParagraphStyle(
+            ),
+            'heading': ParagraphStyle(
                 'CustomHeading',
                 parent=styles['Heading2'],
                 fontSize=14,
@@ -162,208 +137,616 @@ class PDFGenerator:
                 spaceAfter=12,
                 alignment=TA_CENTER,
                 fontName='Helvetica-Bold'
-            )
-
-            normal_style = ParagraphStyle(
+            ),
+            'normal': ParagraphStyle(
                 'CustomNormal',
                 parent=styles['Normal'],
                 fontSize=10,
                 alignment=TA_CENTER
-            )
+            ),
+            'footer': ParagraphStyle(
+                'Footer',
+                parent=styles['Normal'],
+                fontSize=9,
+                alignment=TA_CENTER,
+                textColor=colors.HexColor('#666666')
+            ),
+        }
+
+    @staticmethod
+    def _summary_flowables(totals, styles: dict) -> list:
+        """Summary statistics and visual summary sections for the report's first page"""
+        total_violations = totals.total_violations
+        paid_count = totals.paid_count
+        unpaid_count = totals.unpaid_count
+        total_revenue = totals.total_revenue
+        pending_revenue = totals.pending_revenue
+        heading_style = styles['heading']
+        normal_style = styles['normal']
+
+        elements = []
+
+        # Summary Statistics Box
+        summary_heading = Paragraph("SUMMARY STATISTICS", heading_style)
+        elements.append(summary_heading)
+
+        # Summary table
+        summary_data = [
+            ['Total Violations', str(total_violations), 'Paid Violations',
+             f"{paid_count} ({(paid_count / total_violations * 100) if total_violations > 0 else 0:.1f}%)"],
+            ['Unpaid Violations',
+             f"{unpaid_count} ({(unpaid_count / total_violations * 100) if total_violations > 0 else 0:.1f}%)",
+             'Total Revenue', f"₱{total_revenue:,.2f}"],
+            ['Pending Revenue', f"₱{pending_revenue:,.2f}",
+             'Total Potential', f"₱{(total_revenue + pending_revenue):,.2f}"]
+        ]
+
+        summary_table = Table(summary_data, colWidths=[1.8 * inch, 1.8 * inch, 1.8 * inch, 1.8 * inch])
+        summary_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#e8f4f8')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 2, colors.HexColor('#2c3e50')),
+        ]))
+        elements.append(summary_table)
+        elements.append(Spacer(1, 0.3 * inch))
+
+        # ============= VISUAL SUMMARY =============
+        visual_heading = Paragraph("VISUAL SUMMARY", heading_style)
+        elements.append(visual_heading)
+        elements.append(Spacer(1, 0.1 * inch))
+
+        if total_violations > 0:
+            # TRY to create pie chart, fallback to text if it fails
+            pie_chart = PDFGenerator._create_safe_pie_chart(paid_count, unpaid_count)
+
+            if pie_chart is not None:
+                # Pie chart worked! Use it
+                chart_table = Table([[pie_chart]], colWidths=[6.5 * inch])
+                chart_table.setStyle(TableStyle([
+                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ]))
+                elements.append(chart_table)
+
+                # Legend for pie chart
+                legend_text = (
+                    f"<b>Green</b> = Paid ({paid_count} violations, {(paid_count/total_violations*100):.1f}%) | "
+                    f"<b>Red</b> = Unpaid ({unpaid_count} violations, {(unpaid_count/total_violations*100):.1f}%)"
+                )
+                legend = Paragraph(legend_text, normal_style)
+                elements.append(Spacer(1, 0.1 * inch))
+                elements.append(legend)
+            else:
+                # Pie chart failed - use text-based visualization
+                text_visual = PDFGenerator._create_text_based_visual(
+                    paid_count, unpaid_count, total_violations
+                )
+                elements.append(text_visual)
 
-            # Title
-            title = Paragraph("VIOLATIONS REPORT", title_style)
-            elements.append(title)
+            elements.append(Spacer(1, 0.2 * inch))
 
-            # Generated date
-            date_info = Paragraph(
-                f"<b>Generated:</b> {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}<br/>"
-                f"<b>RoadEye - Vehicle Violation Monitoring System</b>",
+            # Revenue summary
+            revenue_summary = Paragraph(
+                f"<b>Revenue Summary:</b> Collected: ₱{total_revenue:,.2f} | "
+                f"Pending: ₱{pending_revenue:,.2f} | "
+                f"Total Potential: ₱{(total_revenue + pending_revenue):,.2f}",
                 normal_style
             )
-            elements.append(date_info)
+            elements.append(revenue_summary)
             elements.append(Spacer(1, 0.3 * inch))
 
-            # Summary Statistics Box
-            summary_heading = Paragraph("SUMMARY STATISTICS", heading_style)
-            elements.append(summary_heading)
-
-            # Summary table
-            summary_data = [
-                ['Total Violations', str(total_violations), 'Paid Violations',
-                 f"{paid_count} ({(paid_count / total_violations * 100) if total_violations > 0 else 0:.1f}%)"],
-                ['Unpaid Violations',
-                 f"{unpaid_count} ({(unpaid_count / total_violations * 100) if total_violations > 0 else 0:.1f}%)",
-                 'Total Revenue', f"₱{total_revenue:,.2f}"],
-                ['Pending Revenue', f"₱{pending_revenue:,.2f}",
-                 'Total Potential', f"₱{(total_revenue + pending_revenue):,.2f}"]
-            ]
+        return elements
 
-            summary_table = Table(summary_data, colWidths=[1.8 * inch, 1.8 * inch, 1.8 * inch, 1.8 * inch])
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#e8f4f8')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                ('TOPPADDING', (0, 0), (-1, -1), 12),
-                ('GRID', (0, 0), (-1, -1), 2, colors.HexColor('#2c3e50')),
-            ]))
-            elements.append(summary_table)
-            elements.append(Spacer(1, 0.3 * inch))
+    @staticmethod
+    def _violation_cells(v: dict) -> list:
+        """One row of the detailed violations table"""
+        vehicle_info = f"{v['Brand']} {v['Model']}" if v['Brand'] and v['Model'] else 'N/A'
+        contact = v['ContactNo'] if v['ContactNo'] else 'N/A'
+
+        # FIXED: Only show payment date if status is PAID
+        if v['PaymentStatus'] == 'PAID' and v.get('PaymentDate'):
+            payment_date = str(v['PaymentDate'])
+        else:
+            payment_date = '-'
+
+        return [
+            str(v['ViolationID']),
+            str(v['ResidentName'])[:20],
+            str(contact),
+            str(v['PlateNo']),
+            vehicle_info[:15],
+            str(v['ViolationName'])[:20],
+            str(v['ViolationDate']),
+            f"₱{float(v['FineAmount']):,.0f}",
+            str(v['PaymentStatus']),
+            payment_date
+        ]
 
-            # ============= VISUAL SUMMARY =============
-            visual_heading = Paragraph("VISUAL SUMMARY", heading_style)
-            elements.append(visual_heading)
-            elements.append(Spacer(1, 0.1 * inch))
-
-            if total_violations > 0:
-                # TRY to create pie chart, fallback to text if it fails
-                pie_chart = PDFGenerator._create_safe_pie_chart(paid_count, unpaid_count)
-
-                if pie_chart is not None:
-                    # Pie chart worked! Use it
-                    chart_table = Table([[pie_chart]], colWidths=[6.5 * inch])
-                    chart_table.setStyle(TableStyle([
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ]))
-                    elements.append(chart_table)
-
-                    # Legend for pie chart
-                    legend_text = (
-                        f"<b>Green</b> = Paid ({paid_count} violations, {(paid_count/total_violations*100):.1f}%) | "
-                        f"<b>Red</b> = Unpaid ({unpaid_count} violations, {(unpaid_count/total_violations*100):.1f}%)"
-                    )
-                    legend = Paragraph(legend_text, normal_style)
-                    elements.append(Spacer(1, 0.1 * inch))
-                    elements.append(legend)
-                else:
-                    # Pie chart failed - use text-based visualization
-                    text_visual = PDFGenerator._create_text_based_visual(
-                        paid_count, unpaid_count, total_violations
-                    )
-                    elements.append(text_visual)
-
-                elements.append(Spacer(1, 0.2 * inch))
-
-                # Revenue summary
-                revenue_summary = Paragraph(
-                    f"<b>Revenue Summary:</b> Collected: ₱{total_revenue:,.2f} | "
-                    f"Pending: ₱{pending_revenue:,.2f} | "
-                    f"Total Potential: ₱{(total_revenue + pending_revenue):,.2f}",
-                    normal_style
-                )
-                elements.append(revenue_summary)
-                elements.append(Spacer(1, 0.3 * inch))
+    @staticmethod
+    def _violations_table(rows: list) -> Table:
+        """Detailed violations table for a run of rows; the header repeats if it is split"""
+        table_data = [VIOLATION_TABLE_HEADER] + rows
+        violations_table = Table(table_data, colWidths=VIOLATION_TABLE_WIDTHS, repeatRows=1)
+
+        # Style the table
+        table_style = TableStyle([
+            # Header row
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+            ('TOPPADDING', (0, 0), (-1, 0), 10),
 
-            # ============= VIOLATIONS TABLE =============
-            # Page break before table for better layout
-            elements.append(PageBreak())
+            # Data rows
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+            ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+            ('TOPPADDING', (0, 1), (-1, -1), 6),
 
-            # Violations Table Header
-            table_heading = Paragraph("DETAILED VIOLATIONS RECORDS", heading_style)
-            elements.append(table_heading)
-            elements.append(Spacer(1, 0.2 * inch))
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#aaaaaa')),
+            ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#2c3e50')),
+
+            # Alternating row colors
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+        ])
 
-            table_data = [
-                ['ID', 'Resident', 'Contact', 'Plate', 'Vehicle', 'Violation',
-                 'Date', 'Fine', 'Status', 'Paid Date']
+        # Color code the status column
+        for i, row in enumerate(rows, start=1):
+            if row[8] == 'PAID':
+                table_style.add('TEXTCOLOR', (8, i), (8, i), colors.HexColor('#27ae60'))
+                table_style.add('FONTNAME', (8, i), (8, i), 'Helvetica-Bold')
+            else:
+                table_style.add('TEXTCOLOR', (8, i), (8, i), colors.HexColor('#e74c3c'))
+                table_style.add('FONTNAME', (8, i), (8, i), 'Helvetica-Bold')
+
+        violations_table.setStyle(table_style)
+        return violations_table
+
+    @staticmethod
+    def _report_story(violations, totals, styles: dict, summary):
+        """
+        Flowables of the violations report, produced as the layout reaches them
+
+        The footer and the summary forms come after the rows, so they are
+        only created once the totals are complete.
+        """
+        # Title
+        yield Paragraph("VIOLATIONS REPORT", styles['title'])
+
+        # Generated date
+        yield Paragraph(
+            f"<b>Generated:</b> {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}<br/>"
+            f"<b>RoadEye - Vehicle Violation Monitoring System</b>",
+            styles['normal']
+        )
+        yield Spacer(1, 0.3 * inch)
+
+        # Summary and visual summary - drawn once every row has been counted
+        yield from summary.slots
+
+        # ============= VIOLATIONS TABLE =============
+        # Page break before table for better layout
+        yield PageBreak()
+
+        # Violations Table Header
+        yield Paragraph("DETAILED VIOLATIONS RECORDS", styles['heading'])
+        yield Spacer(1, 0.2 * inch)
+
+        yield _ViolationRows(violations, totals)
+
+        # Footer
+        yield Spacer(1, 0.3 * inch)
+        yield Paragraph(
+            f"<b>RoadEye - Vehicle Violation Monitoring System</b><br/>"
+            f"This is a computer-generated document. No signature required.<br/>"
+            f"Report contains {totals.total_violations} violation record(s) | "
+            f"Paid: {totals.paid_count} | Unpaid: {totals.unpaid_count}",
+            styles['footer']
+        )
+
+        yield summary.definition()
+
+    @staticmethod
+    def generate_violations_report(file_path: str, violations, progress=None):
+        """
+        Generate PDF report for violations with SAFE pie chart
+
+        Streams: the rows are laid out page by page as they are read and the
+        statistics are accumulated in the same pass, so memory stays flat
+        however many violations there are.
+
+        Args:
+            file_path: Path where PDF will be saved
+            violations: Violation dictionaries - a list, or an iterator such
+                        as ReportModel.iter_violations_report_data()
+            progress: Optional progress(rows_read, pages_rendered), called as
+                      each page starts; an exception it raises aborts the export
+        """
+        try:
+            # Create PDF document in landscape mode
+            doc = SimpleDocTemplate(
+                file_path,
+                pagesize=landscape(A4),
+                rightMargin=30,
+                leftMargin=30,
+                topMargin=30,
+                bottomMargin=30
+            )
+
+            # Frame padding (6pt each side) comes off the usable width
+            frame_width = doc.width - 12
+
+            styles = PDFGenerator._report_styles()
+            totals = ReportTotals()
+            summary = _DeferredSummary(totals, styles, frame_width)
+            story = PDFGenerator._report_story(violations, totals, styles, summary)
+
+            def on_page(canv, page_doc):
+                if progress:
+                    progress(totals.total_violations, page_doc.page - 1)
+
+            # Build PDF
+            doc.build(_FlowableStream(story), onFirstPage=on_page, onLaterPages=on_page,
+                      canvasmaker=_CompressedPageCanvas)
+
+            return True, f"PDF generated successfully with {totals.total_violations} records"
+
+        except Exception as e:
+            return False, f"PDF generation error: {str(e)}"
+
+    @staticmethod
+    def _analytics_table(table_data: list, col_widths: list) -> Table:
+        """Figures table with a dark header row that repeats across pages"""
+        table = Table(table_data, colWidths=col_widths, repeatRows=1)
+        table.setStyle(TableStyle([
+            # Header row
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+
+            # Data rows
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+            ('TOPPADDING', (0, 0), (-1, -1), 5),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#aaaaaa')),
+            ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#2c3e50')),
+        ]))
+        return table
+
+    @staticmethod
+    def generate_revenue_report(file_path: str, analytics: dict):
+        """
+        Generate the revenue analytics PDF
+
+        Period totals, then revenue (per payment type), collection rate
+        and days-to-pay for every period, then the days-to-pay histogram.
+
+        Args:
+            file_path: Path where PDF will be saved
+            analytics: ReportModel.get_revenue_analytics result
+        """
+        try:
+            doc = SimpleDocTemplate(
+                file_path,
+                pagesize=landscape(A4),
+                rightMargin=30,
+                leftMargin=30,
+                topMargin=30,
+                bottomMargin=30
+            )
+            styles = PDFGenerator._report_styles()
+            buckets = analytics['buckets']
+            totals = analytics['totals']
+            label_format = PERIOD_LABEL_FORMATS[analytics['granularity']]
+            payment_types = sorted(analytics['revenue_by_type'])
+
+            elements = [
+                Paragraph("REVENUE ANALYTICS REPORT", styles['title']),
+                Paragraph(
+                    f"<b>Generated:</b> {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}<br/>"
+                    f"<b>RoadEye - Vehicle Violation Monitoring System</b>",
+                    styles['normal']
+                ),
+                Spacer(1, 0.3 * inch),
             ]
 
-            # Add violation data with FIXED paid date logic
-            for v in violations:
-                vehicle_info = f"{v['Brand']} {v['Model']}" if v['Brand'] and v['Model'] else 'N/A'
-                contact = v['ContactNo'] if v['ContactNo'] else 'N/A'
-
-                # FIXED: Only show payment date if status is PAID
-                if v['PaymentStatus'] == 'PAID' and v.get('PaymentDate'):
-                    payment_date = str(v['PaymentDate'])
-                else:
-                    payment_date = '-'
-
-                table_data.append([
-                    str(v['ViolationID']),
-                    str(v['ResidentName'])[:20],
-                    str(contact),
-                    str(v['PlateNo']),
-                    vehicle_info[:15],
-                    str(v['ViolationName'])[:20],
-                    str(v['ViolationDate']),
-                    f"₱{float(v['FineAmount']):,.0f}",
-                    str(v['PaymentStatus']),
-                    payment_date
-                ])
-
-            # Create violations table
-            violations_table = Table(table_data, colWidths=[
-                0.5 * inch, 1.2 * inch, 0.9 * inch, 0.7 * inch, 1.0 * inch,
-                1.2 * inch, 0.8 * inch, 0.8 * inch, 0.7 * inch, 0.8 * inch
-            ])
-
-            # Style the table
-            table_style = TableStyle([
-                # Header row
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                ('TOPPADDING', (0, 0), (-1, 0), 10),
-
-                # Data rows
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-
-                # Grid
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#aaaaaa')),
-                ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#2c3e50')),
-
-                # Alternating row colors
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-            ])
-
-            # Color code the status column
-            for i, row in enumerate(table_data[1:], start=1):
-                if row[8] == 'PAID':
-                    table_style.add('TEXTCOLOR', (8, i), (8, i), colors.HexColor('#27ae60'))
-                    table_style.add('FONTNAME', (8, i), (8, i), 'Helvetica-Bold')
-                else:
-                    table_style.add('TEXTCOLOR', (8, i), (8, i), colors.HexColor('#e74c3c'))
-                    table_style.add('FONTNAME', (8, i), (8, i), 'Helvetica-Bold')
-
-            violations_table.setStyle(table_style)
-            elements.append(violations_table)
+            # Period totals
+            elements.append(Paragraph("SUMMARY", styles['heading']))
+            period = f"{buckets[0]:%d %b %Y} - {buckets[-1]:%d %b %Y}" if buckets else "-"
+            elements.append(PDFGenerator._analytics_table([
+                ['Period', 'Payments', 'Revenue', 'Fines Issued', 'Fines Collected',
+                 'Collection Rate', 'Avg Days to Pay'],
+                [period, f"{totals['payments']:,}", f"₱{totals['revenue']:,.2f}",
+                 f"₱{totals['issued_fines']:,.2f}", f"₱{totals['collected_fines']:,.2f}",
+                 _percent(totals['collection_rate']), _days(totals['average_days_to_pay'])],
+            ], [2.0 * inch, 0.9 * inch, 1.3 * inch, 1.3 * inch, 1.3 * inch, 1.2 * inch, 1.2 * inch]))
+            elements.append(Spacer(1, 0.3 * inch))
+
+            # Figures per period
+            elements.append(Paragraph("REVENUE BY PERIOD", styles['heading']))
+            rows = [['Period', 'Payments'] + payment_types +
+                    ['Revenue', 'Cumulative', 'Issued', 'Rate', 'Cumulative Rate', 'Avg Days']]
+            for index, bucket in enumerate(buckets):
+                rows.append(
+                    [bucket.strftime(label_format), f"{analytics['payments'][index]:,}"] +
+                    [f"₱{analytics['revenue_by_type'][payment_type][index]:,.0f}"
+                     for payment_type in payment_types] +
+                    [f"₱{analytics['revenue'][index]:,.0f}",
+                     f"₱{analytics['cumulative_revenue'][index]:,.0f}",
+                     f"₱{analytics['issued_fines'][index]:,.0f}",
+                     _percent(analytics['collection_rate'][index]),
+                     _percent(analytics['cumulative_collection_rate'][index]),
+                     _days(analytics['average_days_to_pay'][index])]
+                )
+            type_width = min(1.0 * inch, 3.0 * inch / max(len(payment_types), 1))
+            elements.append(PDFGenerator._analytics_table(
+                rows,
+                [1.3 * inch, 0.7 * inch] + [type_width] * len(payment_types) +
+                [0.9 * inch, 1.0 * inch, 0.9 * inch, 0.7 * inch, 1.0 * inch, 0.7 * inch]
+            ))
+            elements.append(Spacer(1, 0.3 * inch))
+
+            # Days-to-pay histogram
+            elements.append(Paragraph("DAYS TO PAY", styles['heading']))
+            histogram = analytics['days_to_pay_histogram']
+            paid = sum(histogram)
+            rows = [['Paid Within', 'Payments', 'Share', 'Visual']]
+            for label, count in zip(analytics['days_to_pay_bins'], histogram):
+                share = count / paid if paid else 0
+                # Each █ = 5% (max 20 blocks)
+                rows.append([label, f"{count:,}", _percent(share), '█' * int(share * 20)])
+            elements.append(PDFGenerator._analytics_table(
+                rows, [1.5 * inch, 1.0 * inch, 1.0 * inch, 2.5 * inch]
+            ))
 
             # Footer
             elements.append(Spacer(1, 0.3 * inch))
-            footer_style = ParagraphStyle(
-                'Footer',
-                parent=styles['Normal'],
-                fontSize=9,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor('#666666')
-            )
-            footer = Paragraph(
-                f"<b>RoadEye - Vehicle Violation Monitoring System</b><br/>"
-                f"This is a computer-generated document. No signature required.<br/>"
-                f"Report contains {total_violations} violation record(s) | "
-                f"Paid: {paid_count} | Unpaid: {unpaid_count}",
-                footer_style
-            )
-            elements.append(footer)
+            elements.append(Paragraph(
+                "<b>RoadEye - Vehicle Violation Monitoring System</b><br/>"
+                "This is a computer-generated document. No signature required.",
+                styles['footer']
+            ))
 
-            # Build PDF
-            doc.build(elements)
+            doc.build(elements, canvasmaker=_CompressedPageCanvas)
 
-            return True, f"PDF generated successfully with {total_violations} records"
+            return True, f"PDF generated successfully with {len(buckets)} periods"
 
         except Exception as e:
-            return False, f"PDF generation error: {str(e)}"
\ No newline at end of file
+            return False, f"PDF generation error: {str(e)}"
+
+
+# Revenue report period label per granularity
+PERIOD_LABEL_FORMATS = {'day': "%d %b %Y", 'week': "Week of %d %b %Y", 'month': "%B %Y"}
+
+
+def _percent(rate) -> str:
+    return f"{rate * 100:.1f}%" if rate is not None else "-"
+
+
+def _days(days) -> str:
+    return f"{days:.1f}" if days is not None else "-"
+
+
+VIOLATION_TABLE_HEADER = ['ID', 'Resident', 'Contact', 'Plate', 'Vehicle', 'Violation',
+                          'Date', 'Fine', 'Status', 'Paid Date']
+
+VIOLATION_TABLE_WIDTHS = [
+    0.5 * inch, 1.2 * inch, 0.9 * inch, 0.7 * inch, 1.0 * inch,
+    1.2 * inch, 0.8 * inch, 0.8 * inch, 0.7 * inch, 0.8 * inch
+]
+
+
+class ReportTotals:
+    """Violations report statistics accumulated one row at a time"""
+
+    def __init__(self):
+        self.total_violations = 0
+        self.paid_count = 0
+        self.total_revenue = 0.0
+        self.pending_revenue = 0.0
+
+    @property
+    def unpaid_count(self) -> int:
+        return self.total_violations - self.paid_count
+
+    def add(self, v: dict):
+        fine = float(v['FineAmount'])
+        self.total_violations += 1
+        if v['PaymentStatus'] == 'PAID':
+            self.paid_count += 1
+            self.total_revenue += fine
+        else:
+            self.pending_revenue += fine
+
+
+class _ViolationRows(Flowable):
+    """
+    Detailed violations table laid out a page at a time from the row iterator
+
+    Never fits as a whole: each split() reads just the rows that fit in the
+    space left, returns them as a table with its own header, and puts itself
+    back on the story for the rest. Rows are one line high, so the count
+    follows from the measured header and row heights.
+    """
+
+    def __init__(self, violations, totals: ReportTotals):
+        super().__init__()
+        self._rows = iter(violations)
+        self._pending = None
+        self.totals = totals
+
+        width = sum(VIOLATION_TABLE_WIDTHS)
+        sample = PDFGenerator._violation_cells({
+            'ViolationID': 'V000', 'ResidentName': 'Name', 'ContactNo': '0', 'PlateNo': 'P',
+            'Brand': 'B', 'Model': 'M', 'ViolationName': 'Type', 'ViolationDate': '2000-01-01',
+            'FineAmount': 0, 'PaymentStatus': 'PAID', 'PaymentDate': '2000-01-01'
+        })
+        self._header_height = PDFGenerator._violations_table([]).wrap(width, 10000)[1]
+        self._row_height = PDFGenerator._violations_table([sample]).wrap(width, 10000)[1] - self._header_height
+
+    def _peek(self):
+        """Next row without consuming it (None when the rows are exhausted)"""
+        if self._pending is None:
+            self._pending = next(self._rows, None)
+        return self._pending
+
+    def wrap(self, available_width, available_height):
+        return available_width, available_height + 1
+
+    def split(self, available_width, available_height):
+        # Tiny allowance so float rounding never makes an exact fit overflow
+        count = max(0, int((available_height - self._header_height - 0.01) // self._row_height))
+        # An empty report still gets its header row
+        if not count and (self._peek() is not None or available_height < self._header_height):
+            return [PageBreak(), self]
+
+        rows = []
+        while len(rows) < count and self._peek() is not None:
+            v = self._pending
+            self._pending = None
+            self.totals.add(v)
+            rows.append(PDFGenerator._violation_cells(v))
+
+        table = PDFGenerator._violations_table(rows)
+        return [table, self] if self._peek() is not None else [table]
+
+
+class _CompressedPageCanvas(canvas.Canvas):
+    """
+    Canvas that deflates each page as soon as it is finished
+
+    reportlab keeps every page until save(); holding the page streams
+    compressed rather than as raw drawing operators leaves a long report
+    holding roughly the size of the finished file. The stream is marked as
+    already filtered so it is not compressed again when the file is written.
+
+    The finished page is reached through reportlab's private document
+    structure (tested with the version in requirements.txt). If that
+    structure is not as expected, pages are left as the plain Canvas made
+    them.
+    """
+
+    def showPage(self):
+        super().showPage()
+        try:
+            page = self._doc.Pages.pages[-1]
+            stream, contents = page.stream, page.Contents
+        except (AttributeError, IndexError):
+            return
+        if isinstance(stream, str) and stream and not contents:
+            dictionary = PDFDictionary({'Filter': PDFArray([PDFName('FlateDecode')])})
+            page.Contents = PDFStream(dictionary, zlib.compress(stream.encode('utf8')))
+            page.stream = None
+
+
+class _FlowableStream(list):
+    """
+    Story list that pulls flowables from an iterator as the layout consumes them
+
+    doc.build works from the front of a list (reading, deleting and
+    re-inserting split parts at index 0), so topping the list up whenever
+    it runs empty keeps the whole story from ever being materialised.
+    """
+
+    def __init__(self, flowables):
+        super().__init__()
+        self._source = iter(flowables)
+
+    def _fill(self):
+        if not list.__len__(self):
+            flowable = next(self._source, None)
+            if flowable is not None:
+                self.append(flowable)
+
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill()
+        return list.__getitem__(self, index)
+
+
+class _DeferredSummary:
+    """
+    Summary sections for the report's first page, filled in after the rows
+
+    Each section is laid out as a fixed-size slot drawing a PDF form; the
+    forms are only defined by definition(), the last flowable of the story,
+    once every row has been counted. Slot sizes are measured from the
+    sections themselves, which only differ in their numbers, so the page
+    flow matches a summary built up front.
+    """
+
+    FORM_NAME = 'violationsReportSummary%d'
+
+    def __init__(self, totals: ReportTotals, styles: dict, width: float):
+        self.totals = totals
+        self.styles = styles
+        self.width = width
+
+        sample = ReportTotals()
+        sample.add({'FineAmount': 0, 'PaymentStatus': 'PAID'})
+        self.slots = [
+            _SummarySlot(self.FORM_NAME % i, flowable, width)
+            for i, flowable in enumerate(PDFGenerator._summary_flowables(sample, styles))
+        ]
+
+    def definition(self):
+        return _SummaryFormDefinition(self)
+
+
+class _SummarySlot(Flowable):
+    """Placeholder sized like one summary section, drawing that section's form"""
+
+    def __init__(self, form_name: str, sample: Flowable, available_width: float):
+        super().__init__()
+        self.form_name = form_name
+        self.width, self.height = sample.wrap(available_width, 10000)
+        self.hAlign = getattr(sample, 'hAlign', 'LEFT')
+        self.spaceBefore = sample.getSpaceBefore()
+        self.spaceAfter = sample.getSpaceAfter()
+
+    def wrap(self, available_width, available_height):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.doForm(self.form_name)
+
+
+class _SummaryFormDefinition(Flowable):
+    """Zero-size flowable that defines the summary forms from the final totals"""
+
+    def __init__(self, summary: _DeferredSummary):
+        super().__init__()
+        self.summary = summary
+
+    def wrap(self, available_width, available_height):
+        return 0, 0
+
+    def draw(self):
+        summary = self.summary
+        sections = PDFGenerator._summary_flowables(summary.totals, summary.styles)
+        # Every slot's form must exist; with no violations the visual summary is left empty
+        for i, slot in enumerate(summary.slots):
+            self.canv.beginForm(slot.form_name, 0, 0, slot.width, slot.height)
+            if i < len(sections):
+                _, height = sections[i].wrap(summary.width, slot.height)
+                sections[i].drawOn(self.canv, 0, slot.height - height)
+            self.canv.endForm()
@@ -0,0 +1,219 @@
+"""
+Utility/SearchIndex.py
+Trigram inverted index for in-memory substring search with facets
+"""
+from itertools import compress
+from operator import is_not
+
+# Joins fields and pads the end of the text; never part of a query
+SEPARATOR = '\x1f'
+
+# A patched list with more changed or added rows than this share of the indexed ones is rebuilt instead
+MAX_PATCHED_SHARE = 0.1
+
+
+def _trigrams(text: str) -> set:
+    """Every trigram starting at a position of text (padded so short tails are covered)"""
+    padded = text + SEPARATOR * 2
+    return {padded[i:i + 3] for i in range(len(text))}
+
+
+class SearchIndex:
+    """
+    Case-insensitive substring search over a list of row dicts
+
+    Row ids are positions in the indexed list. A query of three or more
+    characters intersects the posting sets of its trigrams and then checks
+    the few remaining candidates; shorter queries take the union of the
+    trigrams that start with them. Facets (e.g. status, year) are exact
+    match sets intersected with the text result.
+    """
+
+    def __init__(self, fields: list, facets: dict = None):
+        """
+        Args:
+            fields: Row keys (or callables taking the row) to search in
+            facets: Facet name -> row key (or callable) giving the facet value
+        """
+        self.fields = [self._getter(field) for field in fields]
+        self.facets = {name: self._getter(field) for name, field in (facets or {}).items()}
+        self.rows = None
+        self._clear()
+
+    @staticmethod
+    def _getter(field):
+        if callable(field):
+            return field
+        return lambda row: row.get(field, '')
+
+    def _clear(self):
+        self._texts = []
+        self._row_facets = []
+        self._postings = {}
+        self._by_prefix = {}
+        self._facet_sets = {name: {} for name in self.facets}
+
+    # ---------- building and maintenance ----------
+    def build(self, rows: list):
+        """Index rows from scratch"""
+        self.rows = rows
+        self._clear()
+
+        # Bulk path of _index_row with the lookups hoisted out of the loop
+        texts = self._texts
+        postings = self._postings
+        padding = SEPARATOR * 2
+        for row_id, row in enumerate(rows):
+            text = self._row_text(row)
+            texts.append(text)
+            padded = text + padding
+            for i in range(len(text)):
+                trigram = padded[i:i + 3]
+                posting = postings.get(trigram)
+                if posting is None:
+                    postings[trigram] = {row_id}
+                else:
+                    posting.add(row_id)
+
+        for trigram in postings:
+            self._add_prefixes(trigram)
+
+        for name, get in self.facets.items():
+            facet_sets = self._facet_sets[name]
+            for row_id, row in enumerate(rows):
+                facet_sets.setdefault(get(row), set()).add(row_id)
+        self._row_facets = [
+            {name: get(row) for name, get in self.facets.items()} for row in rows
+        ]
+
+    def ensure(self, rows: list):
+        """
+        Index rows, reusing the current index where possible
+
+        Nothing happens if rows is the indexed list. A patched copy of it
+        (see ColumnStore.patch_rows) only has its replaced rows re-indexed
+        and the rows added at its end indexed; that takes one identity
+        comparison per row instead of a rebuild. Any other list, e.g.
+        one with rows inserted at the front, is indexed from scratch.
+        """
+        if rows is self.rows:
+            return
+        old = self.rows
+        if old is None or len(rows) < len(old):
+            self.build(rows)
+            return
+
+        changed = list(compress(range(len(old)), map(is_not, rows, old)))
+        if len(changed) + len(rows) - len(old) > MAX_PATCHED_SHARE * len(old):
+            self.build(rows)
+            return
+
+        self.rows = rows
+        for row_id in changed:
+            self._unindex_row(row_id)
+            self._index_row(rows[row_id], row_id)
+        for row in rows[len(old):]:
+            self._index_row(row)
+
+    def _row_text(self, row: dict) -> str:
+        return SEPARATOR.join(str(get(row) or '').lower() for get in self.fields)
+
+    def _index_row(self, row: dict, row_id: int = None) -> int:
+        text = self._row_text(row)
+        facet_values = {name: get(row) for name, get in self.facets.items()}
+        if row_id is None:
+            row_id = len(self._texts)
+            self._texts.append(text)
+            self._row_facets.append(facet_values)
+        else:
+            self._texts[row_id] = text
+            self._row_facets[row_id] = facet_values
+
+        for trigram in _trigrams(text):
+            posting = self._postings.get(trigram)
+            if posting is None:
+                posting = self._postings[trigram] = set()
+                self._add_prefixes(trigram)
+            posting.add(row_id)
+
+        for name, value in facet_values.items():
+            self._facet_sets[name].setdefault(value, set()).add(row_id)
+        return row_id
+
+    def _add_prefixes(self, trigram: str):
+        self._by_prefix.setdefault(trigram[0], []).append(trigram)
+        self._by_prefix.setdefault(trigram[:2], []).append(trigram)
+
+    def _unindex_row(self, row_id: int):
+        text = self._texts[row_id]
+        for trigram in _trigrams(text):
+            self._postings[trigram].discard(row_id)
+        # Facet values as indexed, in case the row dict was edited in place
+        for name, value in self._row_facets[row_id].items():
+            self._facet_sets[name].get(value, set()).discard(row_id)
+
+    # ---------- queries ----------
+    def search(self, text: str = '', **facets):
+        """
+        Find rows containing text in any field and matching every given facet
+
+        Facets passed as None are ignored.
+
+        Returns:
+            set or None: Matching row ids, None when nothing restricts the result
+        """
+        constraints = []
+
+        for name, value in facets.items():
+            if value is not None:
+                constraints.append(self._facet_sets[name].get(value, set()))
+
+        query = (text or '').strip().lower()
+        if query:
+            constraints.append(self._match_text(query))
+
+        if not constraints:
+            return None
+
+        constraints.sort(key=len)
+        result = set(constraints[0])
+        for other in constraints[1:]:
+            if not result:
+                break
+            result &= other
+        return result
+
+    def select(self, row_ids) -> list:
+        """Indexed rows for a search() result, in their original order"""
+        if row_ids is None:
+            return self.rows
+        return [self.rows[row_id] for row_id in sorted(row_ids)]
+
+    def _match_text(self, query: str) -> set:
+        if SEPARATOR in query:
+            return set()
+
+        if len(query) < 3:
+            # Every occurrence starts a (padded) trigram beginning with the query
+            matches = set()
+            for trigram in self._by_prefix.get(query, ()):
+                matches |= self._postings[trigram]
+            return matches
+
+        postings = []
+        for i in range(len(query) - 2):
+            posting = self._postings.get(query[i:i + 3])
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+
+        # Trigrams can all occur without the full query being present
+        texts = self._texts
+        return {row_id for row_id in candidates if query in texts[row_id]}
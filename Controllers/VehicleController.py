@@ -2,21 +2,27 @@
 Controllers/VehicleController.py
 Handles vehicle management business logic
 """
-from Models.Database import Database
+from Models.Database import Database, get_shared_database
 from Models.VehicleModel import VehicleModel
+from Controllers.Utility.SearchIndex import SearchIndex
 
 
 class VehicleController:
     """Handles vehicle management business logic"""
 
-    def __init__(self):
-        self.db = Database(host='localhost', database='RoadEyeDB', user='root', password='')
+    def __init__(self, db: Database = None):
+        self.db = db or get_shared_database()
         self.vehicle_model = VehicleModel(self.db)
+        self.vehicle_index = SearchIndex(['VehicleID', 'PlateNo', 'owner_name', 'Brand', 'Model'])
 
     def get_all_vehicles(self):
         """Get all vehicles with owner names and violation counts"""
         return self.vehicle_model.get_all_vehicles()
 
+    def get_vehicles_by_ids(self, vehicle_ids):
+        """Get current rows for changed vehicles"""
+        return self.vehicle_model.get_all_vehicles(tuple(sorted(vehicle_ids)))
+
     def get_vehicle_details(self, vehicle_id: str):
         """Get vehicle details including ResidentID and owner name"""
         return self.vehicle_model.get_vehicle_by_id(vehicle_id)
@@ -67,6 +73,17 @@ class VehicleController:
         """
         return self.vehicle_model.get_vehicles_for_dropdown()
 
+    def find_vehicles(self, vehicles: list, search_text: str):
+        """
+        Row ids of vehicles matching the search text
+
+        Returns:
+            set or None: Positions in vehicles, None when nothing is filtered
+        """
+        # The index is built once per loaded list, so a keystroke is only a lookup
+        self.vehicle_index.ensure(vehicles)
+        return self.vehicle_index.search(search_text)
+
     def search_vehicles(self, vehicles: list, search_text: str):
         """
         Filter vehicles based on search text
@@ -78,22 +95,7 @@ class VehicleController:
         Returns:
             Filtered list of vehicles
         """
-        if not search_text:
-            return vehicles
-
-        search_lower = search_text.lower()
-        filtered = []
-
-        for vehicle in vehicles:
-            # Search across multiple fields
-            if (search_lower in str(vehicle.get('VehicleID', '')).lower() or
-                    search_lower in str(vehicle.get('PlateNo', '')).lower() or
-                    search_lower in str(vehicle.get('owner_name', '')).lower() or
-                    search_lower in str(vehicle.get('Brand', '')).lower() or
-                    search_lower in str(vehicle.get('Model', '')).lower()):
-                filtered.append(vehicle)
-
-        return filtered
+        return self.vehicle_index.select(self.find_vehicles(vehicles, search_text))
 
     def get_total_vehicles(self):
         """Get total number of registered vehicles"""
@@ -1,18 +1,50 @@
-from Models.Database import Database
+from Models.Database import Database, get_shared_database
 from Models.ViolationModel import ViolationModel
+from Controllers.Utility.SearchIndex import SearchIndex
+
+
+VIOLATIONS_PAGE_SIZE = 100
 
 
 class ViolationController:
     """Handles violation management business logic"""
 
-    def __init__(self):
-        self.db = Database(host='localhost', database='RoadEyeDB', user='root', password='')
+    def __init__(self, db: Database = None):
+        self.db = db or get_shared_database()
         self.violation_model = ViolationModel(self.db)
+        self.violation_index = SearchIndex(['ViolationID', 'resident_name', 'PlateNo', 'ViolationName'])
 
     def get_all_violations(self):
         """Get all violations (admin view)"""
         return self.violation_model.get_all_violations()
 
+    def get_violations_page(self, after: dict = None, search_text: str = '',
+                            limit: int = VIOLATIONS_PAGE_SIZE):
+        """
+        Get the next page of violations (admin view)
+
+        Args:
+            after: Last violation row already shown, None for the first page
+            search_text: Server-side search across ID, resident, plate and type
+            limit: Page size
+
+        Returns:
+            tuple: (rows: list, has_more: bool)
+        """
+        after_date = after.get('ViolationDate') if after else None
+        after_id = after.get('ViolationID') if after else None
+
+        # Fetch one extra row to know whether another page exists
+        rows = self.violation_model.get_violations_page(
+            after_date, after_id, limit + 1, {'search': search_text}
+        )
+        return rows[:limit], len(rows) > limit
+
+    def get_violations_by_ids(self, violation_ids):
+        """Get current rows for changed violations, shaped like get_violations_page rows"""
+        ids = sorted(violation_ids)
+        return self.violation_model.get_violations_page(limit=len(ids), filters={'ids': ids})
+
     def get_violation_details(self, violation_id: str):
         """Get detailed violation information"""
         return self.violation_model.get_violation_by_id(violation_id)
@@ -36,18 +68,5 @@ class ViolationController:
         Returns:
             Filtered list of violations
         """
-        if not search_text:
-            return violations
-
-        search_lower = search_text.lower()
-        filtered = []
-
-        for violation in violations:
-            # Search across multiple fields
-            if (search_lower in str(violation.get('ViolationID', '')).lower() or
-                    search_lower in str(violation.get('resident_name', '')).lower() or
-                    search_lower in str(violation.get('PlateNo', '')).lower() or
-                    search_lower in str(violation.get('ViolationName', '')).lower()):
-                filtered.append(violation)
-
-        return filtered
\ No newline at end of file
+        self.violation_index.ensure(violations)
+        return self.violation_index.select(self.violation_index.search(search_text))
@@ -0,0 +1,154 @@
+"""
+Models/ChangeFeedModel.py
+Monotonic change log that lets open windows pick up other writes
+
+Every write appends one row per affected record to change_log on the
+writer's cursor, so the entry commits (or rolls back) with the change.
+A reader asks for the rows after the last ChangeID it has seen. IDs are
+assigned when the entry is inserted but only become visible when the
+writer commits, so they can appear out of order (see
+Controllers/ChangeFeedController.py). Records are keyed the way the lists show them: payments by
+their ViolationID (one payment per violation), and vehicles/residents
+also get an entry when a new violation changes their violation count.
+Entries older than CHANGE_LOG_RETENTION_HOURS are pruned by prune().
+"""
+from Models.Database import Database
+from mysql.connector import Error, errorcode
+
+
+CHANGE_LOG_SQL = """
+    CREATE TABLE IF NOT EXISTS change_log (
+        ChangeID BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        TableName VARCHAR(32) NOT NULL,
+        RecordID VARCHAR(20) NOT NULL,
+        Operation ENUM('INSERT', 'UPDATE', 'DELETE') NOT NULL,
+        ChangedAt DATETIME DEFAULT CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB
+"""
+
+# How long change entries are kept; a window that has not polled for longer reloads instead
+CHANGE_LOG_RETENTION_HOURS = 24
+
+# Entries deleted per transaction when pruning
+PRUNE_BATCH_SIZE = 10000
+
+
+class ChangeFeedModel:
+    """Handles the change_log table"""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    @staticmethod
+    def record_change(cursor, table_name: str, record_id: str, operation: str = 'UPDATE'):
+        """Append a change entry in the caller's transaction"""
+        try:
+            cursor.execute(
+                "INSERT INTO change_log (TableName, RecordID, Operation) VALUES (%s, %s, %s)",
+                (table_name, record_id, operation)
+            )
+        except Error as e:
+            # Databases that predate the change log still accept the write itself
+            if e.errno != errorcode.ER_NO_SUCH_TABLE:
+                raise
+
+    @staticmethod
+    def record_changes(cursor, table_name: str, record_ids, operation: str = 'UPDATE'):
+        """Append one change entry per record in the caller's transaction"""
+        rows = [(table_name, record_id, operation) for record_id in record_ids]
+        if not rows:
+            return
+        try:
+            cursor.executemany(
+                "INSERT INTO change_log (TableName, RecordID, Operation) VALUES (%s, %s, %s)",
+                rows
+            )
+        except Error as e:
+            if e.errno != errorcode.ER_NO_SUCH_TABLE:
+                raise
+
+    def get_current_version(self):
+        """
+        Latest ChangeID (0 for an empty log)
+
+        Returns:
+            int or None: None if the log cannot be read
+        """
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("SELECT COALESCE(MAX(ChangeID), 0) FROM change_log")
+                version = cursor.fetchone()[0]
+                cursor.close()
+            return int(version)
+
+        except Error as e:
+            print(f"Change log read error: {e}")
+            return None
+
+    def get_changes_since(self, version: int, limit: int = 1000):
+        """
+        Change entries after a version, oldest first
+
+        Returns:
+            list or None: Rows with ChangeID, TableName, RecordID, Operation;
+                          None if the log cannot be read
+        """
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute("""
+                    SELECT ChangeID, TableName, RecordID, Operation
+                    FROM change_log
+                    WHERE ChangeID > %s
+                    ORDER BY ChangeID
+                    LIMIT %s
+                """, (version, int(limit)))
+                results = cursor.fetchall()
+                cursor.close()
+            return results
+
+        except Error as e:
+            print(f"Change log read error: {e}")
+            return None
+
+    def prune(self, retention_hours: int = CHANGE_LOG_RETENTION_HOURS):
+        """
+        Delete the entries older than the retention period
+
+        The newest entry is always kept: ReportModel.get_data_version reads
+        MAX(ChangeID), which must not go back. Entries are deleted in
+        primary-key batches, one transaction each.
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT MAX(ChangeID), (SELECT MAX(ChangeID) FROM change_log)
+                    FROM change_log
+                    WHERE ChangedAt < NOW() - INTERVAL %s HOUR
+                """, (int(retention_hours),))
+                cutoff, newest = cursor.fetchone()
+
+                deleted = 0
+                if cutoff is not None:
+                    cutoff = min(cutoff, newest - 1)
+                    while True:
+                        cursor.execute(
+                            "DELETE FROM change_log WHERE ChangeID <= %s ORDER BY ChangeID LIMIT %s",
+                            (cutoff, PRUNE_BATCH_SIZE)
+                        )
+                        batch = cursor.rowcount
+                        connection.commit()
+                        deleted += batch
+                        if batch < PRUNE_BATCH_SIZE:
+                            break
+                cursor.close()
+            return True, f"Pruned {deleted} change log entries"
+
+        except Error as e:
+            print(f"Change log prune error: {e}")
+            return False, str(e)
@@ -0,0 +1,283 @@
+"""
+Models/DashboardSummaryModel.py
+Materialized admin dashboard totals and per-month violation counts
+
+The record_* helpers run on the caller's cursor so the summary changes
+commit (or roll back) together with the write that caused them.
+
+Usage: python -m Models.DashboardSummaryModel   (rebuild from scratch)
+"""
+from Models.Database import Database
+from Models.QueryCache import cached_query
+from mysql.connector import Error, errorcode
+
+
+SUMMARY_TABLES_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS dashboard_summary (
+        SummaryID TINYINT NOT NULL PRIMARY KEY DEFAULT 1,
+        TotalViolations INT NOT NULL DEFAULT 0,
+        PaidViolations INT NOT NULL DEFAULT 0,
+        TotalRevenue DECIMAL(14,2) NOT NULL DEFAULT 0,
+        PendingRevenue DECIMAL(14,2) NOT NULL DEFAULT 0,
+        TotalResidents INT NOT NULL DEFAULT 0,
+        TotalVehicles INT NOT NULL DEFAULT 0,
+        UpdatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS violation_monthly_counts (
+        Year SMALLINT NOT NULL,
+        Month TINYINT NOT NULL,
+        ViolationCount INT NOT NULL DEFAULT 0,
+        PRIMARY KEY (Year, Month)
+    ) ENGINE=InnoDB
+    """
+]
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def _execute_summary_update(cursor, query, params=()):
+    """Run a summary update, ignoring databases that predate the summary tables"""
+    try:
+        cursor.execute(query, params)
+    except Error as e:
+        if e.errno != errorcode.ER_NO_SUCH_TABLE:
+            raise
+
+
+class DashboardSummaryModel:
+    """Handles the materialized dashboard summary tables"""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    # ------------------------------------------------------------------
+    # incremental maintenance (caller's transaction)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def record_violation(cursor, violation_type_id: str, violation_date: str):
+        """Account for a newly inserted, unpaid violation"""
+        _execute_summary_update(cursor, """
+            UPDATE dashboard_summary
+            SET TotalViolations = TotalViolations + 1,
+                PendingRevenue = PendingRevenue + COALESCE(
+                    (SELECT FineAmount FROM violation_types WHERE ViolationTypeID = %s), 0)
+            WHERE SummaryID = 1
+        """, (violation_type_id,))
+        _execute_summary_update(cursor, """
+            INSERT INTO violation_monthly_counts (Year, Month, ViolationCount)
+            VALUES (YEAR(%s), MONTH(%s), 1)
+            ON DUPLICATE KEY UPDATE ViolationCount = ViolationCount + 1
+        """, (violation_date, violation_date))
+
+    @staticmethod
+    def record_violations(cursor, type_counts: dict, month_counts: dict):
+        """
+        Account for a batch of new, unpaid violations
+
+        Args:
+            type_counts: ViolationTypeID -> number of new violations
+            month_counts: (year, month) -> number of new violations
+        """
+        for violation_type_id, count in type_counts.items():
+            _execute_summary_update(cursor, """
+                UPDATE dashboard_summary
+                SET TotalViolations = TotalViolations + %s,
+                    PendingRevenue = PendingRevenue + %s * COALESCE(
+                        (SELECT FineAmount FROM violation_types WHERE ViolationTypeID = %s), 0)
+                WHERE SummaryID = 1
+            """, (count, count, violation_type_id))
+        for (year, month), count in month_counts.items():
+            _execute_summary_update(cursor, """
+                INSERT INTO violation_monthly_counts (Year, Month, ViolationCount)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE ViolationCount = ViolationCount + %s
+            """, (year, month, count, count))
+
+    @staticmethod
+    def record_payment(cursor, violation_id: str):
+        """Move a violation's fine from pending to collected revenue"""
+        _execute_summary_update(cursor, """
+            UPDATE dashboard_summary s
+            JOIN violations v ON v.ViolationID = %s AND v.IsDeleted = 0
+            JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+            SET s.PaidViolations = s.PaidViolations + 1,
+                s.TotalRevenue = s.TotalRevenue + vt.FineAmount,
+                s.PendingRevenue = s.PendingRevenue - vt.FineAmount
+            WHERE s.SummaryID = 1
+        """, (violation_id,))
+
+    @staticmethod
+    def record_vehicle(cursor):
+        """Account for a newly registered vehicle"""
+        _execute_summary_update(cursor, """
+            UPDATE dashboard_summary
+            SET TotalVehicles = TotalVehicles + 1
+            WHERE SummaryID = 1
+        """)
+
+    @staticmethod
+    def record_resident(cursor):
+        """Account for a newly registered resident"""
+        _execute_summary_update(cursor, """
+            UPDATE dashboard_summary
+            SET TotalResidents = TotalResidents + 1
+            WHERE SummaryID = 1
+        """)
+
+    # ------------------------------------------------------------------
+    # schema and rebuild
+    # ------------------------------------------------------------------
+    def ensure_tables(self):
+        """
+        Create the summary tables if needed and rebuild them when empty
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+                for statement in SUMMARY_TABLES_SQL:
+                    cursor.execute(statement)
+                cursor.execute("SELECT COUNT(*) FROM dashboard_summary")
+                has_summary = cursor.fetchone()[0] > 0
+                connection.commit()
+                cursor.close()
+
+            if has_summary:
+                return True, "Dashboard summary is up to date"
+            return self.rebuild()
+
+        except Error as e:
+            return False, f"Dashboard summary error: {str(e)}"
+
+    def rebuild(self):
+        """
+        Regenerate the summary tables from the source tables
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+
+                # Lock the summary rows so concurrent writers wait for the rebuild
+                cursor.execute("SELECT SummaryID FROM dashboard_summary FOR UPDATE")
+                cursor.fetchall()
+                cursor.execute("DELETE FROM dashboard_summary")
+                cursor.execute("""
+                    INSERT INTO dashboard_summary
+                        (SummaryID, TotalViolations, PaidViolations, TotalRevenue,
+                         PendingRevenue, TotalResidents, TotalVehicles)
+                    SELECT 1,
+                           COUNT(*),
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN 1 ELSE 0 END), 0),
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN vt.FineAmount ELSE 0 END), 0),
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN 0 ELSE vt.FineAmount END), 0),
+                           (SELECT COUNT(*) FROM residents),
+                           (SELECT COUNT(*) FROM vehicles)
+                    FROM violations v
+                    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                    WHERE v.IsDeleted = 0
+                """)
+
+                cursor.execute("DELETE FROM violation_monthly_counts")
+                cursor.execute("""
+                    INSERT INTO violation_monthly_counts (Year, Month, ViolationCount)
+                    SELECT YEAR(ViolationDate), MONTH(ViolationDate), COUNT(*)
+                    FROM violations
+                    WHERE IsDeleted = 0
+                      AND ViolationDate IS NOT NULL
+                    GROUP BY YEAR(ViolationDate), MONTH(ViolationDate)
+                """)
+
+                connection.commit()
+                cursor.close()
+
+            self.db.query_cache.invalidate('dashboard_summary', 'violation_monthly_counts')
+            return True, "Dashboard summary rebuilt"
+
+        except Error as e:
+            return False, f"Dashboard summary rebuild error: {str(e)}"
+
+    # ------------------------------------------------------------------
+    # reads
+    # ------------------------------------------------------------------
+    @cached_query('dashboard_summary')
+    def get_summary(self):
+        """
+        Read the materialized dashboard totals
+
+        Returns:
+            dict or None: None when the summary has not been built yet
+        """
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute("""
+                    SELECT TotalViolations, PaidViolations, TotalRevenue, PendingRevenue,
+                           TotalResidents, TotalVehicles
+                    FROM dashboard_summary
+                    WHERE SummaryID = 1
+                """)
+                result = cursor.fetchone()
+                cursor.close()
+
+            if not result:
+                return None
+
+            return {
+                'total_violations': int(result['TotalViolations']),
+                'paid_violations': int(result['PaidViolations']),
+                'unpaid_violations': int(result['TotalViolations']) - int(result['PaidViolations']),
+                'total_revenue': float(result['TotalRevenue']),
+                'pending_revenue': float(result['PendingRevenue']),
+                'total_residents': int(result['TotalResidents']),
+                'total_vehicles': int(result['TotalVehicles'])
+            }
+
+        except Error as e:
+            print(f"Dashboard summary read error: {e}")
+            return None
+
+    @cached_query('violation_monthly_counts')
+    def get_monthly_counts(self, year: int):
+        """
+        Read the materialized per-month violation counts for a year
+
+        Returns:
+            dict or None: Month name -> count, None if the table is unavailable
+        """
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT Month, ViolationCount
+                    FROM violation_monthly_counts
+                    WHERE Year = %s
+                """, (year,))
+                results = cursor.fetchall()
+                cursor.close()
+
+            monthly_data = {month: 0 for month in MONTHS}
+            for month, count in results:
+                monthly_data[MONTHS[month - 1]] = int(count)
+            return monthly_data
+
+        except Error as e:
+            print(f"Monthly summary read error: {e}")
+            return None
+
+
+if __name__ == '__main__':
+    print("Rebuilding dashboard summary...")
+    summary_model = DashboardSummaryModel(Database.from_config())
+    summary_model.ensure_tables()
+    success, message = summary_model.rebuild()
+    print(("✅ " if success else "❌ ") + message)
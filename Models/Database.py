@@ -2,127 +2,291 @@
 Models/Database.py
 Base Database connection class
 """
+import configparser
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
 import mysql.connector
 from mysql.connector import Error
 
+from Models.QueryCache import QueryCache
+from Models.IdAllocator import IdAllocator
+
+
+# Optional INI file ([database] section) next to the project root; the
+# ROADEYE_CONFIG environment variable points at a different file instead.
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'roadeye.ini')
+
+DEFAULT_DATABASE_CONFIG = {
+    'host': 'localhost',
+    'database': 'RoadEyeDB',
+    'user': 'root',
+    'password': '',
+    'pool_size': 6,
+    'max_idle_time': 300.0,
+    'health_check_interval': 30.0,
+    'cache_size': 256,
+    'cache_ttl': 60.0,
+    'id_block_size': 10
+}
+
+_shared_database = None
+_shared_database_lock = threading.Lock()
+
+
+def load_database_config(config_path: str = None) -> dict:
+    """
+    Build database settings from defaults, the INI file and the environment
+
+    Environment variables (ROADEYE_DB_HOST, ROADEYE_DB_NAME, ROADEYE_DB_USER,
+    ROADEYE_DB_PASSWORD, ROADEYE_DB_POOL_SIZE, ROADEYE_DB_MAX_IDLE,
+    ROADEYE_DB_HEALTH_CHECK, ROADEYE_DB_CACHE_SIZE, ROADEYE_DB_CACHE_TTL,
+    ROADEYE_DB_ID_BLOCK_SIZE) take precedence over the file.
+    """
+    config = dict(DEFAULT_DATABASE_CONFIG)
+
+    path = config_path or os.environ.get('ROADEYE_CONFIG', DEFAULT_CONFIG_FILE)
+    parser = configparser.ConfigParser()
+    if parser.read(path) and parser.has_section('database'):
+        for key in config:
+            if parser.has_option('database', key):
+                config[key] = parser.get('database', key)
+
+    env_keys = {
+        'host': 'ROADEYE_DB_HOST',
+        'database': 'ROADEYE_DB_NAME',
+        'user': 'ROADEYE_DB_USER',
+        'password': 'ROADEYE_DB_PASSWORD',
+        'pool_size': 'ROADEYE_DB_POOL_SIZE',
+        'max_idle_time': 'ROADEYE_DB_MAX_IDLE',
+        'health_check_interval': 'ROADEYE_DB_HEALTH_CHECK',
+        'cache_size': 'ROADEYE_DB_CACHE_SIZE',
+        'cache_ttl': 'ROADEYE_DB_CACHE_TTL',
+        'id_block_size': 'ROADEYE_DB_ID_BLOCK_SIZE'
+    }
+    for key, env_name in env_keys.items():
+        if env_name in os.environ:
+            config[key] = os.environ[env_name]
+
+    config['pool_size'] = int(config['pool_size'])
+    config['max_idle_time'] = float(config['max_idle_time'])
+    config['health_check_interval'] = float(config['health_check_interval'])
+    config['cache_size'] = int(config['cache_size'])
+    config['cache_ttl'] = float(config['cache_ttl'])
+    config['id_block_size'] = int(config['id_block_size'])
+    return config
+
+
+def get_shared_database():
+    """Return the application-wide Database, creating it from config on first use"""
+    global _shared_database
+    with _shared_database_lock:
+        if _shared_database is None:
+            _shared_database = Database.from_config()
+        return _shared_database
+
+
+class PoolExhaustedError(Error):
+    """Raised when no pooled connection becomes available in time"""
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of MySQL connections with health checks"""
+
+    def __init__(self, connect_args: dict, pool_size: int = 6, max_idle_time: float = 300.0,
+                 health_check_interval: float = 30.0, acquire_timeout: float = 10.0):
+        self.connect_args = connect_args
+        self.pool_size = pool_size
+        self.max_idle_time = max_idle_time
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._idle = deque()  # (connection, returned_at)
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def _open(self):
+        """Open a brand new connection to the server"""
+        return mysql.connector.connect(**self.connect_args)
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Error:
+            pass
+
+    def _is_healthy(self, connection, idle_for: float) -> bool:
+        """Return True if an idle connection can be handed out again"""
+        if idle_for > self.max_idle_time:
+            return False
+        if idle_for < self.health_check_interval:
+            return True
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    def acquire(self):
+        """Borrow a connection, reusing an idle one when it is still healthy"""
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise PoolExhaustedError(msg="Connection pool exhausted")
+
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+                    connection, returned_at = self._idle.pop()
+
+                if self._is_healthy(connection, time.monotonic() - returned_at):
+                    return connection
+                self._close_quietly(connection)
+
+            return self._open()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, connection, discard: bool = False):
+        """Return a borrowed connection to the pool"""
+        try:
+            if not discard:
+                try:
+                    # End any read snapshot so the next borrower sees fresh data
+                    if connection.in_transaction:
+                        connection.rollback()
+                except Error:
+                    discard = True
+
+            if discard:
+                self._close_quietly(connection)
+            else:
+                with self._lock:
+                    self._idle.append((connection, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def close_all(self):
+        """Close every idle connection held by the pool"""
+        with self._lock:
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._close_quietly(connection)
+
 
 class Database:
     """Database connection and operations handler"""
 
-    def __init__(self, host='localhost', database='RoadEyeDB', user='root', password=''):
+    def __init__(self, host='localhost', database='RoadEyeDB', user='root', password='',
+                 pool_size=6, max_idle_time=300.0, health_check_interval=30.0,
+                 cache_size=256, cache_ttl=60.0, id_block_size=10):
         self.host = host
         self.database = database
         self.user = user
         self.password = password
-        self.connection = None
+        self.pool = ConnectionPool(
+            {
+                'host': host,
+                'database': database,
+                'user': user,
+                'password': password
+            },
+            pool_size=pool_size,
+            max_idle_time=max_idle_time,
+            health_check_interval=health_check_interval
+        )
+        # Read-query results shared by every model using this Database
+        self.query_cache = QueryCache(max_entries=cache_size, ttl=cache_ttl)
+        # New record IDs, reserved from id_sequences a block at a time
+        self.id_allocator = IdAllocator(self, block_size=id_block_size)
+
+    @classmethod
+    def from_config(cls, config_path: str = None):
+        """Create a Database from the INI file and environment settings"""
+        return cls(**load_database_config(config_path))
 
-    def connect(self):
-        """Establish connection to MySQL database"""
+    @contextmanager
+    def get_connection(self):
+        """
+        Borrow a pooled connection for the duration of a with-block
+
+        Uncommitted work is rolled back if the block raises, and the
+        connection is always handed back to the pool afterwards.
+        """
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
-
-            if self.connection.is_connected():
-                return True
+            connection = self.pool.acquire()
         except Error as e:
             print(f"Database connection error: {e}")
-            return False
-        return False
-
-    def disconnect(self):
-        """Close database connection"""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-
-    def check_and_migrate(self):
-        """Check if database needs migration and apply it"""
-        if not self.connect():
-            return False, "Database connection failed"
+            self.query_cache.note_failure()
+            raise
 
+        discard = False
         try:
-            cursor = self.connection.cursor()
-
-            # Check if IsDeleted column exists in violations table
-            cursor.execute("""
-                SELECT COUNT(*)
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = %s
-                  AND TABLE_NAME = 'violations'
-                  AND COLUMN_NAME = 'IsDeleted'
-            """, (self.database,))
-
-            exists = cursor.fetchone()[0]
-
-            if not exists:
-                print("Applying database migration: Adding IsDeleted column...")
-                cursor.execute("""
-                    ALTER TABLE violations
-                    ADD COLUMN IsDeleted TINYINT(1) DEFAULT 0
-                """)
-                cursor.execute("UPDATE violations SET IsDeleted = 0 WHERE IsDeleted IS NULL")
-                self.connection.commit()
-                print("✅ Migration completed successfully")
-
-            cursor.close()
-            self.disconnect()
-            return True, "Database is up to date"
+            yield connection
+        except Exception:
+            # Keeps an error fallback returned by a @cached_query method out of the cache
+            self.query_cache.note_failure()
+            try:
+                connection.rollback()
+            except Error:
+                discard = True
+            raise
+        finally:
+            self.pool.release(connection, discard=discard)
 
-        except Error as e:
-            if self.connection:
-                self.connection.rollback()
-            self.disconnect()
-            return False, f"Migration error: {str(e)}"
+    def close(self):
+        """Close all pooled connections"""
+        self.pool.close_all()
+
+    def check_and_migrate(self):
+        """Apply any pending versioned schema migrations (see Models/SchemaMigrations.py)"""
+        # Imported here: the migrations module depends on this one
+        from Models.SchemaMigrations import SchemaMigrator
+        result = SchemaMigrator(self).migrate()
+        # Results read before the schema changed may no longer be valid
+        self.query_cache.clear()
+        return result
 
     def log_activity(self, user_id, action, table_affected=None, record_id=None, ip_address=None):
         """Log user activity"""
-        if not self.connect():
-            return False
-
         try:
-            cursor = self.connection.cursor()
+            with self.get_connection() as connection:
+                cursor = connection.cursor()
 
-            query = """
-                INSERT INTO activity_logs (UserID, Action, TableAffected, RecordID, IPAddress)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            cursor.execute(query, (user_id, action, table_affected, record_id, ip_address))
-            self.connection.commit()
+                query = """
+                    INSERT INTO activity_logs (UserID, Action, TableAffected, RecordID, IPAddress)
+                    VALUES (%s, %s, %s, %s, %s)
+                """
+                cursor.execute(query, (user_id, action, table_affected, record_id, ip_address))
+                connection.commit()
 
-            cursor.close()
-            self.disconnect()
+                cursor.close()
             return True
 
         except Error as e:
-            self.disconnect()
             print(f"Activity log error: {e}")
             return False
 
     def get_violation_types_table_name(self):
         """Get the correct name of the violation types table"""
-        if not self.connect():
-            return None
-
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute("SHOW TABLES LIKE '%violation%type%'")
-            tables = cursor.fetchall()
+            with self.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute("SHOW TABLES LIKE '%violation%type%'")
+                tables = cursor.fetchall()
+                cursor.close()
 
             for table in tables:
                 table_name = list(table.values())[0].lower()
                 if 'violation' in table_name and 'type' in table_name:
-                    actual_name = list(table.values())[0]
-                    cursor.close()
-                    self.disconnect()
-                    return actual_name
+                    return list(table.values())[0]
 
-            cursor.close()
-            self.disconnect()
             return None
         except Error as e:
             print(f"Error finding violation types table: {e}")
-            self.disconnect()
-            return None
\ No newline at end of file
+            return None
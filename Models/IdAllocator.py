@@ -0,0 +1,123 @@
+"""
+Models/IdAllocator.py
+Collision-free record IDs from the id_sequences table
+
+Each sequence is one row holding the next free number. A process
+reserves a block of numbers with a single atomic UPDATE on its own
+connection, committed at once, then hands them out from memory until
+the block runs out. Two processes never receive the same number and no
+table is scanned to find the next one. Numbers left in a block when the
+process exits are never used, so IDs are unique but not gapless.
+
+Allocate IDs before opening the write transaction that uses them: a
+refill borrows a pooled connection of its own.
+"""
+import threading
+
+from mysql.connector import Error
+
+
+# Sequence name -> (table, ID column, prefix)
+ID_SEQUENCES = {
+    'users': ('users', 'UserID', 'U'),
+    'residents': ('residents', 'ResidentID', 'R'),
+    'vehicles': ('vehicles', 'VehicleID', 'VH'),
+    'violations': ('violations', 'ViolationID', 'V'),
+    'payments': ('payments', 'PaymentID', 'P'),
+}
+
+ID_SEQUENCES_SQL = """
+    CREATE TABLE IF NOT EXISTS id_sequences (
+        Name VARCHAR(32) NOT NULL PRIMARY KEY,
+        NextValue BIGINT NOT NULL
+    ) ENGINE=InnoDB
+"""
+
+
+def format_id(prefix: str, number: int) -> str:
+    """Record ID in the existing style (V001, VH012, ... V1000)"""
+    return f"{prefix}{str(number).zfill(3)}"
+
+
+def seed_sequence(cursor, name: str):
+    """Start a sequence after the highest ID already in its table (no-op if it exists)"""
+    table, column, prefix = ID_SEQUENCES[name]
+    cursor.execute(f"""
+        INSERT IGNORE INTO id_sequences (Name, NextValue)
+        SELECT %s, COALESCE(MAX(CAST(SUBSTRING(`{column}`, %s) AS UNSIGNED)), 0) + 1
+        FROM `{table}`
+    """, (name, len(prefix) + 1))
+
+
+def reserve_numbers(cursor, name: str, size: int) -> tuple:
+    """
+    Claim the next size numbers of a sequence on the caller's cursor
+
+    The caller commits straight away, so the row lock is held briefly.
+
+    Returns:
+        tuple: (first number, end) - end is exclusive
+    """
+    for attempt in range(2):
+        # LAST_INSERT_ID(expr) hands the new value back to this session only
+        cursor.execute(
+            "UPDATE id_sequences SET NextValue = LAST_INSERT_ID(NextValue + %s) WHERE Name = %s",
+            (size, name)
+        )
+        if cursor.rowcount:
+            break
+        if attempt:
+            raise Error(msg=f"ID sequence '{name}' could not be created")
+        seed_sequence(cursor, name)
+    cursor.execute("SELECT LAST_INSERT_ID()")
+    end = int(cursor.fetchone()[0])
+    return end - size, end
+
+
+class IdAllocator:
+    """Per-process cache of reserved ID blocks, shared by every model using a Database"""
+
+    def __init__(self, db, block_size: int = 10):
+        self.db = db
+        self.block_size = max(1, block_size)
+        self._blocks = {}  # name -> [next number, end of block (exclusive)]
+        self._lock = threading.Lock()
+
+    def next_id(self, name: str) -> str:
+        """One new ID for the sequence (e.g. 'violations' -> 'V1043')"""
+        return self.next_ids(name, 1)[0]
+
+    def next_ids(self, name: str, count: int) -> list:
+        """
+        count new IDs for the sequence, in increasing order
+
+        Raises:
+            mysql.connector.Error: The sequence could not be reserved
+        """
+        prefix = ID_SEQUENCES[name][2]
+        numbers = []
+        with self._lock:
+            block = self._blocks.get(name)
+            while len(numbers) < count:
+                if block is None or block[0] >= block[1]:
+                    # Large requests reserve what they need in one round trip
+                    block = self._reserve(name, max(self.block_size, count - len(numbers)))
+                    self._blocks[name] = block
+                take = min(count - len(numbers), block[1] - block[0])
+                numbers.extend(range(block[0], block[0] + take))
+                block[0] += take
+        return [format_id(prefix, number) for number in numbers]
+
+    def reset(self):
+        """Forget the cached blocks (their unused numbers are skipped)"""
+        with self._lock:
+            self._blocks.clear()
+
+    def _reserve(self, name: str, size: int) -> list:
+        """Atomically claim the next size numbers of a sequence"""
+        with self.db.get_connection() as connection:
+            cursor = connection.cursor()
+            first, end = reserve_numbers(cursor, name, size)
+            connection.commit()
+            cursor.close()
+        return [first, end]
@@ -3,6 +3,9 @@ Models/PaymentModel.py
 Payment data operations
 """
 from Models.Database import Database
+from Models.QueryCache import cached_query
+from Models.DashboardSummaryModel import DashboardSummaryModel
+from Models.ChangeFeedModel import ChangeFeedModel
 from mysql.connector import Error
 from datetime import datetime
 import random
@@ -24,57 +27,62 @@ class PaymentModel:
     def save_payment(self, violation_id: str, payment_type: str, amount: float,
                     payer_name: str, contact: str, reference: str = None):
         """Save payment to database"""
-        if not self.db.connect():
-            return False, "Database connection failed"
-
         try:
-            cursor = self.db.connection.cursor()
-
-            # Generate receipt number
-            receipt_no = self.generate_receipt_number()
-
-            # Get next PaymentID
-            cursor.execute("SELECT PaymentID FROM payments ORDER BY PaymentID DESC LIMIT 1")
-            last_payment = cursor.fetchone()
-            if last_payment:
-                last_num = int(last_payment[0][1:])
-                new_payment_id = f"P{str(last_num + 1).zfill(3)}"
-            else:
-                new_payment_id = "P001"
-
-            # Check if payment already exists for this violation
-            cursor.execute(
-                "SELECT PaymentID FROM payments WHERE ViolationID = %s",
-                (violation_id,)
-            )
-            existing_payment = cursor.fetchone()
-
-            if existing_payment:
-                # Update existing payment
-                query = """
-                    UPDATE payments
-                    SET Status = 'PAID',
-                        PaymentType = %s,
-                        AmountPaid = %s,
-                        PaymentDate = NOW(),
-                        ReceiptNo = %s
-                    WHERE ViolationID = %s
-                """
-                cursor.execute(query, (payment_type, amount, receipt_no, violation_id))
-            else:
-                # Insert new payment
-                query = """
-                    INSERT INTO payments
-                    (PaymentID, ViolationID, PaymentType, ReceiptNo, AmountPaid, PaymentDate, Status)
-                    VALUES (%s, %s, %s, %s, %s, NOW(), 'PAID')
-                """
-                cursor.execute(query, (new_payment_id, violation_id, payment_type,
-                                      receipt_no, amount))
-
-            self.db.connection.commit()
-            cursor.close()
-            self.db.disconnect()
-
+            # A new payment row needs an ID, reserved before the write
+            # transaction starts (see Models/IdAllocator.py). Payment rows are
+            # never deleted, so a row found here is still there below.
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("SELECT 1 FROM payments WHERE ViolationID = %s", (violation_id,))
+                has_payment = cursor.fetchone() is not None
+                cursor.close()
+            new_payment_id = None if has_payment else self.db.id_allocator.next_id('payments')
+
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+
+                # Generate receipt number
+                receipt_no = self.generate_receipt_number()
+
+                # Check again: another client may have added the payment since
+                cursor.execute(
+                    "SELECT PaymentID, Status FROM payments WHERE ViolationID = %s",
+                    (violation_id,)
+                )
+                existing_payment = cursor.fetchone()
+
+                if existing_payment:
+                    # Update existing payment
+                    query = """
+                        UPDATE payments
+                        SET Status = 'PAID',
+                            PaymentType = %s,
+                            AmountPaid = %s,
+                            PaymentDate = NOW(),
+                            ReceiptNo = %s
+                        WHERE ViolationID = %s
+                    """
+                    cursor.execute(query, (payment_type, amount, receipt_no, violation_id))
+                else:
+                    # Insert new payment
+                    query = """
+                        INSERT INTO payments
+                        (PaymentID, ViolationID, PaymentType, ReceiptNo, AmountPaid, PaymentDate, Status)
+                        VALUES (%s, %s, %s, %s, %s, NOW(), 'PAID')
+                    """
+                    cursor.execute(query, (new_payment_id, violation_id, payment_type,
+                                          receipt_no, amount))
+
+                if not existing_payment or existing_payment[1] != 'PAID':
+                    DashboardSummaryModel.record_payment(cursor, violation_id)
+                ChangeFeedModel.record_change(
+                    cursor, 'payments', violation_id, 'UPDATE' if existing_payment else 'INSERT'
+                )
+
+                connection.commit()
+                cursor.close()
+
+            self.db.query_cache.invalidate('payments', 'dashboard_summary')
             return True, {
                 'violation_id': violation_id,
                 'receipt_no': receipt_no,
@@ -86,131 +94,112 @@ class PaymentModel:
 
         except Exception as e:
             print(f"Payment save error: {e}")
-            if self.db.connection:
-                self.db.connection.rollback()
-            self.db.disconnect()
             return False, str(e)
 
+    @cached_query('payments', 'violations', 'vehicles')
     def get_payment_history(self, resident_id: str):
         """Load payment history for a resident"""
-        if not self.db.connect():
-            return []
-
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            query = """
-                SELECT p.PaymentID,
-                       p.ViolationID,
-                       p.PaymentType,
-                       p.AmountPaid,
-                       DATE_FORMAT(p.PaymentDate, '%Y-%m-%d') as payment_date,
-                       p.ReceiptNo
-                FROM payments p
-                INNER JOIN violations v ON p.ViolationID = v.ViolationID
-                INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                WHERE vh.ResidentID = %s
-                  AND p.Status = 'PAID'
-                ORDER BY p.PaymentDate DESC
-            """
-            cursor.execute(query, (resident_id,))
-            results = cursor.fetchall()
-
-            cursor.close()
-            self.db.disconnect()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                query = """
+                    SELECT p.PaymentID,
+                           p.ViolationID,
+                           p.PaymentType,
+                           p.AmountPaid,
+                           DATE_FORMAT(p.PaymentDate, '%Y-%m-%d') as payment_date,
+                           p.ReceiptNo
+                    FROM payments p
+                    INNER JOIN violations v ON p.ViolationID = v.ViolationID
+                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                    WHERE vh.ResidentID = %s
+                      AND p.Status = 'PAID'
+                    ORDER BY p.PaymentDate DESC
+                """
+                cursor.execute(query, (resident_id,))
+                results = cursor.fetchall()
+
+                cursor.close()
 
             return results
 
         except Exception as e:
             print(f"Payment history error: {e}")
-            self.db.disconnect()
             return []
 
+    @cached_query('payments', 'violations', 'vehicles', 'residents', 'violation_types')
     def get_all_payment_history(self, limit: int = 10):
         """Get recent payment history (for admin)"""
-        if not self.db.connect():
-            return []
-
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            query = """
-                SELECT p.PaymentID,
-                       v.ViolationID,
-                       CONCAT(r.RFirstName, ' ', r.RLastName) as resident_name,
-                       vt.ViolationName,
-                       vt.FineAmount,
-                       DATE_FORMAT(p.PaymentDate, '%Y-%m-%d') as payment_date
-                FROM payments p
-                INNER JOIN violations v ON p.ViolationID = v.ViolationID
-                INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                INNER JOIN residents r ON vh.ResidentID = r.ResidentID
-                INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
-                WHERE p.Status = 'PAID'
-                  AND v.IsDeleted = 0
-                ORDER BY p.PaymentDate DESC LIMIT %s
-            """
-            cursor.execute(query, (limit,))
-            results = cursor.fetchall()
-
-            cursor.close()
-            self.db.disconnect()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                query = """
+                    SELECT p.PaymentID,
+                           v.ViolationID,
+                           CONCAT(r.RFirstName, ' ', r.RLastName) as resident_name,
+                           vt.ViolationName,
+                           vt.FineAmount,
+                           DATE_FORMAT(p.PaymentDate, '%Y-%m-%d') as payment_date
+                    FROM payments p
+                    INNER JOIN violations v ON p.ViolationID = v.ViolationID
+                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                    INNER JOIN residents r ON vh.ResidentID = r.ResidentID
+                    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                    WHERE p.Status = 'PAID'
+                      AND v.IsDeleted = 0
+                    ORDER BY p.PaymentDate DESC LIMIT %s
+                """
+                cursor.execute(query, (limit,))
+                results = cursor.fetchall()
+
+                cursor.close()
 
             return results
 
         except Exception as e:
             print(f"Payment history error: {e}")
-            self.db.disconnect()
             return []
 
+    @cached_query('violations', 'vehicles', 'residents', 'violation_types', 'payments')
     def get_payment_statistics(self):
         """Get payment statistics for admin dashboard"""
-        if not self.db.connect():
-            return {
-                'total_violations': 0,
-                'paid_count': 0,
-                'unpaid_count': 0,
-                'total_revenue': 0.0,
-                'pending_revenue': 0.0
-            }
-
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            query = """
-                SELECT v.ViolationID,
-                       vt.FineAmount,
-                       COALESCE(p.Status, 'UNPAID') as PaymentStatus
-                FROM violations v
-                INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                INNER JOIN residents r ON vh.ResidentID = r.ResidentID
-                INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
-                LEFT JOIN payments p ON v.ViolationID = p.ViolationID
-                WHERE v.IsDeleted = 0
-            """
-            cursor.execute(query)
-            results = cursor.fetchall()
-
-            cursor.close()
-            self.db.disconnect()
-
-            total_violations = len(results)
-            paid_count = sum(1 for v in results if v['PaymentStatus'] == 'PAID')
-            unpaid_count = total_violations - paid_count
-            total_revenue = sum(float(v['FineAmount']) for v in results if v['PaymentStatus'] == 'PAID')
-            pending_revenue = sum(float(v['FineAmount']) for v in results if v['PaymentStatus'] != 'PAID')
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                # Aggregate in one pass on the server instead of shipping every row
+                query = """
+                    SELECT COUNT(*) as total_violations,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN 1 ELSE 0 END), 0) as paid_count,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN vt.FineAmount ELSE 0 END), 0) as total_revenue,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN 0 ELSE vt.FineAmount END), 0) as pending_revenue
+                    FROM violations v
+                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                    INNER JOIN residents r ON vh.ResidentID = r.ResidentID
+                    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                    WHERE v.IsDeleted = 0
+                """
+                cursor.execute(query)
+                result = cursor.fetchone()
+
+                cursor.close()
+
+            total_violations = int(result['total_violations'])
+            paid_count = int(result['paid_count'])
 
             return {
                 'total_violations': total_violations,
                 'paid_count': paid_count,
-                'unpaid_count': unpaid_count,
-                'total_revenue': total_revenue,
-                'pending_revenue': pending_revenue
+                'unpaid_count': total_violations - paid_count,
+                'total_revenue': float(result['total_revenue']),
+                'pending_revenue': float(result['pending_revenue'])
             }
 
         except Exception as e:
             print(f"Payment stats error: {e}")
-            self.db.disconnect()
             return {
                 'total_violations': 0,
                 'paid_count': 0,
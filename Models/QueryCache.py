@@ -0,0 +1,166 @@
+"""
+Models/QueryCache.py
+In-process cache for model read queries
+
+Read methods decorated with @cached_query keep their result in the
+Database's QueryCache, keyed by method and arguments and tagged with the
+tables the query reads. Write methods call invalidate() with the tables
+they changed, which drops only the entries that read those tables.
+Entries also expire after a TTL, and the least recently used entry is
+evicted once the cache is full.
+
+Cached results are shared between callers and must not be modified.
+"""
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+
+class _Entry:
+    __slots__ = ('value', 'tables', 'expires_at')
+
+    def __init__(self, value, tables: tuple, expires_at: float):
+        self.value = value
+        self.tables = tables
+        self.expires_at = expires_at
+
+
+class QueryCache:
+    """Thread-safe LRU cache with per-entry TTL and table-based invalidation"""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by invalidate(); a load that saw an older version is not stored
+        self._table_versions = {}
+        self._failures = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    # ---------- lookups ----------
+    def get(self, key):
+        """
+        Returns:
+            tuple: (found: bool, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def table_versions(self, tables: tuple) -> tuple:
+        """Snapshot to pass to put(), taken before the query runs"""
+        with self._lock:
+            return tuple(self._table_versions.get(table, 0) for table in tables)
+
+    def put(self, key, value, tables: tuple, versions: tuple = None, ttl: float = None):
+        """Store a result unless one of its tables was invalidated since versions"""
+        with self._lock:
+            if versions is not None and versions != tuple(
+                    self._table_versions.get(table, 0) for table in tables):
+                return
+            expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+            self._entries[key] = _Entry(value, tables, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    # ---------- invalidation ----------
+    def invalidate(self, *tables) -> int:
+        """Drop every entry that read one of the tables; returns how many"""
+        changed = set(tables)
+        with self._lock:
+            for table in changed:
+                self._table_versions[table] = self._table_versions.get(table, 0) + 1
+            stale = [key for key, entry in self._entries.items() if changed.intersection(entry.tables)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # ---------- failed loads ----------
+    def note_failure(self):
+        """Called by Database.get_connection when a query fails on this thread"""
+        self._failures.count = self.failure_count() + 1
+
+    def failure_count(self) -> int:
+        return getattr(self._failures, 'count', 0)
+
+    # ---------- diagnostics ----------
+    def stats(self) -> dict:
+        """Counters for a diagnostics view"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = 0
+            self.evictions = self.expirations = self.invalidations = 0
+
+
+def cached_query(*tables, ttl: float = None):
+    """
+    Cache a model read method in self.db.query_cache
+
+    Args:
+        tables: Tables the query reads (what invalidate() is called with)
+        ttl: Seconds to keep the result (default: the cache's TTL)
+
+    A result is not stored when a query failed while loading it (the
+    method returned its error fallback) or when one of the tables was
+    invalidated while it was loading.
+    """
+    def decorator(method):
+        name = method.__qualname__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = self.db.query_cache
+            key = (name, args, tuple(sorted(kwargs.items())))
+            try:
+                found, value = cache.get(key)
+            except TypeError:
+                # Unhashable arguments: not cacheable
+                return method(self, *args, **kwargs)
+            if found:
+                return value
+
+            versions = cache.table_versions(tables)
+            failures = cache.failure_count()
+            value = method(self, *args, **kwargs)
+            if cache.failure_count() == failures:
+                cache.put(key, value, tables, versions, ttl)
+            return value
+
+        return wrapper
+    return decorator
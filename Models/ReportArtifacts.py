@@ -0,0 +1,225 @@
+"""
+Models/ReportArtifacts.py
+On-disk cache of pre-built reports
+
+A report artifact is a data snapshot (gzip-compressed JSON, with tables
+stored column by column) and, for the reports that can be exported, the
+PDF built from the same data. Each artifact is stored under its report
+name and a tag: the data version it was built at (see
+ReportModel.get_data_version) plus the report's period where it has one.
+Only the latest tag of each report is kept. A lookup with the current
+tag finds exactly what a fresh build would produce; any write moves the
+version on, so older artifacts are never served.
+
+Files are written to a temporary name and renamed into place, so a
+report being rebuilt by precompute_reports.py can be read meanwhile.
+"""
+import glob
+import gzip
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+
+
+# Next to the project root; the ROADEYE_REPORT_CACHE environment variable points elsewhere instead
+DEFAULT_ARTIFACT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'report_cache')
+
+SNAPSHOT_SUFFIX = '.json.gz'
+PDF_SUFFIX = '.pdf'
+
+# Snapshots are read far more often than written; favour write speed over size
+SNAPSHOT_COMPRESSION = 1
+
+# Column types stored as text in a snapshot table: type -> (encode, decode)
+_COLUMN_TYPES = {
+    'decimal': (str, Decimal),
+    'datetime': (datetime.isoformat, datetime.fromisoformat),
+    'date': (date.isoformat, date.fromisoformat),
+}
+
+
+def _column_type(values: list):
+    """Snapshot column type shared by every non-None value (None: stored as JSON)"""
+    kinds = {type(value) for value in values if value is not None}
+    if kinds == {Decimal}:
+        return 'decimal'
+    if kinds == {datetime}:
+        return 'datetime'
+    if kinds == {date}:
+        return 'date'
+    return None
+
+
+def _is_table(value) -> bool:
+    """Rows as returned by a dictionary cursor: dicts that all have the same keys"""
+    if not value or not isinstance(value[0], dict):
+        return False
+    keys = value[0].keys()
+    return all(isinstance(row, dict) and row.keys() == keys for row in value)
+
+
+def encode_snapshot(value):
+    """
+    JSON-compatible form of a report's data
+
+    Lists of rows become {'$table': {'columns', 'types', 'values'}} with
+    one list of values per column; Decimal, date and datetime values are
+    tagged ({'$decimal': '500.00'}) or, in tables, typed per column.
+    Tuples come back as lists.
+    """
+    if isinstance(value, (list, tuple)):
+        if _is_table(value):
+            columns = list(value[0])
+            types = []
+            encoded = []
+            for column in columns:
+                values = [row[column] for row in value]
+                column_type = _column_type(values)
+                if column_type is None:
+                    encoded.append([encode_snapshot(item) for item in values])
+                else:
+                    encode = _COLUMN_TYPES[column_type][0]
+                    encoded.append([None if item is None else encode(item) for item in values])
+                types.append(column_type)
+            return {'$table': {'columns': columns, 'types': types, 'values': encoded}}
+        return [encode_snapshot(item) for item in value]
+    if isinstance(value, dict):
+        for key in value:
+            if not isinstance(key, str) or key.startswith('$'):
+                raise TypeError(f"Cannot store dictionary key {key!r} in a snapshot")
+        return {key: encode_snapshot(item) for key, item in value.items()}
+    if isinstance(value, Decimal):
+        return {'$decimal': str(value)}
+    if isinstance(value, datetime):
+        return {'$datetime': value.isoformat()}
+    if isinstance(value, date):
+        return {'$date': value.isoformat()}
+    return value
+
+
+def decode_snapshot(value):
+    """Inverse of encode_snapshot"""
+    if isinstance(value, list):
+        return [decode_snapshot(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        (tag, content), = value.items()
+        if tag == '$table':
+            columns = []
+            for column_type, values in zip(content['types'], content['values']):
+                if column_type is None:
+                    columns.append([decode_snapshot(item) for item in values])
+                else:
+                    decode = _COLUMN_TYPES[column_type][1]
+                    columns.append([None if item is None else decode(item) for item in values])
+            names = content['columns']
+            return [dict(zip(names, row)) for row in zip(*columns)]
+        if tag == '$decimal':
+            return Decimal(content)
+        if tag == '$datetime':
+            return datetime.fromisoformat(content)
+        if tag == '$date':
+            return date.fromisoformat(content)
+    return {key: decode_snapshot(item) for key, item in value.items()}
+
+
+def _safe(text: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_-]+', '-', str(text))
+
+
+class ReportArtifactStore:
+    """Report snapshots and PDFs in one directory, latest tag per report"""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or os.environ.get('ROADEYE_REPORT_CACHE', DEFAULT_ARTIFACT_DIR)
+
+    def _path(self, name: str, tag: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{_safe(name)}@{_safe(tag)}{suffix}")
+
+    # ---------- snapshots ----------
+    def has_snapshot(self, name: str, tag: str) -> bool:
+        return os.path.exists(self._path(name, tag, SNAPSHOT_SUFFIX))
+
+    def load_snapshot(self, name: str, tag: str):
+        """
+        Returns:
+            tuple: (found: bool, data)
+        """
+        path = self._path(name, tag, SNAPSHOT_SUFFIX)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as handle:
+                return True, decode_snapshot(json.load(handle))
+        except FileNotFoundError:
+            return False, None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Report snapshot read error ({os.path.basename(path)}): {e}")
+            return False, None
+
+    def save_snapshot(self, name: str, tag: str, data) -> bool:
+        """Store data as the report's snapshot for tag, replacing older tags"""
+        def write(temp_path):
+            with gzip.open(temp_path, 'wt', encoding='utf-8', compresslevel=SNAPSHOT_COMPRESSION) as handle:
+                json.dump(encode_snapshot(data), handle, separators=(',', ':'))
+
+        return self._replace(name, tag, SNAPSHOT_SUFFIX, write)
+
+    # ---------- PDFs ----------
+    def has_pdf(self, name: str, tag: str) -> bool:
+        return os.path.exists(self._path(name, tag, PDF_SUFFIX))
+
+    def copy_pdf(self, name: str, tag: str, file_path: str) -> bool:
+        """Copy the report's PDF for tag to file_path; False if there is none"""
+        try:
+            shutil.copyfile(self._path(name, tag, PDF_SUFFIX), file_path)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            print(f"Report PDF copy error: {e}")
+            return False
+
+    def save_pdf(self, name: str, tag: str, source_path: str) -> bool:
+        """Store a copy of a generated PDF as the report's PDF for tag, replacing older tags"""
+        return self._replace(name, tag, PDF_SUFFIX, lambda temp_path: shutil.copyfile(source_path, temp_path))
+
+    # ---------- housekeeping ----------
+    def _replace(self, name: str, tag: str, suffix: str, write) -> bool:
+        path = self._path(name, tag, suffix)
+        temp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{_safe(name)}-", suffix='.tmp')
+            os.close(fd)
+            write(temp_path)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Report artifact write error ({os.path.basename(path)}): {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+        for stale in glob.glob(os.path.join(glob.escape(self.directory), f"{_safe(name)}@*{suffix}")):
+            if stale != path:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    # Still open in another process (Windows); removed on a later rebuild
+                    pass
+        return True
+
+    def clear(self) -> int:
+        """Delete every stored artifact; returns how many files were removed"""
+        removed = 0
+        for suffix in (SNAPSHOT_SUFFIX, PDF_SUFFIX):
+            for path in glob.glob(os.path.join(glob.escape(self.directory), f"*@*{suffix}")):
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError as e:
+                    print(f"Report artifact delete error: {e}")
+        return removed
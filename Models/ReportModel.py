@@ -2,103 +2,313 @@
 Models/ReportModel.py
 Report generation data operations (IMPROVED VERSION)
 """
+from datetime import date
+from itertools import accumulate
+
 from Models.Database import Database
+from Models.QueryCache import cached_query
+from Models.TimeBuckets import bucket_positions, bucket_sql, bucket_starts, check_granularity
 from mysql.connector import Error
 
 
+# Violations report rows; PaymentDate is only filled in when the fine is PAID
+VIOLATIONS_REPORT_QUERY = """
+    SELECT v.ViolationID,
+           CONCAT(r.RFirstName, ' ', r.RLastName) as ResidentName,
+           r.ContactNo,
+           vh.PlateNo,
+           vh.Brand,
+           vh.Model,
+           vt.ViolationName,
+           vt.FineAmount,
+           DATE_FORMAT(v.ViolationDate, '%Y-%m-%d') as ViolationDate,
+           COALESCE(p.Status, 'UNPAID') as PaymentStatus,
+           CASE 
+               WHEN p.Status = 'PAID' THEN DATE_FORMAT(p.PaymentDate, '%Y-%m-%d')
+               ELSE NULL
+           END as PaymentDate
+    FROM violations v
+    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+    INNER JOIN residents r ON vh.ResidentID = r.ResidentID
+    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+    WHERE v.IsDeleted = 0
+    ORDER BY v.ViolationDate DESC
+"""
+
+# Rows fetched per round trip when streaming the violations report
+REPORT_FETCH_SIZE = 2000
+
+# Days-to-pay histogram: MySQL INTERVAL() puts a payment in bin i when it
+# took at least DAYS_TO_PAY_BIN_EDGES[i - 1] days (bin 0: same day)
+DAYS_TO_PAY_BIN_EDGES = (1, 8, 15, 31, 61, 91)
+DAYS_TO_PAY_BIN_LABELS = ("Same day", "1-7 days", "8-14 days", "15-30 days",
+                          "31-60 days", "61-90 days", "Over 90 days")
+
+# Paid fines collected in the period, joined to the violation they settle
+_COLLECTED_PAYMENTS = """
+    FROM payments p
+    INNER JOIN violations v ON p.ViolationID = v.ViolationID
+    WHERE p.Status = 'PAID'
+      AND v.IsDeleted = 0
+      AND p.PaymentDate >= %s
+      AND p.PaymentDate < %s
+"""
+
+
+def _rate(part: float, whole: float):
+    return part / whole if whole else None
+
+
 class ReportModel:
     """Handles all report-related database queries"""
 
     def __init__(self, db: Database):
         self.db = db
 
+    def get_data_version(self):
+        """
+        Version of the data the reports read, for keying pre-built reports
+
+        The change log's latest ChangeID moves with every write the
+        application makes. The violation and payment id_sequences values
+        also move when rows are loaded around it: populate_database and
+        other loaders reserve their IDs there without writing change_log
+        entries (see Models/IdAllocator.py).
+
+        Returns:
+            str or None: None if the version cannot be read
+        """
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT (SELECT COALESCE(MAX(ChangeID), 0) FROM change_log),
+                           (SELECT COALESCE(MAX(NextValue), 0) FROM id_sequences WHERE Name = 'violations'),
+                           (SELECT COALESCE(MAX(NextValue), 0) FROM id_sequences WHERE Name = 'payments')
+                """)
+                change_id, next_violation, next_payment = cursor.fetchone()
+                cursor.close()
+            return f"{change_id}-{next_violation}-{next_payment}"
+
+        except Error as e:
+            print(f"Report data version error: {e}")
+            return None
+
     def get_violations_report_data(self):
         """Get all violations data for report generation with FIXED payment date logic"""
-        if not self.db.connect():
-            return []
-
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            # IMPROVED QUERY: Only include PaymentDate when status is actually PAID
-            query = """
-                SELECT v.ViolationID,
-                       CONCAT(r.RFirstName, ' ', r.RLastName) as ResidentName,
-                       r.ContactNo,
-                       vh.PlateNo,
-                       vh.Brand,
-                       vh.Model,
-                       vt.ViolationName,
-                       vt.FineAmount,
-                       DATE_FORMAT(v.ViolationDate, '%Y-%m-%d') as ViolationDate,
-                       COALESCE(p.Status, 'UNPAID') as PaymentStatus,
-                       CASE 
-                           WHEN p.Status = 'PAID' THEN DATE_FORMAT(p.PaymentDate, '%Y-%m-%d')
-                           ELSE NULL
-                       END as PaymentDate
-                FROM violations v
-                INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                INNER JOIN residents r ON vh.ResidentID = r.ResidentID
-                INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
-                LEFT JOIN payments p ON v.ViolationID = p.ViolationID
-                WHERE v.IsDeleted = 0
-                ORDER BY v.ViolationDate DESC
-            """
-            cursor.execute(query)
-            results = cursor.fetchall()
-
-            cursor.close()
-            self.db.disconnect()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute(VIOLATIONS_REPORT_QUERY)
+                results = cursor.fetchall()
+
+                cursor.close()
 
             return results
 
         except Exception as e:
             print(f"Report data error: {e}")
-            self.db.disconnect()
             return []
 
-    def get_payment_report_statistics(self):
-        """Get payment statistics for reports"""
-        if not self.db.connect():
+    def iter_violations_report_data(self, chunk_size: int = REPORT_FETCH_SIZE):
+        """
+        Stream the violations report rows without loading them all
+
+        Same rows and order as get_violations_report_data, read from an
+        unbuffered cursor chunk_size rows at a time. The pooled connection
+        is held until the generator is exhausted or closed, so consume it
+        promptly (e.g. straight into the PDF exporter).
+
+        Yields:
+            dict: One violation row
+        """
+        with self.db.get_connection() as connection:
+            cursor = connection.cursor(dictionary=True)
+            finished = False
+            try:
+                cursor.execute(VIOLATIONS_REPORT_QUERY)
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield from rows
+                finished = True
+            finally:
+                if not finished:
+                    # Drops the rows still pending on the server so the connection can be reused
+                    try:
+                        connection.rollback()
+                    except Error:
+                        pass
+                cursor.close()
+
+    @cached_query('payments', 'violations', 'violation_types')
+    def get_revenue_analytics(self, start_date: date, end_date: date, granularity: str = 'month'):
+        """
+        Revenue, collection rate and days-to-pay per day, week or month
+
+        Three grouped queries, each returning one row per bucket (or bin):
+        payments collected per bucket of PaymentDate and PaymentType,
+        the days-to-pay histogram of those payments, and fines issued and
+        since collected per bucket of ViolationDate. Running totals are
+        one pass over the bucket arrays.
+
+        Args:
+            start_date: First day included
+            end_date: First day no longer included
+            granularity: 'day', 'week' or 'month'
+
+        Returns:
+            dict or None (on a database error):
+                granularity, buckets (each bucket's first day) and, one
+                value per bucket: payments, revenue (AmountPaid collected),
+                cumulative_revenue, average_days_to_pay (None without
+                payments), issued_fines and collected_fines (FineAmount of
+                the violations issued in the bucket, and of those since
+                paid), collection_rate and cumulative_collection_rate (None
+                while nothing was issued);
+                revenue_by_type: PaymentType -> revenue per bucket;
+                days_to_pay_histogram: payments per days_to_pay_bins label;
+                totals: payments, revenue, issued_fines, collected_fines,
+                collection_rate and average_days_to_pay over the period
+        """
+        check_granularity(granularity)
+        buckets = bucket_starts(start_date, end_date, granularity)
+        positions = bucket_positions(buckets, granularity)
+        size = len(buckets)
+
+        payments = [0] * size
+        revenue = [0.0] * size
+        days_to_pay = [0] * size
+        revenue_by_type = {}
+        issued = [0.0] * size
+        collected = [0.0] * size
+        histogram = [0] * (len(DAYS_TO_PAY_BIN_EDGES) + 1)
+
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+
+                cursor.execute(f"""
+                    SELECT {bucket_sql('p.PaymentDate', granularity)} as bucket,
+                           p.PaymentType,
+                           COUNT(*) as payments,
+                           SUM(p.AmountPaid) as revenue,
+                           SUM(DATEDIFF(p.PaymentDate, v.ViolationDate)) as days_to_pay
+                    {_COLLECTED_PAYMENTS}
+                    GROUP BY bucket, p.PaymentType
+                """, (start_date, end_date))
+                for bucket, payment_type, count, amount, days in cursor.fetchall():
+                    index = positions.get(int(bucket))
+                    if index is None:
+                        continue
+                    payments[index] += int(count)
+                    revenue[index] += float(amount or 0)
+                    days_to_pay[index] += int(days or 0)
+                    revenue_by_type.setdefault(payment_type, [0.0] * size)[index] += float(amount or 0)
+
+                edges = ', '.join(str(edge) for edge in DAYS_TO_PAY_BIN_EDGES)
+                cursor.execute(f"""
+                    SELECT INTERVAL(DATEDIFF(p.PaymentDate, v.ViolationDate), {edges}) as bin,
+                           COUNT(*) as payments
+                    {_COLLECTED_PAYMENTS}
+                    GROUP BY bin
+                """, (start_date, end_date))
+                for bin_index, count in cursor.fetchall():
+                    histogram[int(bin_index)] += int(count)
+
+                cursor.execute(f"""
+                    SELECT {bucket_sql('v.ViolationDate', granularity)} as bucket,
+                           SUM(vt.FineAmount) as issued,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN vt.FineAmount ELSE 0 END), 0) as collected
+                    FROM violations v
+                    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                    WHERE v.IsDeleted = 0
+                      AND v.ViolationDate >= %s
+                      AND v.ViolationDate < %s
+                    GROUP BY bucket
+                """, (start_date, end_date))
+                for bucket, issued_amount, collected_amount in cursor.fetchall():
+                    index = positions.get(int(bucket))
+                    if index is not None:
+                        issued[index] += float(issued_amount or 0)
+                        collected[index] += float(collected_amount or 0)
+
+                cursor.close()
+
+        except Exception as e:
+            print(f"Revenue analytics error: {e}")
             return None
 
+        cumulative_issued = list(accumulate(issued))
+        cumulative_collected = list(accumulate(collected))
+        total_payments = sum(payments)
+        total_issued = sum(issued)
+        total_collected = sum(collected)
+
+        return {
+            'granularity': granularity,
+            'buckets': tuple(buckets),
+            'payments': tuple(payments),
+            'revenue': tuple(revenue),
+            'cumulative_revenue': tuple(accumulate(revenue)),
+            'average_days_to_pay': tuple(_rate(days, count) for days, count in zip(days_to_pay, payments)),
+            'issued_fines': tuple(issued),
+            'collected_fines': tuple(collected),
+            'collection_rate': tuple(_rate(part, whole) for part, whole in zip(collected, issued)),
+            'cumulative_collection_rate': tuple(
+                _rate(part, whole) for part, whole in zip(cumulative_collected, cumulative_issued)
+            ),
+            'revenue_by_type': {payment_type: tuple(values) for payment_type, values in revenue_by_type.items()},
+            'days_to_pay_bins': DAYS_TO_PAY_BIN_LABELS,
+            'days_to_pay_histogram': tuple(histogram),
+            'totals': {
+                'payments': total_payments,
+                'revenue': sum(revenue),
+                'issued_fines': total_issued,
+                'collected_fines': total_collected,
+                'collection_rate': _rate(total_collected, total_issued),
+                'average_days_to_pay': _rate(sum(days_to_pay), total_payments)
+            }
+        }
+
+    def get_payment_report_statistics(self):
+        """Get payment statistics for reports"""
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            # Get ALL violations data (same query as violations report)
-            violations_query = """
-                SELECT v.ViolationID,
-                       vt.FineAmount,
-                       COALESCE(p.Status, 'UNPAID') as PaymentStatus
-                FROM violations v
-                INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                INNER JOIN residents r ON vh.ResidentID = r.ResidentID
-                INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
-                LEFT JOIN payments p ON v.ViolationID = p.ViolationID
-                WHERE v.IsDeleted = 0
-            """
-            cursor.execute(violations_query)
-            all_violations = cursor.fetchall()
-
-            cursor.close()
-            self.db.disconnect()
-
-            # Calculate statistics from actual data
-            total_violations = len(all_violations)
-            paid_count = sum(1 for v in all_violations if v['PaymentStatus'] == 'PAID')
-            unpaid_count = total_violations - paid_count
-            total_revenue = sum(float(v['FineAmount']) for v in all_violations if v['PaymentStatus'] == 'PAID')
-            pending_revenue = sum(float(v['FineAmount']) for v in all_violations if v['PaymentStatus'] != 'PAID')
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                # Same population as the violations report, aggregated on the server
+                query = """
+                    SELECT COUNT(*) as total_violations,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN 1 ELSE 0 END), 0) as paid_count,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN vt.FineAmount ELSE 0 END), 0) as total_revenue,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN 0 ELSE vt.FineAmount END), 0) as pending_revenue
+                    FROM violations v
+                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                    INNER JOIN residents r ON vh.ResidentID = r.ResidentID
+                    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                    WHERE v.IsDeleted = 0
+                """
+                cursor.execute(query)
+                result = cursor.fetchone()
+
+                cursor.close()
+
+            total_violations = int(result['total_violations'])
+            paid_count = int(result['paid_count'])
 
             return {
                 'total_violations': total_violations,
                 'paid_count': paid_count,
-                'unpaid_count': unpaid_count,
-                'total_revenue': total_revenue,
-                'pending_revenue': pending_revenue
+                'unpaid_count': total_violations - paid_count,
+                'total_revenue': float(result['total_revenue']),
+                'pending_revenue': float(result['pending_revenue'])
             }
 
         except Exception as e:
             print(f"Payment report stats error: {e}")
-            self.db.disconnect()
             return None
\ No newline at end of file
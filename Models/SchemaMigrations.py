@@ -0,0 +1,246 @@
+"""
+Models/SchemaMigrations.py
+Versioned schema migrations tracked in the schema_migrations table
+
+Each migration is idempotent (it inspects INFORMATION_SCHEMA before
+changing anything), so databases restored from roadeyedb.sql or migrated
+by hand are brought to the same version safely. Append new migrations to
+MIGRATIONS with the next version number; never renumber applied ones.
+
+Usage: python -m Models.SchemaMigrations
+"""
+from Models.Database import Database
+from Models.DashboardSummaryModel import SUMMARY_TABLES_SQL
+from Models.ChangeFeedModel import CHANGE_LOG_SQL
+from Models.IdAllocator import ID_SEQUENCES, ID_SEQUENCES_SQL, seed_sequence
+from mysql.connector import Error
+
+
+def _column_exists(cursor, schema, table, column):
+    cursor.execute("""
+        SELECT COUNT(*)
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = %s
+          AND TABLE_NAME = %s
+          AND COLUMN_NAME = %s
+    """, (schema, table, column))
+    return cursor.fetchone()[0] > 0
+
+
+def _column_length(cursor, schema, table, column):
+    cursor.execute("""
+        SELECT CHARACTER_MAXIMUM_LENGTH
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = %s
+          AND TABLE_NAME = %s
+          AND COLUMN_NAME = %s
+    """, (schema, table, column))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _index_exists(cursor, schema, table, index_name):
+    cursor.execute("""
+        SELECT COUNT(*)
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = %s
+          AND TABLE_NAME = %s
+          AND INDEX_NAME = %s
+    """, (schema, table, index_name))
+    return cursor.fetchone()[0] > 0
+
+
+def _add_index(cursor, schema, table, index_name, definition):
+    """Add an index unless one with the same name already exists"""
+    if not _index_exists(cursor, schema, table, index_name):
+        cursor.execute(f"ALTER TABLE `{table}` ADD {definition}")
+
+
+def _drop_index(cursor, schema, table, index_name):
+    if _index_exists(cursor, schema, table, index_name):
+        cursor.execute(f"ALTER TABLE `{table}` DROP INDEX `{index_name}`")
+
+
+# ----------------------------------------------------------------------
+# migrations
+# ----------------------------------------------------------------------
+def _add_violation_soft_delete(cursor, schema):
+    if not _column_exists(cursor, schema, 'violations', 'IsDeleted'):
+        cursor.execute("""
+            ALTER TABLE violations
+            ADD COLUMN IsDeleted TINYINT(1) DEFAULT 0
+        """)
+        cursor.execute("UPDATE violations SET IsDeleted = 0 WHERE IsDeleted IS NULL")
+
+
+def _create_dashboard_summary(cursor, schema):
+    for statement in SUMMARY_TABLES_SQL:
+        cursor.execute(statement)
+
+
+def _merge_duplicate_payments(cursor):
+    """
+    Leave one payments row per violation so the unique key can be added
+
+    The old check-then-insert save_payment could give a violation two
+    rows. The PAID row is kept (then the latest); the others are moved to
+    payments_duplicates rather than lost, and the dashboard summary,
+    which counted them, is emptied so it is rebuilt.
+    """
+    cursor.execute("""
+        SELECT PaymentID, ViolationID, Status, PaymentDate
+        FROM payments
+        WHERE ViolationID IN (
+            SELECT ViolationID FROM payments GROUP BY ViolationID HAVING COUNT(*) > 1
+        )
+    """)
+    by_violation = {}
+    for payment_id, violation_id, status, payment_date in cursor.fetchall():
+        by_violation.setdefault(violation_id, []).append((status == 'PAID', payment_date, payment_id))
+    if not by_violation:
+        return
+
+    duplicates = []
+    for payments in by_violation.values():
+        payments.sort(key=lambda p: (p[0], p[1] is not None, p[1] or 0, len(p[2]), p[2]), reverse=True)
+        duplicates.extend(payment_id for _, _, payment_id in payments[1:])
+    print(f"⚠️  Moving {len(duplicates)} duplicate payment(s) to payments_duplicates for violations "
+          f"{', '.join(sorted(by_violation))}")
+
+    cursor.execute("CREATE TABLE IF NOT EXISTS payments_duplicates LIKE payments")
+    placeholders = ', '.join(['%s'] * len(duplicates))
+    cursor.execute(f"INSERT INTO payments_duplicates SELECT * FROM payments WHERE PaymentID IN ({placeholders})",
+                   duplicates)
+    cursor.execute(f"DELETE FROM payments WHERE PaymentID IN ({placeholders})", duplicates)
+    cursor.execute("DELETE FROM dashboard_summary")
+
+
+def _add_access_path_indexes(cursor, schema):
+    # Admin lists, reports and monthly counts: WHERE IsDeleted = 0 ORDER BY/range on ViolationDate
+    _add_index(cursor, schema, 'violations', 'idx_violations_deleted_date',
+               "KEY `idx_violations_deleted_date` (`IsDeleted`, `ViolationDate`, `ViolationID`)")
+    # Per-resident lists and counts go through the vehicle first
+    _add_index(cursor, schema, 'violations', 'idx_violations_vehicle_deleted_date',
+               "KEY `idx_violations_vehicle_deleted_date` (`VehicleID`, `IsDeleted`, `ViolationDate`)")
+
+    # One payment row per violation (save_payment already updates in place);
+    # the unique key replaces the plain foreign-key index on the same column
+    if not _index_exists(cursor, schema, 'payments', 'uq_payments_violation'):
+        _merge_duplicate_payments(cursor)
+    _add_index(cursor, schema, 'payments', 'uq_payments_violation',
+               "UNIQUE KEY `uq_payments_violation` (`ViolationID`)")
+    _drop_index(cursor, schema, 'payments', 'ViolationID')
+    # Payment history: WHERE Status = 'PAID' ORDER BY PaymentDate
+    _add_index(cursor, schema, 'payments', 'idx_payments_status_date',
+               "KEY `idx_payments_status_date` (`Status`, `PaymentDate`)")
+
+
+def _create_change_log(cursor, schema):
+    cursor.execute(CHANGE_LOG_SQL)
+
+
+# Generated record IDs and the columns referencing them: (table, column, NULL allowed)
+_ID_COLUMNS = [
+    ('users', 'UserID', False),
+    ('admins', 'UserID', False),
+    ('activity_logs', 'UserID', False),
+    ('residents', 'ResidentID', False),
+    ('residents', 'UserID', False),
+    ('vehicles', 'VehicleID', False),
+    ('vehicles', 'ResidentID', False),
+    ('violations', 'ViolationID', False),
+    ('violations', 'VehicleID', True),
+    ('payments', 'PaymentID', False),
+    ('payments', 'ViolationID', False),
+]
+
+
+def _create_id_sequences(cursor, schema):
+    cursor.execute(ID_SEQUENCES_SQL)
+    for name in ID_SEQUENCES:
+        seed_sequence(cursor, name)
+
+    # varchar(5) stops at V9999 / VH999; widen keys and foreign keys together
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    try:
+        for table, column, nullable in _ID_COLUMNS:
+            length = _column_length(cursor, schema, table, column)
+            if length is not None and length < 10:
+                null = "DEFAULT NULL" if nullable else "NOT NULL"
+                cursor.execute(f"ALTER TABLE `{table}` MODIFY `{column}` varchar(10) {null}")
+    finally:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+
+MIGRATIONS = [
+    (1, "Add violations.IsDeleted soft-delete flag", _add_violation_soft_delete),
+    (2, "Create dashboard summary tables", _create_dashboard_summary),
+    (3, "Add covering indexes for violation and payment access paths", _add_access_path_indexes),
+    (4, "Create change_log table for incremental refresh", _create_change_log),
+    (5, "Create id_sequences table and widen record ID columns", _create_id_sequences),
+]
+
+
+class SchemaMigrator:
+    """Applies pending schema migrations in version order"""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def _ensure_version_table(self, cursor):
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                Version INT NOT NULL PRIMARY KEY,
+                Description VARCHAR(255) NOT NULL,
+                AppliedAt DATETIME DEFAULT CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB
+        """)
+
+    def get_current_version(self) -> int:
+        """Highest applied migration version (0 for a fresh database)"""
+        with self.db.get_connection() as connection:
+            cursor = connection.cursor()
+            self._ensure_version_table(cursor)
+            cursor.execute("SELECT COALESCE(MAX(Version), 0) FROM schema_migrations")
+            version = cursor.fetchone()[0]
+            cursor.close()
+        return int(version)
+
+    def migrate(self):
+        """
+        Apply every migration newer than the recorded version
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            current = self.get_current_version()
+            pending = [m for m in MIGRATIONS if m[0] > current]
+            if not pending:
+                return True, "Database is up to date"
+
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+
+                for version, description, apply in pending:
+                    print(f"Applying database migration {version}: {description}...")
+                    # DDL commits implicitly, so each step is recorded as soon as it succeeds
+                    apply(cursor, self.db.database)
+                    cursor.execute(
+                        "INSERT INTO schema_migrations (Version, Description) VALUES (%s, %s)",
+                        (version, description)
+                    )
+                    connection.commit()
+
+                cursor.close()
+
+            print("✅ Migration completed successfully")
+            return True, f"Database migrated to version {pending[-1][0]}"
+
+        except Error as e:
+            return False, f"Migration error: {str(e)}"
+
+
+if __name__ == '__main__':
+    success, message = SchemaMigrator(Database.from_config()).migrate()
+    print(("✅ " if success else "❌ ") + message)
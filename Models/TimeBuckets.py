@@ -0,0 +1,62 @@
+"""
+Models/TimeBuckets.py
+Day / week / month buckets shared by the time series queries
+
+A query groups on bucket_sql(column, granularity), an integer key per
+bucket; bucket_key computes the same key for a Python date, so the rows
+can be placed into the dense list of buckets bucket_starts returns
+(empty buckets included). Weeks start on Monday.
+"""
+from datetime import date, timedelta
+
+
+TIME_SERIES_GRANULARITIES = ('day', 'week', 'month')
+
+# TO_DAYS counts from year 0 and date.toordinal from year 1: they differ by 365
+_BUCKET_SQL = {
+    'day': "TO_DAYS({column})",
+    'week': "TO_DAYS({column}) - WEEKDAY({column})",
+    'month': "YEAR({column}) * 12 + MONTH({column}) - 1",
+}
+
+
+def check_granularity(granularity: str):
+    if granularity not in TIME_SERIES_GRANULARITIES:
+        raise ValueError(f"Unsupported granularity: {granularity}")
+
+
+def bucket_sql(column: str, granularity: str) -> str:
+    """SQL expression for the bucket key of a DATE/DATETIME column"""
+    return _BUCKET_SQL[granularity].format(column=column)
+
+
+def bucket_key(day: date, granularity: str) -> int:
+    if granularity == 'month':
+        return day.year * 12 + day.month - 1
+    if granularity == 'week':
+        return day.toordinal() + 365 - day.weekday()
+    return day.toordinal() + 365
+
+
+def bucket_starts(start_date: date, end_date: date, granularity: str) -> list:
+    """First day of every bucket overlapping [start_date, end_date)"""
+    if granularity == 'month':
+        day = start_date.replace(day=1)
+    elif granularity == 'week':
+        day = start_date - timedelta(days=start_date.weekday())
+    else:
+        day = start_date
+
+    starts = []
+    while day < end_date:
+        starts.append(day)
+        if granularity == 'month':
+            day = date(day.year + day.month // 12, day.month % 12 + 1, 1)
+        else:
+            day += timedelta(days=7 if granularity == 'week' else 1)
+    return starts
+
+
+def bucket_positions(buckets: list, granularity: str) -> dict:
+    """Bucket key -> index into buckets"""
+    return {bucket_key(day, granularity): index for index, day in enumerate(buckets)}
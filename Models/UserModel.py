@@ -3,6 +3,8 @@ Models/UserModel.py
 User authentication and management model
 """
 from Models.Database import Database
+from Models.DashboardSummaryModel import DashboardSummaryModel
+from Models.ChangeFeedModel import ChangeFeedModel
 from mysql.connector import Error
 import hashlib
 
@@ -20,36 +22,33 @@ class UserModel:
 
     def authenticate_user(self, username: str, password: str):
         """Authenticate resident user credentials"""
-        if not self.db.connect():
-            return None, "Database connection failed"
-
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            query = """
-                SELECT u.UserID,
-                       u.Username,
-                       u.UserType,
-                       u.IsActive,
-                       r.ResidentID,
-                       r.RFirstName,
-                       r.RMiddleName,
-                       r.RLastName,
-                       r.Sex,
-                       r.ContactNo,
-                       r.Address
-                FROM users u
-                INNER JOIN residents r ON u.UserID = r.UserID
-                WHERE u.Username = %s
-                  AND u.Password = %s
-                  AND u.UserType = 'Resident'
-                  AND u.IsActive = TRUE
-            """
-            cursor.execute(query, (username, hash_password(password)))
-            result = cursor.fetchone()
-
-            cursor.close()
-            self.db.disconnect()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                query = """
+                    SELECT u.UserID,
+                           u.Username,
+                           u.UserType,
+                           u.IsActive,
+                           r.ResidentID,
+                           r.RFirstName,
+                           r.RMiddleName,
+                           r.RLastName,
+                           r.Sex,
+                           r.ContactNo,
+                           r.Address
+                    FROM users u
+                    INNER JOIN residents r ON u.UserID = r.UserID
+                    WHERE u.Username = %s
+                      AND u.Password = %s
+                      AND u.UserType = 'Resident'
+                      AND u.IsActive = TRUE
+                """
+                cursor.execute(query, (username, hash_password(password)))
+                result = cursor.fetchone()
+
+                cursor.close()
 
             if result:
                 return result, None
@@ -57,38 +56,34 @@ class UserModel:
                 return None, "Invalid credentials or account is not active"
 
         except Error as e:
-            self.db.disconnect()
             return None, f"Authentication error: {str(e)}"
 
     def authenticate_admin(self, username: str, password: str):
         """Authenticate admin credentials"""
-        if not self.db.connect():
-            return None, "Database connection failed"
-
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            query = """
-                SELECT u.UserID,
-                       u.Username,
-                       u.UserType,
-                       u.IsActive,
-                       a.AdminID,
-                       a.AFirstName,
-                       a.ALastName,
-                       a.Role
-                FROM users u
-                INNER JOIN admins a ON u.UserID = a.UserID
-                WHERE u.Username = %s
-                  AND u.Password = %s
-                  AND u.UserType = 'Admin'
-                  AND u.IsActive = TRUE
-            """
-            cursor.execute(query, (username, hash_password(password)))
-            result = cursor.fetchone()
-
-            cursor.close()
-            self.db.disconnect()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                query = """
+                    SELECT u.UserID,
+                           u.Username,
+                           u.UserType,
+                           u.IsActive,
+                           a.AdminID,
+                           a.AFirstName,
+                           a.ALastName,
+                           a.Role
+                    FROM users u
+                    INNER JOIN admins a ON u.UserID = a.UserID
+                    WHERE u.Username = %s
+                      AND u.Password = %s
+                      AND u.UserType = 'Admin'
+                      AND u.IsActive = TRUE
+                """
+                cursor.execute(query, (username, hash_password(password)))
+                result = cursor.fetchone()
+
+                cursor.close()
 
             if result:
                 return result, None
@@ -96,85 +91,80 @@ class UserModel:
                 return None, "Invalid admin credentials or account is not active"
 
         except Error as e:
-            self.db.disconnect()
             return None, f"Authentication error: {str(e)}"
 
     def register_user(self, username: str, password: str, first_name: str, middle_name: str,
                      last_name: str, sex: str, contact_no: str, address: str = None):
         """Register a new resident user"""
-        if not self.db.connect():
-            return False, "Database connection failed"
-
         try:
-            cursor = self.db.connection.cursor()
-
-            # Check if username already exists FIRST before generating IDs
-            cursor.execute("SELECT UserID FROM users WHERE Username = %s", (username,))
-            if cursor.fetchone():
+            # Check if username already exists before reserving IDs, so a
+            # rejected signup does not use any up
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("SELECT 1 FROM users WHERE Username = %s", (username,))
+                username_taken = cursor.fetchone() is not None
                 cursor.close()
-                self.db.disconnect()
+            if username_taken:
                 return False, "Username already exists"
 
-            # Generate new UserID using MAX to avoid ordering issues
-            cursor.execute("SELECT MAX(CAST(SUBSTRING(UserID, 2) AS UNSIGNED)) as max_id FROM users")
-            result = cursor.fetchone()
-            next_user_num = (result[0] or 0) + 1
-            new_user_id = f"U{str(next_user_num).zfill(3)}"
-
-            # Generate new ResidentID using MAX
-            cursor.execute("SELECT MAX(CAST(SUBSTRING(ResidentID, 2) AS UNSIGNED)) as max_id FROM residents")
-            result = cursor.fetchone()
-            next_resident_num = (result[0] or 0) + 1
-            new_resident_id = f"R{str(next_resident_num).zfill(3)}"
-
-            # Insert into users table with hashed password
-            user_query = """
-                INSERT INTO users (UserID, Username, Password, UserType, IsActive)
-                VALUES (%s, %s, %s, 'Resident', TRUE)
-            """
-            cursor.execute(user_query, (new_user_id, username, hash_password(password)))
-
-            # Insert into residents table with separate name fields
-            resident_query = """
-                INSERT INTO residents (ResidentID, UserID, RFirstName, RMiddleName, RLastName,
-                                      Sex, ContactNo, Address)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            cursor.execute(resident_query, (
-                new_resident_id, new_user_id,
-                first_name, middle_name or None, last_name,
-                sex, contact_no, address
-            ))
-
-            self.db.connection.commit()
-            cursor.close()
-            self.db.disconnect()
+            # Reserved before the transaction starts (see Models/IdAllocator.py)
+            new_user_id = self.db.id_allocator.next_id('users')
+            new_resident_id = self.db.id_allocator.next_id('residents')
+
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+
+                # Check again: another signup may have taken the username since
+                cursor.execute("SELECT UserID FROM users WHERE Username = %s", (username,))
+                if cursor.fetchone():
+                    cursor.close()
+                    return False, "Username already exists"
+
+                # Insert into users table with hashed password
+                user_query = """
+                    INSERT INTO users (UserID, Username, Password, UserType, IsActive)
+                    VALUES (%s, %s, %s, 'Resident', TRUE)
+                """
+                cursor.execute(user_query, (new_user_id, username, hash_password(password)))
+
+                # Insert into residents table with separate name fields
+                resident_query = """
+                    INSERT INTO residents (ResidentID, UserID, RFirstName, RMiddleName, RLastName,
+                                          Sex, ContactNo, Address)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """
+                cursor.execute(resident_query, (
+                    new_resident_id, new_user_id,
+                    first_name, middle_name or None, last_name,
+                    sex, contact_no, address
+                ))
+                DashboardSummaryModel.record_resident(cursor)
+                ChangeFeedModel.record_change(cursor, 'residents', new_resident_id, 'INSERT')
+
+                connection.commit()
+                cursor.close()
+
+            self.db.query_cache.invalidate('users', 'residents', 'dashboard_summary')
             return True, "Registration successful"
 
         except Error as e:
-            if self.db.connection:
-                self.db.connection.rollback()
-            self.db.disconnect()
             return False, f"Registration error: {str(e)}"
 
     def get_user_by_username(self, username: str):
         """Get user information by username"""
-        if not self.db.connect():
-            return None, "Database connection failed"
-
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
 
-            query = """
-                SELECT UserID, Username, UserType, IsActive
-                FROM users
-                WHERE Username = %s
-            """
-            cursor.execute(query, (username,))
-            result = cursor.fetchone()
+                query = """
+                    SELECT UserID, Username, UserType, IsActive
+                    FROM users
+                    WHERE Username = %s
+                """
+                cursor.execute(query, (username,))
+                result = cursor.fetchone()
 
-            cursor.close()
-            self.db.disconnect()
+                cursor.close()
 
             if result:
                 return result, None
@@ -182,7 +172,6 @@ class UserModel:
                 return None, "User not found"
 
         except Error as e:
-            self.db.disconnect()
             return None, f"Query error: {str(e)}"
 
     def check_username_exists(self, username: str) -> bool:
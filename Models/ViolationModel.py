@@ -2,7 +2,14 @@
 Models/ViolationModel.py
 Violation data operations
 """
+from collections import Counter
+from datetime import date
+
 from Models.Database import Database
+from Models.QueryCache import cached_query
+from Models.TimeBuckets import bucket_positions, bucket_sql, bucket_starts, check_granularity
+from Models.DashboardSummaryModel import DashboardSummaryModel
+from Models.ChangeFeedModel import ChangeFeedModel
 from mysql.connector import Error
 
 
@@ -12,34 +19,39 @@ class ViolationModel:
     def __init__(self, db: Database):
         self.db = db
 
-    def get_user_violations(self, resident_id: str):
-        """Get all violations for a specific resident"""
-        if not self.db.connect():
-            return []
+    @cached_query('violations', 'vehicles', 'violation_types', 'payments')
+    def get_user_violations(self, resident_id: str, violation_ids: tuple = None):
+        """Get all violations for a specific resident (or just the given ones)"""
+        id_filter = ""
+        params = [resident_id]
+        if violation_ids:
+            id_filter = f"AND v.ViolationID IN ({', '.join(['%s'] * len(violation_ids))})"
+            params.extend(violation_ids)
 
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            query = """
-                SELECT v.ViolationID as violation_id,
-                       vh.PlateNo as plate_no,
-                       vt.ViolationName as violation_type,
-                       DATE_FORMAT(v.ViolationDate, '%Y-%m-%d') as date,
-                       vt.FineAmount as fine_amount,
-                       COALESCE(p.Status, 'UNPAID') as status
-                FROM violations v
-                INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
-                LEFT JOIN payments p ON v.ViolationID = p.ViolationID
-                WHERE vh.ResidentID = %s
-                  AND v.IsDeleted = 0
-                ORDER BY v.ViolationDate DESC
-            """
-            cursor.execute(query, (resident_id,))
-            results = cursor.fetchall()
-
-            cursor.close()
-            self.db.disconnect()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                query = f"""
+                    SELECT v.ViolationID as violation_id,
+                           vh.PlateNo as plate_no,
+                           vt.ViolationName as violation_type,
+                           DATE_FORMAT(v.ViolationDate, '%Y-%m-%d') as date,
+                           vt.FineAmount as fine_amount,
+                           COALESCE(p.Status, 'UNPAID') as status
+                    FROM violations v
+                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                    WHERE vh.ResidentID = %s
+                      AND v.IsDeleted = 0
+                      {id_filter}
+                    ORDER BY v.ViolationDate DESC
+                """
+                cursor.execute(query, params)
+                results = cursor.fetchall()
+
+                cursor.close()
 
             # Convert status to simpler format for display
             for result in results:
@@ -52,208 +64,357 @@ class ViolationModel:
 
         except Exception as e:
             print(f"Violations query error: {e}")
-            self.db.disconnect()
             return []
 
+    @cached_query('violations', 'vehicles', 'residents', 'violation_types', 'payments')
     def get_all_violations(self):
         """Get all violations (for admin view)"""
-        if not self.db.connect():
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                query = """
+                    SELECT v.ViolationID,
+                           CONCAT(r.RFirstName, ' ', r.RLastName) as resident_name,
+                           vh.PlateNo,
+                           vt.ViolationName,
+                           DATE_FORMAT(v.ViolationDate, '%Y-%m-%d') as date,
+                           vt.FineAmount,
+                           COALESCE(p.Status, 'UNPAID') as status,
+                           v.IsDeleted
+                    FROM violations v
+                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                    INNER JOIN residents r ON vh.ResidentID = r.ResidentID
+                    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                    WHERE v.IsDeleted = 0
+                    ORDER BY v.ViolationDate DESC
+                """
+                cursor.execute(query)
+                results = cursor.fetchall()
+
+                cursor.close()
+
+            return results
+
+        except Exception as e:
+            print(f"All violations query error: {e}")
             return []
 
+    def get_violations_page(self, after_date=None, after_id: str = None, limit: int = 100,
+                            filters: dict = None):
+        """
+        Get one page of violations (admin view), newest first
+
+        Keyset pagination on (ViolationDate, ViolationID): pass the
+        ViolationDate and ViolationID of the last row already shown to get
+        the rows after it, so every page costs the same regardless of depth.
+
+        Args:
+            after_date: ViolationDate of the last row of the previous page
+            after_id: ViolationID of the last row of the previous page
+            limit: Maximum number of rows to return
+            filters: Optional dict with 'search' (ID, resident, plate or
+                violation type substring), 'status' ('PAID' or 'UNPAID')
+                and 'ids' (only these ViolationIDs)
+
+        Returns:
+            list: Rows shaped like get_all_violations plus ViolationDate
+        """
+        filters = filters or {}
+        conditions = ["v.IsDeleted = 0"]
+        params = []
+
+        if after_date is not None and after_id is not None:
+            conditions.append("(v.ViolationDate < %s OR (v.ViolationDate = %s AND v.ViolationID < %s))")
+            params.extend([after_date, after_date, after_id])
+
+        search = (filters.get('search') or '').strip()
+        if search:
+            pattern = f"%{search}%"
+            conditions.append("""(v.ViolationID LIKE %s
+                        OR CONCAT(r.RFirstName, ' ', r.RLastName) LIKE %s
+                        OR vh.PlateNo LIKE %s
+                        OR vt.ViolationName LIKE %s)""")
+            params.extend([pattern] * 4)
+
+        ids = filters.get('ids')
+        if ids:
+            conditions.append(f"v.ViolationID IN ({', '.join(['%s'] * len(ids))})")
+            params.extend(ids)
+
+        status = filters.get('status')
+        if status == 'PAID':
+            conditions.append("p.Status = 'PAID'")
+        elif status == 'UNPAID':
+            conditions.append("(p.Status IS NULL OR p.Status <> 'PAID')")
+
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            query = """
-                SELECT v.ViolationID,
-                       CONCAT(r.RFirstName, ' ', r.RLastName) as resident_name,
-                       vh.PlateNo,
-                       vt.ViolationName,
-                       DATE_FORMAT(v.ViolationDate, '%Y-%m-%d') as date,
-                       vt.FineAmount,
-                       COALESCE(p.Status, 'UNPAID') as status,
-                       v.IsDeleted
-                FROM violations v
-                INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                INNER JOIN residents r ON vh.ResidentID = r.ResidentID
-                INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
-                LEFT JOIN payments p ON v.ViolationID = p.ViolationID
-                WHERE v.IsDeleted = 0
-                ORDER BY v.ViolationDate DESC
-            """
-            cursor.execute(query)
-            results = cursor.fetchall()
-
-            cursor.close()
-            self.db.disconnect()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                query = f"""
+                    SELECT v.ViolationID,
+                           CONCAT(r.RFirstName, ' ', r.RLastName) as resident_name,
+                           vh.PlateNo,
+                           vt.ViolationName,
+                           DATE_FORMAT(v.ViolationDate, '%Y-%m-%d') as date,
+                           v.ViolationDate,
+                           vt.FineAmount,
+                           COALESCE(p.Status, 'UNPAID') as status,
+                           v.IsDeleted
+                    FROM violations v
+                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                    INNER JOIN residents r ON vh.ResidentID = r.ResidentID
+                    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY v.ViolationDate DESC, v.ViolationID DESC
+                    LIMIT %s
+                """
+                cursor.execute(query, (*params, int(limit)))
+                results = cursor.fetchall()
+
+                cursor.close()
 
             return results
 
         except Exception as e:
-            print(f"All violations query error: {e}")
-            self.db.disconnect()
+            print(f"Violations page query error: {e}")
             return []
 
     def get_violation_by_id(self, violation_id: str):
         """Get detailed violation information"""
-        if not self.db.connect():
-            return None
-
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-
-            query = """
-                SELECT v.ViolationID,
-                       CONCAT(r.RFirstName, ' ', r.RLastName) as resident_name,
-                       r.ContactNo,
-                       vh.PlateNo,
-                       vh.Brand,
-                       vh.Model,
-                       vt.ViolationName,
-                       vt.FineAmount,
-                       DATE_FORMAT(v.ViolationDate, '%Y-%m-%d') as ViolationDate,
-                       COALESCE(p.Status, 'UNPAID') as status,
-                       DATE_FORMAT(p.PaymentDate, '%Y-%m-%d') as PaymentDate
-                FROM violations v
-                INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                INNER JOIN residents r ON vh.ResidentID = r.ResidentID
-                INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
-                LEFT JOIN payments p ON v.ViolationID = p.ViolationID
-                WHERE v.ViolationID = %s
-            """
-            cursor.execute(query, (violation_id,))
-            result = cursor.fetchone()
-
-            cursor.close()
-            self.db.disconnect()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                query = """
+                    SELECT v.ViolationID,
+                           CONCAT(r.RFirstName, ' ', r.RLastName) as resident_name,
+                           r.ContactNo,
+                           vh.PlateNo,
+                           vh.Brand,
+                           vh.Model,
+                           vt.ViolationName,
+                           vt.FineAmount,
+                           DATE_FORMAT(v.ViolationDate, '%Y-%m-%d') as ViolationDate,
+                           COALESCE(p.Status, 'UNPAID') as status,
+                           DATE_FORMAT(p.PaymentDate, '%Y-%m-%d') as PaymentDate
+                    FROM violations v
+                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                    INNER JOIN residents r ON vh.ResidentID = r.ResidentID
+                    INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                    WHERE v.ViolationID = %s
+                """
+                cursor.execute(query, (violation_id,))
+                result = cursor.fetchone()
+
+                cursor.close()
 
             return result
 
         except Exception as e:
             print(f"Violation details query error: {e}")
-            self.db.disconnect()
             return None
 
     def add_violation(self, vehicle_id: str, violation_type_id: str, violation_date: str):
         """Add new violation to database"""
-        if not self.db.connect():
-            return False, "Database connection failed"
-
         try:
-            cursor = self.db.connection.cursor()
+            # Reserved before the transaction starts (see Models/IdAllocator.py)
+            new_violation_id = self.db.id_allocator.next_id('violations')
 
-            # Generate new ViolationID
-            cursor.execute("SELECT MAX(CAST(SUBSTRING(ViolationID, 2) AS UNSIGNED)) as max_id FROM violations")
-            result = cursor.fetchone()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
 
-            if result and result[0]:
-                new_num = int(result[0]) + 1
-            else:
-                new_num = 1
-
-            new_violation_id = f"V{str(new_num).zfill(3)}"
+                # Insert violation
+                query = """
+                    INSERT INTO violations (ViolationID, VehicleID, ViolationTypeID, ViolationDate, IsDeleted)
+                    VALUES (%s, %s, %s, %s, 0)
+                """
+                cursor.execute(query, (new_violation_id, vehicle_id, violation_type_id, violation_date))
+                DashboardSummaryModel.record_violation(cursor, violation_type_id, violation_date)
 
-            # Insert violation
-            query = """
-                INSERT INTO violations (ViolationID, VehicleID, ViolationTypeID, ViolationDate, IsDeleted)
-                VALUES (%s, %s, %s, %s, 0)
-            """
-            cursor.execute(query, (new_violation_id, vehicle_id, violation_type_id, violation_date))
+                # The vehicle's and owner's violation counts change too
+                ChangeFeedModel.record_change(cursor, 'violations', new_violation_id, 'INSERT')
+                ChangeFeedModel.record_change(cursor, 'vehicles', vehicle_id)
+                cursor.execute("SELECT ResidentID FROM vehicles WHERE VehicleID = %s", (vehicle_id,))
+                owner = cursor.fetchone()
+                if owner:
+                    ChangeFeedModel.record_change(cursor, 'residents', owner[0])
 
-            self.db.connection.commit()
-            cursor.close()
-            self.db.disconnect()
+                connection.commit()
+                cursor.close()
 
+            self.db.query_cache.invalidate('violations', 'dashboard_summary', 'violation_monthly_counts')
             return True, "Violation added successfully"
 
         except Exception as e:
-            if self.db.connection:
-                self.db.connection.rollback()
-            self.db.disconnect()
             return False, f"Failed to add violation: {str(e)}"
 
-    def get_violation_statistics(self, resident_id: str = None):
-        """Get violation statistics"""
-        if not self.db.connect():
-            return 0, 0
+    def add_violations_bulk(self, violations: list):
+        """
+        Insert a batch of violations in one transaction
+
+        Args:
+            violations: (ViolationID, VehicleID, ViolationTypeID, Speed, Location,
+                         ViolationDate, PlateNoDetected) tuples; ViolationDate
+                         is a datetime
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        if not violations:
+            return True, "No violations to add"
+
+        type_counts = Counter(row[2] for row in violations)
+        month_counts = Counter((row[5].year, row[5].month) for row in violations)
+        vehicle_ids = sorted({row[1] for row in violations})
 
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+
+                # executemany sends the batch as multi-row INSERT statements
+                cursor.executemany("""
+                    INSERT INTO violations (ViolationID, VehicleID, ViolationTypeID, Speed, Location,
+                                            ViolationDate, PlateNoDetected, IsDeleted)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, 0)
+                """, violations)
+                DashboardSummaryModel.record_violations(cursor, type_counts, month_counts)
+
+                ChangeFeedModel.record_changes(cursor, 'violations', [row[0] for row in violations], 'INSERT')
+                ChangeFeedModel.record_changes(cursor, 'vehicles', vehicle_ids)
+                cursor.execute(f"""
+                    SELECT DISTINCT ResidentID FROM vehicles
+                    WHERE VehicleID IN ({', '.join(['%s'] * len(vehicle_ids))})
+                """, vehicle_ids)
+                ChangeFeedModel.record_changes(cursor, 'residents', [row[0] for row in cursor.fetchall()])
+
+                connection.commit()
+                cursor.close()
+
+            self.db.query_cache.invalidate('violations', 'dashboard_summary', 'violation_monthly_counts')
+            return True, f"{len(violations)} violations added"
 
-            if resident_id:
-                # Get statistics for specific resident
-                query = """
-                    SELECT v.ViolationID,
-                           COALESCE(p.Status, 'UNPAID') as status
-                    FROM violations v
-                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
-                    WHERE vh.ResidentID = %s
-                      AND v.IsDeleted = 0
-                """
-                cursor.execute(query, (resident_id,))
-            else:
-                # Get all statistics (for admin)
-                query = """
-                    SELECT v.ViolationID,
-                           COALESCE(p.Status, 'UNPAID') as status
+        except Exception as e:
+            return False, f"Failed to add violations: {str(e)}"
+
+    def get_violation_statistics(self, resident_id: str = None):
+        """Get violation statistics as (total, unpaid)"""
+        summary = self.get_violation_summary(resident_id)
+        return summary['total_violations'], summary['unpaid_count']
+
+    @cached_query('violations', 'vehicles', 'violation_types', 'payments')
+    def get_violation_summary(self, resident_id: str = None):
+        """
+        Get violation counts and revenue figures in a single aggregate query
+
+        Args:
+            resident_id: Limit to one resident's vehicles (None for all, admin)
+
+        Returns:
+            dict: total_violations, paid_count, unpaid_count,
+                  total_revenue, pending_revenue
+        """
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+
+                select = """
+                    SELECT COUNT(*) as total_violations,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN 1 ELSE 0 END), 0) as paid_count,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN vt.FineAmount ELSE 0 END), 0) as total_revenue,
+                           COALESCE(SUM(CASE WHEN p.Status = 'PAID' THEN 0 ELSE vt.FineAmount END), 0) as pending_revenue
                     FROM violations v
-                    LEFT JOIN payments p ON v.ViolationID = p.ViolationID
-                    WHERE v.IsDeleted = 0
                 """
-                cursor.execute(query)
 
-            results = cursor.fetchall()
+                if resident_id:
+                    # Get statistics for specific resident
+                    query = select + """
+                        INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                        INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                        LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                        WHERE vh.ResidentID = %s
+                          AND v.IsDeleted = 0
+                    """
+                    cursor.execute(query, (resident_id,))
+                else:
+                    # Get all statistics (for admin)
+                    query = select + """
+                        INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+                        LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+                        WHERE v.IsDeleted = 0
+                    """
+                    cursor.execute(query)
+
+                result = cursor.fetchone()
 
-            cursor.close()
-            self.db.disconnect()
+                cursor.close()
 
-            total_violations = len(results)
-            unpaid_violations = sum(1 for v in results if v['status'] != 'PAID')
+            total_violations = int(result['total_violations'])
+            paid_count = int(result['paid_count'])
 
-            return total_violations, unpaid_violations
+            return {
+                'total_violations': total_violations,
+                'paid_count': paid_count,
+                'unpaid_count': total_violations - paid_count,
+                'total_revenue': float(result['total_revenue']),
+                'pending_revenue': float(result['pending_revenue'])
+            }
 
         except Exception as e:
             print(f"Stats error: {e}")
-            self.db.disconnect()
-            return 0, 0
-
+            return {
+                'total_violations': 0,
+                'paid_count': 0,
+                'unpaid_count': 0,
+                'total_revenue': 0.0,
+                'pending_revenue': 0.0
+            }
+
+    @cached_query('violations', 'vehicles')
     def get_monthly_violations(self, resident_id: str = None, year: int = None):
         """Get violations grouped by month, optionally filtered by year"""
-        if not self.db.connect():
-            return {}
-
         try:
             import datetime
             filter_year = year if year else datetime.date.today().year
-            cursor = self.db.connection.cursor()
-
-            if resident_id:
-                query = """
-                    SELECT DATE_FORMAT(v.ViolationDate, '%b') as month, COUNT(*) as count
-                    FROM violations v
-                    INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
-                    WHERE vh.ResidentID = %s
-                      AND YEAR(v.ViolationDate) = %s
-                      AND v.IsDeleted = 0
-                    GROUP BY MONTH(v.ViolationDate), DATE_FORMAT(v.ViolationDate, '%b')
-                    ORDER BY MONTH(v.ViolationDate)
-                """
-                cursor.execute(query, (resident_id, filter_year))
-            else:
-                query = """
-                    SELECT DATE_FORMAT(ViolationDate, '%b') as month, COUNT(*) as count
-                    FROM violations
-                    WHERE YEAR(ViolationDate) = %s
-                      AND IsDeleted = 0
-                    GROUP BY MONTH(ViolationDate), DATE_FORMAT(ViolationDate, '%b')
-                    ORDER BY MONTH(ViolationDate)
-                """
-                cursor.execute(query, (filter_year,))
+            # Half-open date range instead of YEAR(...) so the ViolationDate indexes apply
+            year_start = datetime.date(filter_year, 1, 1)
+            year_end = datetime.date(filter_year + 1, 1, 1)
+
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+
+                if resident_id:
+                    query = """
+                        SELECT DATE_FORMAT(v.ViolationDate, '%b') as month, COUNT(*) as count
+                        FROM violations v
+                        INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+                        WHERE vh.ResidentID = %s
+                          AND v.IsDeleted = 0
+                          AND v.ViolationDate >= %s
+                          AND v.ViolationDate < %s
+                        GROUP BY MONTH(v.ViolationDate), DATE_FORMAT(v.ViolationDate, '%b')
+                        ORDER BY MONTH(v.ViolationDate)
+                    """
+                    cursor.execute(query, (resident_id, year_start, year_end))
+                else:
+                    query = """
+                        SELECT DATE_FORMAT(ViolationDate, '%b') as month, COUNT(*) as count
+                        FROM violations
+                        WHERE IsDeleted = 0
+                          AND ViolationDate >= %s
+                          AND ViolationDate < %s
+                        GROUP BY MONTH(ViolationDate), DATE_FORMAT(ViolationDate, '%b')
+                        ORDER BY MONTH(ViolationDate)
+                    """
+                    cursor.execute(query, (year_start, year_end))
 
-            results = cursor.fetchall()
+                results = cursor.fetchall()
 
-            cursor.close()
-            self.db.disconnect()
+                cursor.close()
 
             # Create dictionary with all months
             months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
@@ -268,27 +429,99 @@ class ViolationModel:
 
         except Exception as e:
             print(f"Monthly data error: {e}")
-            self.db.disconnect()
             return {month: 0 for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                                           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']}
 
+    @cached_query('violations', 'vehicles')
+    def get_violation_time_series(self, start_date: date, end_date: date, granularity: str = 'month',
+                                  by_type: bool = False, resident_id: str = None):
+        """
+        Violation counts per day, week (from Monday) or month, in one grouped query
+
+        Args:
+            start_date: First day included
+            end_date: First day no longer included
+            granularity: 'day', 'week' or 'month'
+            by_type: Also break the counts down per ViolationTypeID
+            resident_id: Limit to one resident's vehicles (None for all, admin)
+
+        Returns:
+            dict: granularity, buckets (tuple of each bucket's first day,
+                  empty buckets included), counts (tuple, one per bucket)
+                  and, with by_type, by_type (ViolationTypeID -> tuple of
+                  counts, only types that occur)
+        """
+        check_granularity(granularity)
+        buckets = bucket_starts(start_date, end_date, granularity)
+        positions = bucket_positions(buckets, granularity)
+        counts = [0] * len(buckets)
+        type_counts = {}
+
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+
+                join = ""
+                resident_filter = ""
+                params = [start_date, end_date]
+                if resident_id:
+                    join = "INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID"
+                    resident_filter = "AND vh.ResidentID = %s"
+                    params.append(resident_id)
+                type_column = ", v.ViolationTypeID" if by_type else ""
+
+                query = f"""
+                    SELECT {bucket_sql('v.ViolationDate', granularity)} as bucket{type_column}, COUNT(*) as count
+                    FROM violations v
+                    {join}
+                    WHERE v.IsDeleted = 0
+                      AND v.ViolationDate >= %s
+                      AND v.ViolationDate < %s
+                      {resident_filter}
+                    GROUP BY bucket{type_column}
+                """
+                cursor.execute(query, params)
+                results = cursor.fetchall()
+
+                cursor.close()
+
+            for row in results:
+                index = positions.get(int(row[0]))
+                if index is None:
+                    continue
+                count = int(row[-1])
+                counts[index] += count
+                if by_type:
+                    type_counts.setdefault(row[1], [0] * len(buckets))[index] += count
+
+        except Exception as e:
+            print(f"Time series error: {e}")
+            counts = [0] * len(buckets)
+            type_counts = {}
+
+        series = {
+            'granularity': granularity,
+            'buckets': tuple(buckets),
+            'counts': tuple(counts)
+        }
+        if by_type:
+            series['by_type'] = {type_id: tuple(values) for type_id, values in type_counts.items()}
+        return series
+
+    @cached_query('violation_types')
     def get_violation_types(self):
         """Get all violation types"""
-        if not self.db.connect():
-            return []
-
         try:
-            cursor = self.db.connection.cursor(dictionary=True)
-            query = "SELECT ViolationTypeID, ViolationName, FineAmount FROM violation_types ORDER BY ViolationName"
-            cursor.execute(query)
-            results = cursor.fetchall()
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                query = "SELECT ViolationTypeID, ViolationName, FineAmount FROM violation_types ORDER BY ViolationName"
+                cursor.execute(query)
+                results = cursor.fetchall()
 
-            cursor.close()
-            self.db.disconnect()
+                cursor.close()
 
             return results
 
         except Exception as e:
             print(f"Load violation types error: {e}")
-            self.db.disconnect()
             return []
\ No newline at end of file
@@ -2,11 +2,15 @@
 Main/RoadEyeMain.py
 Application entry point - wires all MVC components together
 """
+import os
 import sys
 from PyQt6.QtWidgets import QApplication, QMessageBox, QDialog, QFileDialog
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
 
+# Models
+from Models.Database import get_shared_database
+
 # Controllers
 from Controllers.AuthController import AuthController
 from Controllers.ResidentController import ResidentController
@@ -15,32 +19,18 @@ from Controllers.PaymentController import PaymentController
 from Controllers.ViolationController import ViolationController
 from Controllers.VehicleController import VehicleController
 from Controllers.ReportController import ReportController
+from Controllers.ChangeFeedController import ChangeFeedController, CHANGE_POLL_INTERVAL_MS
+from Controllers.Utility.BackgroundTasks import (
+    DataLoader, DebouncedSearch, PeriodicTask, JobQueue, JobCancelled, configure_thread_pools
+)
 
 # Views - Auth
 from Views.Auth.LoginView import LoginView
 from Views.Auth.SignUpView import SignUpView
 
-# Views - Resident
-from Views.Resident.ResidentMainView import ResidentMainView
-from Views.Resident.DashboardView import DashboardView
-from Views.Resident.ViolationsView import ViolationsView
-from Views.Resident.ViolationHistoryView import ViolationHistoryView
-from Views.Resident.PaymentHistoryView import PaymentHistoryView
-from Views.Resident.PaymentDialog import PaymentDialog
-
-# Views - Admin
-from Views.Admin.AdminMainView import AdminMainView
-from Views.Admin.AdminDashboardView import AdminDashboardView
-from Views.Admin.ViolationsManagementView import ViolationsManagementView
-from Views.Admin.ResidentsManagementView import ResidentsManagementView
-from Views.Admin.VehiclesManagementView import VehiclesManagementView
-from Views.Admin.ReportsView import ReportsView
-from Views.Admin.AddVehicleDialog import AddVehicleDialog
-from Views.Admin.EditVehicleDialog import EditVehicleDialog
-from Views.Admin.AddViolationDialog import AddViolationDialog
-
-# Utilities
-from Controllers.Utility.ChartGenerator import ChartGenerator
+# Resident and admin views, charts (matplotlib) and the PDF export (reportlab)
+# are imported where they are first used, so the login screen does not wait
+# for them (see benchmarks/startup_benchmark.py)
 
 from datetime import datetime
 
@@ -49,7 +39,11 @@ class Application:
     """Main application coordinator"""
 
     def __init__(self):
-        self.auth_controller = AuthController()
+        # One database service (and connection pool) shared by every controller
+        self.db = get_shared_database()
+        # Background workers never take the connection the GUI thread needs
+        configure_thread_pools(self.db.pool.pool_size)
+        self.auth_controller = AuthController(self.db)
         self.current_window = None
 
     def start(self):
@@ -108,104 +102,145 @@ class Application:
 
     def show_resident_window(self, user_data: dict):
         """Open resident window with all pages configured"""
-        controller = ResidentController(user_data)
-        payment_controller = PaymentController()
+        from Views.Resident.ResidentMainView import ResidentMainView
+        from Views.Resident.DashboardView import DashboardView
+        from Views.Resident.ViolationsView import ViolationsView
+        from Views.Resident.ViolationHistoryView import ViolationHistoryView
+        from Views.Resident.PaymentHistoryView import PaymentHistoryView
+        from Views.Resident.PaymentDialog import PaymentDialog
+
+        controller = ResidentController(user_data, self.db)
+        payment_controller = PaymentController(self.db)
 
         resident_window = ResidentMainView(user_data)
+        loader = DataLoader(resident_window)
+        watchers = []  # (tables, patch, page index) of the built pages, see _start_change_feed
+
+        # Pages are built and queried on their first visit (see PageStack)
+        def build_dashboard():
+            from Controllers.Utility.ChartGenerator import ChartGenerator
+
+            dashboard = DashboardView()
+            dashboard.show_loading()
+            chart = ChartGenerator.create_resident_dashboard_chart()
+
+            def load():
+                loader.load(controller.get_dashboard_stats, dashboard.update_statistics)
+                loader.load(
+                    controller.get_monthly_chart_data,
+                    lambda monthly_data: self._show_chart(dashboard, chart, monthly_data, ('resident',))
+                )
 
-        dashboard = DashboardView()
-        violations = ViolationsView()
-        violation_history = ViolationHistoryView()
-        payment_history = PaymentHistoryView()
+            watchers.append((('violations', 'payments'), None, ResidentMainView.DASHBOARD_PAGE))
+            return dashboard, load
 
-        resident_window.add_page(dashboard)
-        resident_window.add_page(violations)
-        resident_window.add_page(violation_history)
-        resident_window.add_page(payment_history)
+        def build_violations():
+            violations = ViolationsView()
 
-        stats = controller.get_dashboard_stats()
-        dashboard.update_statistics(stats)
+            violations_search = DebouncedSearch(
+                lambda rows, text, status: (rows, controller.find_violations(rows, text, status)),
+                lambda result: self._show_search_result(violations, result),
+                parent=violations
+            )
 
-        monthly_data = controller.get_monthly_chart_data()
-        chart = ChartGenerator.create_resident_dashboard_chart(monthly_data)
-        dashboard.update_chart(chart)
+            def _apply_violations_filters(now=False):
+                """Show the loaded violations matching the search text and status"""
+                request = violations_search.request_now if now else violations_search.request
+                request(
+                    violations.loaded_rows(),
+                    violations.search_input.text(),
+                    violations.status_filter.currentText()
+                )
 
-        violations_data = controller.get_violations()
-        violations.populate_table(violations_data)
-
-        def handle_violations_search(text):
-            status_filter = violations.status_filter.currentText()
-            filtered = controller.filter_violations(violations_data, text, status_filter)
-            violations.populate_table(filtered)
-
-        def handle_violations_filter(status):
-            search_text = violations.search_input.text()
-            filtered = controller.filter_violations(violations_data, search_text, status)
-            violations.populate_table(filtered)
-
-        def handle_violations_refresh():
-            nonlocal violations_data
-            violations_data = controller.get_violations()
-            violations.populate_table(violations_data)
-
-        def handle_payment_request(violation_data):
-            payment_dialog = PaymentDialog(violation_data, resident_window)
-            payment_dialog.payment_submitted.connect(
-                lambda form_data: self.process_resident_payment(
-                    payment_controller, violation_data, form_data, payment_dialog, resident_window, controller
+            def show_violations(violations_data):
+                violations.populate_table(violations_data)
+                _apply_violations_filters(now=True)
+
+            def load():
+                loader.load(controller.get_violations, show_violations)
+
+            def patch_violations(violations_data):
+                violations.patch_rows(violations_data)
+                if violations_data:
+                    _apply_violations_filters(now=True)
+
+            def patch(changes):
+                violation_ids = set().union(*changes.values())
+                loader.load(controller.get_violations_by_ids, patch_violations, violation_ids)
+
+            def handle_payment_request(violation_data):
+                payment_dialog = PaymentDialog(violation_data, resident_window)
+                payment_dialog.payment_submitted.connect(
+                    lambda form_data: self.process_resident_payment(
+                        payment_controller, violation_data, form_data, payment_dialog, resident_window, controller
+                    )
                 )
+                payment_dialog.exec()
+
+            violations.search_changed.connect(lambda text: _apply_violations_filters())
+            violations.filter_changed.connect(lambda status: _apply_violations_filters(now=True))
+            violations.refresh_requested.connect(load)
+            violations.payment_requested.connect(handle_payment_request)
+            watchers.append((('violations', 'payments'), patch, ResidentMainView.VIOLATIONS_PAGE))
+            return violations, load
+
+        def build_violation_history():
+            violation_history = ViolationHistoryView()
+
+            history_search = DebouncedSearch(
+                lambda rows, text, status, year: (
+                    rows, controller.find_violations(rows, text, status, year, page='history')
+                ),
+                lambda result: self._show_search_result(violation_history, result),
+                parent=violation_history
             )
-            payment_dialog.exec()
-
-        violations.search_changed.connect(handle_violations_search)
-        violations.filter_changed.connect(handle_violations_filter)
-        violations.refresh_requested.connect(handle_violations_refresh)
-        violations.payment_requested.connect(handle_payment_request)
 
-        all_violations = controller.get_violations()
-        violation_history.populate_table(all_violations)
+            def _apply_history_filters(now=False):
+                """Apply all three filters (search, year, status) together"""
+                request = history_search.request_now if now else history_search.request
+                request(
+                    violation_history.loaded_rows(),
+                    violation_history.search_input.text(),
+                    violation_history.status_filter.currentText(),
+                    violation_history.year_filter.currentText()
+                )
 
-        def _apply_history_filters():
-            """Apply all three filters (search, year, status) together"""
-            search_text = violation_history.search_input.text()
-            year = violation_history.year_filter.currentText()
-            status = violation_history.status_filter.currentText()
+            def show_history(violations_data):
+                violation_history.populate_table(violations_data)
+                _apply_history_filters(now=True)
 
-            filtered = controller.filter_violations(all_violations, search_text, status)
+            def load():
+                loader.load(controller.get_violations, show_history)
 
-            if year and year != "All Years":
-                filtered = [v for v in filtered if str(v.get('date', '')).startswith(year)]
+            def patch_history(violations_data):
+                violation_history.patch_rows(violations_data)
+                if violations_data:
+                    _apply_history_filters(now=True)
 
-            violation_history.populate_table(filtered)
+            def patch(changes):
+                violation_ids = set().union(*changes.values())
+                loader.load(controller.get_violations_by_ids, patch_history, violation_ids)
 
-        def handle_history_year_filter(year):
-            _apply_history_filters()
+            violation_history.search_changed.connect(lambda text: _apply_history_filters())
+            violation_history.year_filter_changed.connect(lambda year: _apply_history_filters(now=True))
+            violation_history.status_filter_changed.connect(lambda status: _apply_history_filters(now=True))
+            watchers.append((('violations', 'payments'), patch, ResidentMainView.VIOLATION_HISTORY_PAGE))
+            return violation_history, load
 
-        def handle_history_status_filter(status):
-            _apply_history_filters()
+        def build_payment_history():
+            payment_history = PaymentHistoryView()
 
-        violation_history.search_changed.connect(lambda text: _apply_history_filters())
-        violation_history.year_filter_changed.connect(handle_history_year_filter)
-        violation_history.status_filter_changed.connect(handle_history_status_filter)
+            def load():
+                loader.load(controller.get_payment_history, payment_history.populate_table)
 
-        payments = controller.get_payment_history()
-        payment_history.populate_table(payments)
+            watchers.append((('payments',), None, ResidentMainView.PAYMENT_HISTORY_PAGE))
+            return payment_history, load
 
-        def handle_page_change(index):
-            if index == 0:
-                stats = controller.get_dashboard_stats()
-                dashboard.update_statistics(stats)
-                monthly_data = controller.get_monthly_chart_data()
-                chart = ChartGenerator.create_resident_dashboard_chart(monthly_data)
-                dashboard.update_chart(chart)
-            elif index == 2:
-                all_violations = controller.get_violations()
-                violation_history.populate_table(all_violations)
-            elif index == 3:
-                payments = controller.get_payment_history()
-                payment_history.populate_table(payments)
+        resident_window.add_page(build_dashboard)
+        resident_window.add_page(build_violations)
+        resident_window.add_page(build_violation_history)
+        resident_window.add_page(build_payment_history)
 
-        resident_window.page_changed.connect(handle_page_change)
         resident_window.logout_requested.connect(
             lambda: self._handle_logout(resident_window, user_data)
         )
@@ -214,6 +249,9 @@ class Application:
         self.login_view.close()
         self.current_window = resident_window
 
+        self._start_change_feed(resident_window, watchers)
+        resident_window.show_page(ResidentMainView.DASHBOARD_PAGE)
+
     def process_resident_payment(self, payment_controller, violation_data, form_data, dialog, window, controller):
         """Process payment submission"""
         is_valid, error_msg = payment_controller.validate_payment_form(form_data)
@@ -235,120 +273,195 @@ class Application:
             dialog.show_success(result['receipt_no'], result['amount'])
             dialog.accept()
 
-            violations_view = window.stacked_widget.widget(1)
-            violations_data = controller.get_violations()
-            violations_view.populate_table(violations_data)
-
-            dashboard_view = window.stacked_widget.widget(0)
-            stats = controller.get_dashboard_stats()
-            dashboard_view.update_statistics(stats)
+            window.data_changed.emit()
         else:
             dialog.show_error(result)
 
     def show_admin_window(self, admin_data: dict):
         """Open admin window with all pages configured"""
-        admin_controller = AdminController(admin_data)
-        violation_controller = ViolationController()
-        vehicle_controller = VehicleController()
-        report_controller = ReportController()
-
-        admin_controller.initialize_database()
+        from Views.Admin.AdminMainView import AdminMainView
+        from Views.Admin.AdminDashboardView import AdminDashboardView
+        from Views.Admin.ViolationsManagementView import ViolationsManagementView
+        from Views.Admin.ResidentsManagementView import ResidentsManagementView
+        from Views.Admin.VehiclesManagementView import VehiclesManagementView
+        from Views.Admin.ReportsView import ReportsView
+
+        admin_controller = AdminController(admin_data, self.db)
+        violation_controller = ViolationController(self.db)
+        vehicle_controller = VehicleController(self.db)
+        report_controller = ReportController(self.db)
 
         admin_window = AdminMainView(admin_data)
+        loader = DataLoader(admin_window)
+        export_jobs = JobQueue(admin_window)
+        watchers = []  # (tables, patch, page index) of the built pages, see _start_change_feed
+
+        # Pages are built and queried on their first visit (see PageStack)
+        def build_dashboard():
+            from Controllers.Utility.ChartGenerator import ChartGenerator
+
+            dashboard = AdminDashboardView()
+            dashboard.show_loading()
+            chart = ChartGenerator.create_admin_dashboard_chart()
+
+            def load_chart(year: int = None):
+                # A year seen before is shown from the chart's frame cache while it reloads
+                chart.show_cached(('admin', year))
+                loader.load(
+                    admin_controller.get_monthly_chart_data,
+                    lambda monthly_data: self._show_chart(dashboard, chart, monthly_data, ('admin', year)),
+                    year
+                )
 
-        dashboard = AdminDashboardView()
-        violations = ViolationsManagementView()
-        residents = ResidentsManagementView()
-        vehicles = VehiclesManagementView()
-        reports = ReportsView()
+            def load():
+                loader.load(admin_controller.get_dashboard_statistics, dashboard.update_statistics)
+                load_chart(dashboard.get_selected_year())
 
-        admin_window.add_page(dashboard)
-        admin_window.add_page(violations)
-        admin_window.add_page(residents)
-        admin_window.add_page(vehicles)
-        admin_window.add_page(reports)
+            dashboard.year_filter_changed.connect(load_chart)
+            watchers.append((
+                ('violations', 'payments', 'vehicles', 'residents'), None, AdminMainView.DASHBOARD_PAGE
+            ))
+            return dashboard, load
 
-        stats = admin_controller.get_dashboard_statistics()
-        dashboard.update_statistics(stats)
+        def build_violations():
+            violations = ViolationsManagementView()
 
-        monthly_data = admin_controller.get_monthly_chart_data()
-        chart = ChartGenerator.create_admin_dashboard_chart(monthly_data)
-        dashboard.update_chart(chart)
+            # Searching pages from the database, off the GUI thread
+            violations_search = DebouncedSearch(
+                lambda text: violation_controller.get_violations_page(search_text=text),
+                lambda page: violations.populate_table(*page),
+                parent=violations
+            )
+
+            def load():
+                violations_search.request_now(violations.violations_search.text())
 
-        violations_data = violation_controller.get_all_violations()
-        violations.populate_table(violations_data)
+            def patch(changes):
+                if violations.violations_search.text():
+                    load()  # the search decides which rows belong on the page
+                    return
+                violation_ids = set().union(*changes.values())
+                loader.load(violation_controller.get_violations_by_ids, violations.patch_rows, violation_ids)
 
-        violations.search_changed.connect(
-            lambda text: violations.populate_table(
-                violation_controller.search_violations(violations_data, text)
+            violations.search_changed.connect(violations_search.request)
+            violations.refresh_requested.connect(load)
+            violations.more_rows_requested.connect(
+                lambda: self._load_more_violations(violation_controller, violations, loader, violations_search)
             )
-        )
-        violations.refresh_requested.connect(
-            lambda: self._refresh_violations(violation_controller, violations)
-        )
-        violations.add_violation_requested.connect(
-            lambda: self._show_add_violation_dialog(violation_controller, vehicle_controller, violations, admin_window)
-        )
-        violations.view_violation_requested.connect(
-            lambda v_id: self._show_violation_details(violation_controller, v_id, admin_window)
-        )
+            violations.add_violation_requested.connect(
+                lambda: self._show_add_violation_dialog(violation_controller, vehicle_controller, admin_window)
+            )
+            violations.view_violation_requested.connect(
+                lambda v_id: self._show_violation_details(violation_controller, v_id, admin_window)
+            )
+            watchers.append((('violations', 'payments'), patch, AdminMainView.VIOLATIONS_PAGE))
+            return violations, load
 
-        residents_data = admin_controller.get_all_residents()
-        residents.populate_table(residents_data)
+        def build_residents():
+            residents = ResidentsManagementView()
 
-        residents.search_changed.connect(
-            lambda text: residents.populate_table(
-                admin_controller.search_residents(residents_data, text)
+            residents_search = DebouncedSearch(
+                lambda rows, text: (rows, admin_controller.find_residents(rows, text)),
+                lambda result: self._show_search_result(residents, result),
+                parent=residents
             )
-        )
-        residents.view_resident_requested.connect(
-            lambda r_id: self._show_resident_details(admin_controller, r_id, admin_window)
-        )
 
-        vehicles_data = vehicle_controller.get_all_vehicles()
-        vehicles.populate_table(vehicles_data)
+            def show_residents(residents_data):
+                residents.populate_table(residents_data)
+                residents_search.request_now(residents.loaded_rows(), residents.residents_search.text())
 
-        vehicles.search_changed.connect(
-            lambda text: vehicles.populate_table(
-                vehicle_controller.search_vehicles(vehicles_data, text)
+            def load():
+                loader.load(admin_controller.get_all_residents, show_residents)
+
+            def patch_residents(residents_data):
+                residents.patch_rows(residents_data)
+                if residents.residents_search.text():
+                    residents_search.request_now(residents.loaded_rows(), residents.residents_search.text())
+
+            def patch(changes):
+                loader.load(admin_controller.get_residents_by_ids, patch_residents, changes['residents'])
+
+            residents.search_changed.connect(
+                lambda text: residents_search.request(residents.loaded_rows(), text)
             )
-        )
-        vehicles.add_vehicle_requested.connect(
-            lambda: self._show_add_vehicle_dialog(vehicle_controller, admin_controller, vehicles, admin_window)
-        )
-        vehicles.edit_vehicle_requested.connect(
-            lambda v_id: self._show_edit_vehicle_dialog(vehicle_controller, v_id, vehicles, admin_window)
-        )
-        vehicles.view_vehicle_requested.connect(
-            lambda v_id: self._show_vehicle_details(vehicle_controller, v_id, admin_window)
-        )
+            residents.view_resident_requested.connect(
+                lambda r_id: self._show_resident_details(admin_controller, r_id, admin_window)
+            )
+            watchers.append((('residents',), patch, AdminMainView.RESIDENTS_PAGE))
+            return residents, load
 
-        reports.view_violations_report_requested.connect(
-            lambda: self._show_violations_report(report_controller, reports)
-        )
-        reports.export_pdf_requested.connect(
-            lambda: self._export_violations_pdf(report_controller, reports, admin_window)
-        )
-        reports.payment_report_requested.connect(
-            lambda: self._show_payment_report(report_controller, reports)
-        )
+        def build_vehicles():
+            vehicles = VehiclesManagementView()
+
+            vehicles_search = DebouncedSearch(
+                lambda rows, text: (rows, vehicle_controller.find_vehicles(rows, text)),
+                lambda result: self._show_search_result(vehicles, result),
+                parent=vehicles
+            )
+
+            def show_vehicles(vehicles_data):
+                vehicles.populate_table(vehicles_data)
+                vehicles_search.request_now(vehicles.loaded_rows(), vehicles.vehicles_search.text())
+
+            def load():
+                loader.load(vehicle_controller.get_all_vehicles, show_vehicles)
 
-        def handle_page_change(index):
-            if index == 0:
-                stats = admin_controller.get_dashboard_statistics()
-                dashboard.update_statistics(stats)
-                year = dashboard.get_selected_year()
-                monthly_data = admin_controller.get_monthly_chart_data(year=year)
-                chart = ChartGenerator.create_admin_dashboard_chart(monthly_data)
-                dashboard.update_chart(chart)
-
-        def handle_year_filter_changed(year: int):
-            monthly_data = admin_controller.get_monthly_chart_data(year=year)
-            chart = ChartGenerator.create_admin_dashboard_chart(monthly_data)
-            dashboard.update_chart(chart)
-
-        dashboard.year_filter_changed.connect(handle_year_filter_changed)
-        admin_window.page_changed.connect(handle_page_change)
+            def patch_vehicles(vehicles_data):
+                vehicles.patch_rows(vehicles_data)
+                if vehicles.vehicles_search.text():
+                    vehicles_search.request_now(vehicles.loaded_rows(), vehicles.vehicles_search.text())
+
+            def patch(changes):
+                loader.load(vehicle_controller.get_vehicles_by_ids, patch_vehicles, changes['vehicles'])
+
+            vehicles.search_changed.connect(
+                lambda text: vehicles_search.request(vehicles.loaded_rows(), text)
+            )
+            vehicles.add_vehicle_requested.connect(
+                lambda: self._show_add_vehicle_dialog(vehicle_controller, admin_controller, admin_window)
+            )
+            vehicles.edit_vehicle_requested.connect(
+                lambda v_id: self._show_edit_vehicle_dialog(vehicle_controller, v_id, admin_window)
+            )
+            vehicles.view_vehicle_requested.connect(
+                lambda v_id: self._show_vehicle_details(vehicle_controller, v_id, admin_window)
+            )
+            watchers.append((('vehicles',), patch, AdminMainView.VEHICLES_PAGE))
+            return vehicles, load
+
+        def build_reports():
+            reports = ReportsView()
+            reports.view_violations_report_requested.connect(
+                lambda: self._show_violations_report(report_controller, reports, loader)
+            )
+            reports.export_pdf_requested.connect(
+                lambda: self._export_violations_pdf(report_controller, export_jobs, reports, admin_window)
+            )
+            reports.cancel_export_requested.connect(export_jobs.cancel)
+            self._connect_export_jobs(export_jobs, reports, admin_window)
+            reports.trend_report_requested.connect(
+                lambda granularity: self._show_trend_report(report_controller, reports, loader, granularity)
+            )
+            reports.revenue_report_requested.connect(
+                lambda granularity: self._show_revenue_report(report_controller, reports, loader, granularity)
+            )
+            reports.export_revenue_pdf_requested.connect(
+                lambda granularity: self._export_revenue_pdf(
+                    report_controller, export_jobs, reports, admin_window, granularity
+                )
+            )
+            reports.payment_report_requested.connect(
+                lambda: self._show_payment_report(report_controller, reports, loader)
+            )
+            return reports
+
+        admin_window.add_page(build_dashboard)
+        admin_window.add_page(build_violations)
+        admin_window.add_page(build_residents)
+        admin_window.add_page(build_vehicles)
+        admin_window.add_page(build_reports)
+
+        admin_window.logout_requested.connect(export_jobs.cancel_all)
         admin_window.logout_requested.connect(
             lambda: self._handle_logout(admin_window, admin_data)
         )
@@ -357,23 +470,88 @@ class Application:
         self.login_view.close()
         self.current_window = admin_window
 
-    def _refresh_violations(self, controller, view):
-        violations_data = controller.get_all_violations()
-        view.populate_table(violations_data)
+        def on_migrated(migration_result):
+            admin_window.set_navigation_enabled(True)
+            self._start_change_feed(admin_window, watchers)
+            admin_window.show_page(AdminMainView.DASHBOARD_PAGE)
+
+        # The page queries rely on the migrated schema
+        admin_window.set_navigation_enabled(False)
+        loader.load(admin_controller.initialize_database, on_migrated)
+
+    def _start_change_feed(self, window, watchers):
+        """
+        Poll the change log while the window is open and patch its built pages
+
+        Each watcher gets only the changed records of the tables it watches.
+        A page without a patch, and every built page when too much changed
+        to patch, is invalidated instead: it reloads now if it is showing,
+        otherwise on its next visit. The window's own writes trigger a poll
+        through data_changed.
+        """
+        feed = ChangeFeedController(self.db)
+
+        def dispatch(changes):
+            for tables, patch, page_index in list(watchers):
+                if changes is None:
+                    window.invalidate_page(page_index)
+                    continue
+                watched = {table: changes[table] for table in tables if table in changes}
+                if watched:
+                    if patch is None:
+                        window.invalidate_page(page_index)
+                    else:
+                        patch(watched)
+
+        poller = PeriodicTask(feed.poll, dispatch, CHANGE_POLL_INTERVAL_MS, parent=window)
+        window.data_changed.connect(poller.run_now)
+        window.logout_requested.connect(poller.stop)
+        poller.start()
+
+    def _show_search_result(self, view, result):
+        """Apply a (rows, row ids) search result unless the view was reloaded since"""
+        rows, row_ids = result
+        if rows is view.loaded_rows():
+            view.show_rows(row_ids)
+
+    def _show_chart(self, dashboard, chart, monthly_data, key):
+        """Show monthly data in the dashboard's chart, which updates in place after the first load"""
+        chart.set_data(monthly_data, key)
+        dashboard.update_chart(chart)
+
+    def _load_more_violations(self, controller, view, loader, search=None):
+        if search is not None and search.is_pending():
+            return  # the pending search reloads the table from its first page
+        after = view.last_page_row
+
+        def append(page):
+            if view.last_page_row is not after:
+                return  # the table was reloaded while this page was loading
+            view.append_rows(*page)
+
+        # The view sends no more_rows_requested until append_rows or load_more_failed
+        loader.load(
+            lambda text: controller.get_violations_page(after=after, search_text=text),
+            append,
+            view.violations_search.text(),
+            failed=lambda message: view.load_more_failed()
+        )
+
+    def _show_add_violation_dialog(self, violation_controller, vehicle_controller, parent):
+        from Views.Admin.AddViolationDialog import AddViolationDialog
 
-    def _show_add_violation_dialog(self, violation_controller, vehicle_controller, violations_view, parent):
         vehicles_list = vehicle_controller.get_vehicles_for_dropdown()
         types_list = violation_controller.get_violation_types()
 
         dialog = AddViolationDialog(vehicles_list, types_list, parent)
         dialog.violation_submitted.connect(
             lambda form_data: self._handle_add_violation(
-                violation_controller, form_data, dialog, violations_view
+                violation_controller, form_data, dialog, parent
             )
         )
         dialog.exec()
 
-    def _handle_add_violation(self, controller, form_data, dialog, view):
+    def _handle_add_violation(self, controller, form_data, dialog, window):
         success, message = controller.add_violation(
             form_data['vehicle_id'],
             form_data['violation_type_id'],
@@ -383,7 +561,7 @@ class Application:
         if success:
             QMessageBox.information(dialog, "Success", message)
             dialog.accept()
-            self._refresh_violations(controller, view)
+            window.data_changed.emit()
         else:
             dialog.show_error(message)
 
@@ -417,18 +595,20 @@ class Application:
             msg.setText(details)
             msg.exec()
 
-    def _show_add_vehicle_dialog(self, vehicle_controller, admin_controller, vehicles_view, parent):
+    def _show_add_vehicle_dialog(self, vehicle_controller, admin_controller, parent):
+        from Views.Admin.AddVehicleDialog import AddVehicleDialog
+
         residents_list = admin_controller.get_all_residents()
 
         dialog = AddVehicleDialog(residents_list, parent)
         dialog.vehicle_submitted.connect(
             lambda form_data: self._handle_add_vehicle(
-                vehicle_controller, form_data, dialog, vehicles_view
+                vehicle_controller, form_data, dialog, parent
             )
         )
         dialog.exec()
 
-    def _handle_add_vehicle(self, controller, form_data, dialog, view):
+    def _handle_add_vehicle(self, controller, form_data, dialog, window):
         success, message = controller.add_vehicle(
             form_data['resident_id'],
             form_data['plate_no'],
@@ -440,12 +620,13 @@ class Application:
         if success:
             QMessageBox.information(dialog, "Success", message)
             dialog.accept()
-            vehicles_data = controller.get_all_vehicles()
-            view.populate_table(vehicles_data)
+            window.data_changed.emit()
         else:
             dialog.show_error(message)
 
-    def _show_edit_vehicle_dialog(self, controller, vehicle_id, vehicles_view, parent):
+    def _show_edit_vehicle_dialog(self, controller, vehicle_id, parent):
+        from Views.Admin.EditVehicleDialog import EditVehicleDialog
+
         vehicle_data = controller.get_vehicle_details(vehicle_id)
 
         if not vehicle_data:
@@ -455,12 +636,12 @@ class Application:
         dialog = EditVehicleDialog(vehicle_data, parent)
         dialog.vehicle_updated.connect(
             lambda form_data: self._handle_update_vehicle(
-                controller, form_data, dialog, vehicles_view
+                controller, form_data, dialog, parent
             )
         )
         dialog.exec()
 
-    def _handle_update_vehicle(self, controller, form_data, dialog, view):
+    def _handle_update_vehicle(self, controller, form_data, dialog, window):
         success, message = controller.update_vehicle(
             form_data['vehicle_id'],
             form_data['brand'],
@@ -471,8 +652,7 @@ class Application:
         if success:
             QMessageBox.information(dialog, "Success", message)
             dialog.accept()
-            vehicles_data = controller.get_all_vehicles()
-            view.populate_table(vehicles_data)
+            window.data_changed.emit()
         else:
             dialog.show_error(message)
 
@@ -539,36 +719,96 @@ class Application:
             msg.setText(details)
             msg.exec()
 
-    def _show_violations_report(self, controller, view):
-        violations = controller.get_violations_report_data()
-        stats = controller.calculate_report_statistics(violations)
-        view.show_violations_table(violations, stats)
-
-    def _export_violations_pdf(self, controller, view, parent):
-        violations = controller.get_violations_report_data()
+    def _show_violations_report(self, controller, view, loader):
+        def fetch():
+            violations = controller.get_violations_report_data()
+            return violations, controller.calculate_report_statistics(violations)
 
-        if not violations:
-            view.show_message("No Data", "No violations data to export", is_error=True)
-            return
+        loader.load(fetch, lambda report: view.show_violations_table(*report))
 
+    def _export_violations_pdf(self, controller, jobs, view, parent):
         file_path, _ = QFileDialog.getSaveFileName(
             parent,
             "Export Violations Report",
             f"violations_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
             "PDF Files (*.pdf)"
         )
+        if not file_path:
+            return
+
+        def export(job):
+            success, message = controller.export_violations_report_to_pdf(
+                file_path, progress=lambda rows, pages: job.report(rows=rows, pages=pages)
+            )
+            # A cancel raised inside the PDF build comes back as a failed export
+            if job.cancelled:
+                raise JobCancelled()
+            return success, f"{os.path.basename(file_path)}: {message}"
+
+        # Rows are streamed into the PDF on the job worker; exports queue behind each other
+        view.add_export_job(jobs.submit(export), file_path)
+
+    def _export_revenue_pdf(self, controller, jobs, view, parent, granularity):
+        file_path, _ = QFileDialog.getSaveFileName(
+            parent,
+            "Export Revenue Report",
+            f"revenue_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+            "PDF Files (*.pdf)"
+        )
+        if not file_path:
+            return
+
+        def export(job):
+            success, message = controller.export_revenue_report_to_pdf(file_path, granularity)
+            return success, f"{os.path.basename(file_path)}: {message}"
+
+        view.add_export_job(jobs.submit(export), file_path)
 
-        if file_path:
-            success, message = controller.export_violations_report_to_pdf(file_path, violations)
-            view.show_message(
-                "Export " + ("Successful" if success else "Failed"),
-                message,
-                is_error=not success
+    def _connect_export_jobs(self, jobs, view, window):
+        def on_progress(job_id, counters):
+            view.update_export_job(
+                job_id, f"Exporting... {counters['rows']:,} rows, {counters['pages']:,} pages"
             )
 
-    def _show_payment_report(self, controller, view):
-        stats, recent_payments = controller.get_payment_report_data()
-        view.show_payment_report(stats, recent_payments)
+        def on_finished(job_id, result):
+            success, message = result
+            view.finish_export_job(job_id, "Done" if success else "Failed", is_error=not success)
+            window.show_notification(message, is_error=not success)
+
+        def on_failed(job_id, message):
+            view.finish_export_job(job_id, "Failed", is_error=True)
+            window.show_notification(f"Export failed: {message}", is_error=True)
+
+        jobs.started.connect(lambda job_id: view.update_export_job(job_id, "Exporting..."))
+        jobs.progress.connect(on_progress)
+        jobs.finished.connect(on_finished)
+        jobs.failed.connect(on_failed)
+        jobs.cancelled.connect(lambda job_id: view.finish_export_job(job_id, "Cancelled"))
+
+    def _show_trend_report(self, controller, view, loader, granularity):
+        from Controllers.Utility.ChartGenerator import ChartGenerator
+
+        loader.load(
+            controller.get_violation_trend,
+            lambda series: view.show_trend_report(
+                series, ChartGenerator.create_violation_trend_chart(series)
+            ),
+            granularity
+        )
+
+    def _show_revenue_report(self, controller, view, loader, granularity):
+        from Controllers.Utility.ChartGenerator import ChartGenerator
+
+        def show(analytics):
+            if analytics is None:
+                view.show_message("Error", "Could not load the revenue analytics", is_error=True)
+                return
+            view.show_revenue_report(analytics, ChartGenerator.create_revenue_chart(analytics))
+
+        loader.load(controller.get_revenue_analytics, show, granularity)
+
+    def _show_payment_report(self, controller, view, loader):
+        loader.load(controller.get_payment_report_data, lambda report: view.show_payment_report(*report))
 
     def _handle_logout(self, window, user_data: dict):
         self.auth_controller.logout(user_data)
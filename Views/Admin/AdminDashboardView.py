@@ -197,6 +197,21 @@ class AdminDashboardView(QWidget):
     # ------------------------------------------------------------------
     # public update helpers
     # ------------------------------------------------------------------
+    def show_loading(self):
+        """Placeholder cards and chart until the first data arrives"""
+        self._clear_grid_layout(self.stats_grid)
+        titles = ["Total Violations", "Paid Violations", "Unpaid Violations",
+                  "Total Residents", "Total Vehicles", "Total Revenue"]
+        for i, title in enumerate(titles):
+            self.stats_grid.addWidget(self._create_stat_card(title, "…"), i // 3, i % 3)
+        for col in range(3):
+            self.stats_grid.setColumnStretch(col, 1)
+
+        loading = QLabel("Loading…")
+        loading.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        loading.setStyleSheet("color: #aaaaaa;")
+        self.update_chart(loading)
+
     def update_statistics(self, stats: dict):
         """
         Update statistics cards
@@ -224,7 +239,9 @@ class AdminDashboardView(QWidget):
             self.stats_grid.setColumnStretch(col, 1)
 
     def update_chart(self, chart_widget):
-        """Update chart display"""
+        """Update chart display (a chart already shown updates itself in place)"""
+        if self.chart_container.indexOf(chart_widget) >= 0:
+            return
         self._clear_layout(self.chart_container)
         self.chart_container.addWidget(chart_widget)
 
@@ -7,6 +7,7 @@ from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 from Controllers.Utility.ResourceHelper import ResourceHelper
 from Views.Common.StyledWidgets import StyledWidgets
+from Views.Common.PageStack import PageStack
 
 
 class AdminMainView(QMainWindow):
@@ -15,6 +16,13 @@ class AdminMainView(QMainWindow):
     # Signals
     logout_requested = pyqtSignal()
     page_changed = pyqtSignal(int)  # Page index
+    data_changed = pyqtSignal()  # this window wrote to the database
+
+    # Page indices, in sidebar order
+    DASHBOARD_PAGE, VIOLATIONS_PAGE, RESIDENTS_PAGE, VEHICLES_PAGE, REPORTS_PAGE = range(5)
+
+    # How long a status bar notification stays up
+    NOTIFICATION_TIMEOUT_MS = 10000
 
     def __init__(self, admin_data: dict):
         super().__init__()
@@ -38,8 +46,8 @@ class AdminMainView(QMainWindow):
         self._create_sidebar()
         main_layout.addWidget(self.sidebar)
 
-        # Create stacked widget for pages
-        self.stacked_widget = QStackedWidget()
+        # Create stacked widget for pages (built on first visit)
+        self.stacked_widget = PageStack()
         self.stacked_widget.setStyleSheet("background-color: #2d2d2d;")
         main_layout.addWidget(self.stacked_widget, 1)
 
@@ -179,7 +187,7 @@ class AdminMainView(QMainWindow):
         """Handle navigation button click"""
         self._update_nav_buttons(button)
         self.page_changed.emit(page_index)
-        self.stacked_widget.setCurrentIndex(page_index)
+        self.stacked_widget.show_page(page_index)
 
     def _update_nav_buttons(self, active_btn: QPushButton):
         """Update navigation button styles"""
@@ -233,13 +241,35 @@ class AdminMainView(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             self.logout_requested.emit()
 
-    def add_page(self, page: QWidget):
-        """Add a page to the stacked widget"""
-        self.stacked_widget.addWidget(page)
+    def add_page(self, page):
+        """Add a page (or a factory building it on first visit) to the stacked widget"""
+        return self.stacked_widget.add_page(page)
+
+    def page(self, index: int) -> QWidget:
+        """Get a page, building it if it has not been visited yet"""
+        return self.stacked_widget.page(index)
+
+    def invalidate_page(self, index: int):
+        """Reload a page's data (now if showing, otherwise on its next visit)"""
+        self.stacked_widget.invalidate(index)
+
+    def set_navigation_enabled(self, enabled: bool):
+        """Enable or disable the sidebar page buttons"""
+        for btn in [self.dashboard_btn, self.violations_btn, self.residents_btn,
+                    self.vehicles_btn, self.reports_btn]:
+            btn.setEnabled(enabled)
+
+    def show_notification(self, message: str, is_error: bool = False):
+        """Show a passing message in the status bar, whichever page is open"""
+        status_bar = self.statusBar()
+        status_bar.setStyleSheet(
+            f"background-color: #252525; color: {'#f44336' if is_error else '#4caf50'}; font-size: 10pt;"
+        )
+        status_bar.showMessage(message, self.NOTIFICATION_TIMEOUT_MS)
 
     def show_page(self, index: int):
         """Show specific page"""
-        self.stacked_widget.setCurrentIndex(index)
+        self.stacked_widget.show_page(index)
         # Update nav button highlighting
         buttons = [
             self.dashboard_btn,
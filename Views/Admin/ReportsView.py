@@ -2,10 +2,42 @@
 Views/Admin/ReportsView.py
 Reports and analytics page (extracted from ReportsPage.py)
 """
+import os
+
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 from Views.Common.StyledWidgets import StyledWidgets
+from Views.Common.TableModels import TableColumn, LazyTableModel, peso
+
+
+REPORT_VIOLATION_COLUMNS = [
+    TableColumn("ID", 'ViolationID'),
+    TableColumn("Resident", 'ResidentName'),
+    TableColumn("Contact", value=lambda v: v['ContactNo'] or "N/A"),
+    TableColumn("Plate", 'PlateNo'),
+    TableColumn("Vehicle", value=lambda v: f"{v['Brand']} {v['Model']}" if v['Brand'] else "N/A"),
+    TableColumn("Violation", 'ViolationName'),
+    TableColumn("Date", 'ViolationDate'),
+    TableColumn("Fine", 'FineAmount', display=peso),
+    TableColumn("Status", 'PaymentStatus'),
+    TableColumn("Paid Date", value=lambda v: v['PaymentDate'] or "-"),
+]
+
+RECENT_PAYMENT_COLUMNS = [
+    TableColumn("Payment ID", 'PaymentID'),
+    TableColumn("Resident", 'resident_name'),
+    TableColumn("Violation", 'ViolationName'),
+    TableColumn("Amount", 'FineAmount', display=peso),
+    TableColumn("Date", 'payment_date'),
+]
+
+# Trend report granularity selector: (label, granularity)
+TREND_GRANULARITIES = [
+    ("Monthly", 'month'),
+    ("Weekly", 'week'),
+    ("Daily", 'day'),
+]
 
 
 class ReportsView(QWidget):
@@ -15,9 +47,14 @@ class ReportsView(QWidget):
     view_violations_report_requested = pyqtSignal()
     export_pdf_requested = pyqtSignal()
     payment_report_requested = pyqtSignal()
+    trend_report_requested = pyqtSignal(str)  # granularity: 'day', 'week' or 'month'
+    revenue_report_requested = pyqtSignal(str)  # granularity
+    export_revenue_pdf_requested = pyqtSignal(str)  # granularity
+    cancel_export_requested = pyqtSignal(int)  # export job id
 
     def __init__(self):
         super().__init__()
+        self._export_rows = {}  # job id -> (status label, cancel button)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -54,13 +91,47 @@ class ReportsView(QWidget):
         )
         payment_report_btn.clicked.connect(lambda: self.payment_report_requested.emit())
 
+        # Violation Trend button
+        trend_btn = StyledWidgets.create_action_button(
+            "📈 Violation Trend",
+        )
+        trend_btn.clicked.connect(lambda: self.trend_report_requested.emit('month'))
+
+        # Revenue Analytics button
+        revenue_btn = StyledWidgets.create_action_button(
+            "💵 Revenue Analytics",
+        )
+        revenue_btn.clicked.connect(lambda: self.revenue_report_requested.emit('month'))
+
         button_layout.addWidget(view_violations_btn)
         button_layout.addWidget(export_btn)
         button_layout.addWidget(payment_report_btn)
+        button_layout.addWidget(trend_btn)
+        button_layout.addWidget(revenue_btn)
         button_layout.addStretch()
 
         layout.addLayout(button_layout)
 
+        # Export jobs, shown once the first export is queued
+        self.exports_panel = QFrame()
+        self.exports_panel.setStyleSheet("""
+            QFrame {
+                background-color: #363636;
+                border-radius: 12px;
+            }
+        """)
+        self.exports_layout = QVBoxLayout(self.exports_panel)
+        self.exports_layout.setContentsMargins(20, 10, 20, 10)
+        self.exports_layout.setSpacing(6)
+
+        exports_title = QLabel("PDF Exports")
+        exports_title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        exports_title.setStyleSheet("color: #e8bb41;")
+        self.exports_layout.addWidget(exports_title)
+
+        self.exports_panel.hide()
+        layout.addWidget(self.exports_panel)
+
         # Reports content area
         self.content_area = QScrollArea()
         self.content_area.setWidgetResizable(True)
@@ -105,31 +176,10 @@ class ReportsView(QWidget):
         widget_layout.addWidget(summary)
 
         # Table
-        table = QTableWidget()
-        table.setColumnCount(10)
-        table.setHorizontalHeaderLabels([
-            "ID", "Resident", "Contact", "Plate",
-            "Vehicle", "Violation", "Date",
-            "Fine", "Status", "Paid Date"
-        ])
-
+        table = QTableView()
         StyledWidgets.style_table(table)
-        table.setRowCount(len(violations))
-
-        for row, v in enumerate(violations):
-            vehicle = f"{v['Brand']} {v['Model']}" if v['Brand'] else "N/A"
-            paid_date = v['PaymentDate'] or "-"
-
-            table.setItem(row, 0, QTableWidgetItem(v['ViolationID']))
-            table.setItem(row, 1, QTableWidgetItem(v['ResidentName']))
-            table.setItem(row, 2, QTableWidgetItem(v['ContactNo'] or "N/A"))
-            table.setItem(row, 3, QTableWidgetItem(v['PlateNo']))
-            table.setItem(row, 4, QTableWidgetItem(vehicle))
-            table.setItem(row, 5, QTableWidgetItem(v['ViolationName']))
-            table.setItem(row, 6, QTableWidgetItem(v['ViolationDate']))
-            table.setItem(row, 7, QTableWidgetItem(f"₱{v['FineAmount']:,.2f}"))
-            table.setItem(row, 8, QTableWidgetItem(v['PaymentStatus']))
-            table.setItem(row, 9, QTableWidgetItem(paid_date))
+        table.setModel(LazyTableModel(REPORT_VIOLATION_COLUMNS, table))
+        table.model().set_rows(violations)
 
         table.resizeColumnsToContents()
         widget_layout.addWidget(table)
@@ -198,25 +248,18 @@ class ReportsView(QWidget):
         widget_layout.addWidget(recent_label)
 
         # Recent payments table
-        payments_table = QTableWidget()
-        payments_table.setColumnCount(5)
-        payments_table.setHorizontalHeaderLabels(["Payment ID", "Resident", "Violation", "Amount", "Date"])
+        payments_table = QTableView()
         StyledWidgets.style_table(payments_table)
 
         # Set normal readable text size (not too big)
         payments_table.setStyleSheet(payments_table.styleSheet() + """
-            QTableWidget { font-size: 10pt; }
+            QTableView { font-size: 10pt; }
             QHeaderView::section { font-size: 11pt; padding: 8px; }
         """)
         payments_table.verticalHeader().setDefaultSectionSize(35)
 
-        payments_table.setRowCount(len(recent_payments))
-        for row, payment in enumerate(recent_payments):
-            payments_table.setItem(row, 0, QTableWidgetItem(payment['PaymentID']))
-            payments_table.setItem(row, 1, QTableWidgetItem(payment['resident_name']))
-            payments_table.setItem(row, 2, QTableWidgetItem(payment['ViolationName']))
-            payments_table.setItem(row, 3, QTableWidgetItem(f"₱{payment['FineAmount']:,.2f}"))
-            payments_table.setItem(row, 4, QTableWidgetItem(payment['payment_date']))
+        payments_table.setModel(LazyTableModel(RECENT_PAYMENT_COLUMNS, payments_table))
+        payments_table.model().set_rows(recent_payments)
 
         # Make table responsive and adjust column widths
         header = payments_table.horizontalHeader()
@@ -234,6 +277,147 @@ class ReportsView(QWidget):
 
         self.content_area.setWidget(widget)
 
+    def show_trend_report(self, series: dict, chart_widget):
+        """Display a violation time series chart with a granularity selector"""
+        widget = QWidget()
+        widget_layout = QVBoxLayout(widget)
+        widget_layout.setContentsMargins(20, 15, 20, 15)
+        widget_layout.setSpacing(10)
+
+        # Title and granularity selector
+        title_layout = QHBoxLayout()
+        title = QLabel("Violation Trend")
+        title.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
+        title.setStyleSheet("color: #e8bb41;")
+        title_layout.addWidget(title)
+        title_layout.addStretch()
+
+        granularity_combo = QComboBox()
+        granularity_combo.setStyleSheet(
+            "background-color: #2a2a2a; color: #ffffff; padding: 6px 12px; border-radius: 6px;"
+        )
+        for text, granularity in TREND_GRANULARITIES:
+            granularity_combo.addItem(text, granularity)
+        granularity_combo.setCurrentIndex(granularity_combo.findData(series['granularity']))
+        granularity_combo.currentIndexChanged.connect(
+            lambda index: self.trend_report_requested.emit(granularity_combo.itemData(index))
+        )
+        title_layout.addWidget(granularity_combo)
+        widget_layout.addLayout(title_layout)
+
+        # Period summary
+        buckets = series['buckets']
+        if buckets:
+            summary = QLabel(
+                f"{buckets[0]:%d %b %Y} – {buckets[-1]:%d %b %Y} | "
+                f"Total: {sum(series['counts']):,} | Busiest: {max(series['counts']):,}"
+            )
+            summary.setStyleSheet("color: #4caf50; font-size: 12pt; margin: 5px 0;")
+            widget_layout.addWidget(summary)
+
+        chart_widget.setMinimumHeight(450)
+        widget_layout.addWidget(chart_widget, 1)
+
+        self.content_area.setWidget(widget)
+
+    def show_revenue_report(self, analytics: dict, chart_widget):
+        """Display revenue, collection rate and days-to-pay with a granularity selector"""
+        widget = QWidget()
+        widget_layout = QVBoxLayout(widget)
+        widget_layout.setContentsMargins(20, 15, 20, 15)
+        widget_layout.setSpacing(10)
+
+        # Title, granularity selector and export
+        title_layout = QHBoxLayout()
+        title = QLabel("Revenue Analytics")
+        title.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
+        title.setStyleSheet("color: #e8bb41;")
+        title_layout.addWidget(title)
+        title_layout.addStretch()
+
+        granularity_combo = QComboBox()
+        granularity_combo.setStyleSheet(
+            "background-color: #2a2a2a; color: #ffffff; padding: 6px 12px; border-radius: 6px;"
+        )
+        for text, granularity in TREND_GRANULARITIES:
+            granularity_combo.addItem(text, granularity)
+        granularity_combo.setCurrentIndex(granularity_combo.findData(analytics['granularity']))
+        granularity_combo.currentIndexChanged.connect(
+            lambda index: self.revenue_report_requested.emit(granularity_combo.itemData(index))
+        )
+        title_layout.addWidget(granularity_combo)
+
+        export_btn = StyledWidgets.create_action_button("📄 Export PDF", primary=False)
+        export_btn.clicked.connect(
+            lambda: self.export_revenue_pdf_requested.emit(granularity_combo.currentData())
+        )
+        title_layout.addWidget(export_btn)
+        widget_layout.addLayout(title_layout)
+
+        # Period summary
+        totals = analytics['totals']
+        collection_rate = totals['collection_rate']
+        average_days = totals['average_days_to_pay']
+        summary_text = f"""
+    <b>Revenue:</b> ₱{totals['revenue']:,.2f} from {totals['payments']:,} payments | 
+    <b>Collected:</b> ₱{totals['collected_fines']:,.2f} of ₱{totals['issued_fines']:,.2f} issued
+    ({f"{collection_rate * 100:.1f}%" if collection_rate is not None else "-"}) | 
+    <b>Average days to pay:</b> {f"{average_days:.1f}" if average_days is not None else "-"}
+        """
+        summary = QLabel(summary_text)
+        summary.setTextFormat(Qt.TextFormat.RichText)
+        summary.setWordWrap(True)
+        summary.setStyleSheet(
+            "color: #ffffff; font-size: 11pt; background-color: #2d2d2d; padding: 15px; border-radius: 8px;"
+        )
+        widget_layout.addWidget(summary)
+
+        chart_widget.setMinimumHeight(450)
+        widget_layout.addWidget(chart_widget, 1)
+
+        self.content_area.setWidget(widget)
+
+    def add_export_job(self, job_id: int, file_path: str):
+        """List a queued export with a Cancel button"""
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+
+        name = QLabel(os.path.basename(file_path))
+        name.setToolTip(file_path)
+        name.setStyleSheet("color: #ffffff; font-size: 10pt;")
+
+        status = QLabel("Queued")
+        status.setStyleSheet("color: #999999; font-size: 10pt;")
+
+        cancel_btn = StyledWidgets.create_action_button("Cancel", primary=False)
+        cancel_btn.clicked.connect(lambda: self.cancel_export_requested.emit(job_id))
+
+        row_layout.addWidget(name, 1)
+        row_layout.addWidget(status)
+        row_layout.addWidget(cancel_btn)
+        self.exports_layout.addWidget(row)
+
+        self._export_rows[job_id] = (status, cancel_btn)
+        self.exports_panel.show()
+
+    def update_export_job(self, job_id: int, status_text: str):
+        """Show a running export's progress"""
+        if job_id in self._export_rows:
+            status, _ = self._export_rows[job_id]
+            status.setStyleSheet("color: #2196f3; font-size: 10pt;")
+            status.setText(status_text)
+
+    def finish_export_job(self, job_id: int, status_text: str, is_error: bool = False):
+        """Show how an export ended and remove its Cancel button"""
+        entry = self._export_rows.pop(job_id, None)
+        if entry is None:
+            return
+        status, cancel_btn = entry
+        status.setStyleSheet(f"color: {'#f44336' if is_error else '#4caf50'}; font-size: 10pt;")
+        status.setText(status_text)
+        cancel_btn.hide()
+
     def show_message(self, title: str, message: str, is_error: bool = False):
         """Show message dialog"""
         if is_error:
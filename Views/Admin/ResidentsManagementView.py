@@ -2,6 +2,33 @@ from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 from Views.Common.StyledWidgets import StyledWidgets
+from Views.Common.TableModels import (
+    TableColumn, LazyTableModel, TableSortProxyModel, ActionButton, ActionButtonDelegate
+)
+
+
+def resident_full_name(resident: dict) -> str:
+    """Build full name from separate fields, falling back to full_name if present"""
+    if 'full_name' in resident and resident['full_name']:
+        return resident['full_name']
+    first = resident.get('first_name', '') or ''
+    middle = resident.get('middle_name', '') or ''
+    last = resident.get('last_name', '') or ''
+    parts = [first, middle, last] if middle else [first, last]
+    return ' '.join(p for p in parts if p).strip()
+
+
+RESIDENT_COLUMNS = [
+    TableColumn("Resident ID", 'ResidentID'),
+    TableColumn("Full Name", value=resident_full_name),
+    TableColumn("Sex", 'Sex'),
+    TableColumn("Contact No", 'ContactNo'),
+    TableColumn("Address", value=lambda r: r.get('Address', 'N/A')),
+    TableColumn("Total Violations", value=lambda r: r.get('total_violations', 0)),
+    TableColumn("Actions"),
+]
+
+VIEW_BUTTON = ActionButton('view', "View", "#2196f3", "#42a5f5")
 
 
 class ResidentsManagementView(QWidget):
@@ -33,15 +60,21 @@ class ResidentsManagementView(QWidget):
         layout.addWidget(self.residents_search)
 
         # Residents table
-        self.residents_table = QTableWidget()
-        self.residents_table.setColumnCount(7)
-        self.residents_table.setHorizontalHeaderLabels([
-            "Resident ID", "Full Name", "Sex", "Contact No",
-            "Address", "Total Violations", "Actions"
-        ])
+        self.residents_model = LazyTableModel(RESIDENT_COLUMNS, self)
+        self.residents_proxy = TableSortProxyModel(self)
+        self.residents_proxy.setSourceModel(self.residents_model)
+
+        self.residents_table = QTableView()
+        self.residents_table.setModel(self.residents_proxy)
 
         StyledWidgets.style_table(self.residents_table)
 
+        actions = ActionButtonDelegate(lambda resident: [VIEW_BUTTON], self.residents_table)
+        actions.action_triggered.connect(
+            lambda action, resident: self.view_resident_requested.emit(str(resident.get('ResidentID', '')))
+        )
+        self.residents_table.setItemDelegateForColumn(6, actions)
+
         # Set column resize modes
         header_widget = self.residents_table.horizontalHeader()
         header_widget.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
@@ -63,83 +96,18 @@ class ResidentsManagementView(QWidget):
 
         layout.addWidget(self.residents_table)
 
-    def _get_full_name(self, resident: dict) -> str:
-        """Build full name from separate fields, falling back to full_name if present"""
-        if 'full_name' in resident and resident['full_name']:
-            return resident['full_name']
-        first = resident.get('first_name', '') or ''
-        middle = resident.get('middle_name', '') or ''
-        last = resident.get('last_name', '') or ''
-        parts = [first, middle, last] if middle else [first, last]
-        return ' '.join(p for p in parts if p).strip()
-
     def populate_table(self, residents: list):
         """Populate table with resident data"""
-        self.residents_table.setSortingEnabled(False)
-        self.residents_table.setRowCount(len(residents))
-
-        for row, resident in enumerate(residents):
-            # Resident ID
-            id_item = QTableWidgetItem(str(resident.get('ResidentID', '')))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.residents_table.setItem(row, 0, id_item)
-
-            # Full Name — built from separate fields
-            name_item = QTableWidgetItem(self._get_full_name(resident))
-            name_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.residents_table.setItem(row, 1, name_item)
-
-            # Sex
-            sex_item = QTableWidgetItem(str(resident.get('Sex', '')))
-            sex_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            sex_item.setFlags(sex_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.residents_table.setItem(row, 2, sex_item)
-
-            # Contact No
-            contact_item = QTableWidgetItem(str(resident.get('ContactNo', '')))
-            contact_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            contact_item.setFlags(contact_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.residents_table.setItem(row, 3, contact_item)
-
-            # Address
-            address_item = QTableWidgetItem(str(resident.get('Address', 'N/A')))
-            address_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            address_item.setFlags(address_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.residents_table.setItem(row, 4, address_item)
-
-            # Total Violations
-            violations_item = QTableWidgetItem(str(resident.get('total_violations', 0)))
-            violations_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            violations_item.setFlags(violations_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.residents_table.setItem(row, 5, violations_item)
-
-            # Action button
-            view_btn = QPushButton("View")
-            view_btn.setFixedHeight(32)
-            view_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            view_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-            view_btn.setStyleSheet("""
-                QPushButton {
-                    padding: 6px 10px;
-                    background-color: #2196f3;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    font-weight: bold;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #42a5f5;
-                }
-                QPushButton:pressed {
-                    background-color: #1976d2;
-                }
-            """)
-            view_btn.clicked.connect(
-                lambda checked, r_id=str(resident.get('ResidentID', '')): self.view_resident_requested.emit(r_id)
-            )
-            self.residents_table.setCellWidget(row, 6, view_btn)
-
-        self.residents_table.setSortingEnabled(True)
\ No newline at end of file
+        self.residents_model.set_rows(residents)
+
+    def loaded_rows(self) -> list:
+        """The residents list from the last populate_table (what row ids refer to)"""
+        return self.residents_model.store.rows
+
+    def patch_rows(self, residents: list):
+        """Update changed residents in place and add new ones at the end"""
+        self.residents_model.patch_rows('ResidentID', residents)
+
+    def show_rows(self, row_ids=None):
+        """Show only the given row ids from the last populate_table (None shows all)"""
+        self.residents_model.set_visible_rows(row_ids)
@@ -3,6 +3,25 @@ from PyQt6.QtGui import *
 from PyQt6.QtWidgets import *
 
 from Views.Common.StyledWidgets import StyledWidgets
+from Views.Common.TableModels import (
+    TableColumn, LazyTableModel, TableSortProxyModel, ActionButton, ActionButtonDelegate
+)
+
+
+VEHICLE_COLUMNS = [
+    TableColumn("Vehicle ID", 'VehicleID'),
+    TableColumn("Plate No", 'PlateNo'),
+    TableColumn("Owner", value=lambda v: v.get('owner_name', 'Unknown')),
+    TableColumn("Brand", 'Brand'),
+    TableColumn("Model", 'Model'),
+    TableColumn("Violations", value=lambda v: v.get('violations', 0)),
+    TableColumn("Actions"),
+]
+
+VEHICLE_BUTTONS = [
+    ActionButton('view', "View", "#2196f3", "#42a5f5"),
+    ActionButton('edit', "Edit", "#ff9800", "#ffa726"),
+]
 
 
 class VehiclesManagementView(QWidget):
@@ -46,15 +65,19 @@ class VehiclesManagementView(QWidget):
         layout.addWidget(self.vehicles_search)
 
         # Vehicles table
-        self.vehicles_table = QTableWidget()
-        self.vehicles_table.setColumnCount(7)
-        self.vehicles_table.setHorizontalHeaderLabels([
-            "Vehicle ID", "Plate No", "Owner", "Brand", "Model",
-            "Violations", "Actions"
-        ])
+        self.vehicles_model = LazyTableModel(VEHICLE_COLUMNS, self)
+        self.vehicles_proxy = TableSortProxyModel(self)
+        self.vehicles_proxy.setSourceModel(self.vehicles_model)
+
+        self.vehicles_table = QTableView()
+        self.vehicles_table.setModel(self.vehicles_proxy)
 
         StyledWidgets.style_table(self.vehicles_table)
 
+        actions = ActionButtonDelegate(lambda vehicle: VEHICLE_BUTTONS, self.vehicles_table)
+        actions.action_triggered.connect(self._on_action)
+        self.vehicles_table.setItemDelegateForColumn(6, actions)
+
         # Set column resize modes
         header_widget = self.vehicles_table.horizontalHeader()
         header_widget.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
@@ -76,113 +99,25 @@ class VehiclesManagementView(QWidget):
 
         layout.addWidget(self.vehicles_table)
 
+    def _on_action(self, action: str, vehicle: dict):
+        vehicle_id = str(vehicle.get('VehicleID', ''))
+        if action == 'edit':
+            self.edit_vehicle_requested.emit(vehicle_id)
+        else:
+            self.view_vehicle_requested.emit(vehicle_id)
+
     def populate_table(self, vehicles: list):
         """Populate table with vehicle data"""
-        # Disable sorting while populating
-        self.vehicles_table.setSortingEnabled(False)
-
-        self.vehicles_table.setRowCount(len(vehicles))
-
-        for row, vehicle in enumerate(vehicles):
-            # Vehicle ID
-            id_item = QTableWidgetItem(str(vehicle.get('VehicleID', '')))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.vehicles_table.setItem(row, 0, id_item)
-
-            # Plate No
-            plate_item = QTableWidgetItem(str(vehicle.get('PlateNo', '')))
-            plate_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            plate_item.setFlags(plate_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.vehicles_table.setItem(row, 1, plate_item)
-
-            # Owner
-            owner_name = str(vehicle.get('owner_name', 'Unknown'))
-            owner_item = QTableWidgetItem(owner_name)
-            owner_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            owner_item.setFlags(owner_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.vehicles_table.setItem(row, 2, owner_item)
-
-            # Brand
-            brand_item = QTableWidgetItem(str(vehicle.get('Brand', '')))
-            brand_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            brand_item.setFlags(brand_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.vehicles_table.setItem(row, 3, brand_item)
-
-            # Model
-            model_item = QTableWidgetItem(str(vehicle.get('Model', '')))
-            model_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            model_item.setFlags(model_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.vehicles_table.setItem(row, 4, model_item)
-
-            # Violations
-            violations_item = QTableWidgetItem(str(vehicle.get('violations', 0)))
-            violations_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            violations_item.setFlags(violations_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.vehicles_table.setItem(row, 5, violations_item)
-
-            # Action buttons container
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(0, 0, 0, 0)
-            action_layout.setSpacing(5)
-
-            # View button
-            view_btn = QPushButton("View")
-            view_btn.setFixedHeight(32)
-            view_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            view_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-            view_btn.setStyleSheet("""
-                QPushButton {
-                    padding: 6px 8px;
-                    background-color: #2196f3;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    font-weight: bold;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #42a5f5;
-                }
-                QPushButton:pressed {
-                    background-color: #1976d2;
-                }
-            """)
-            view_btn.clicked.connect(
-                lambda checked, v_id=str(vehicle.get('VehicleID', '')): self.view_vehicle_requested.emit(v_id)
-            )
-
-            # Edit button
-            edit_btn = QPushButton("Edit")
-            edit_btn.setFixedHeight(32)
-            edit_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            edit_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-            edit_btn.setStyleSheet("""
-                QPushButton {
-                    padding: 6px 8px;
-                    background-color: #ff9800;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    font-weight: bold;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #ffa726;
-                }
-                QPushButton:pressed {
-                    background-color: #f57c00;
-                }
-            """)
-            edit_btn.clicked.connect(
-                lambda checked, v_id=str(vehicle.get('VehicleID', '')): self.edit_vehicle_requested.emit(v_id)
-            )
-
-            action_layout.addWidget(view_btn)
-            action_layout.addWidget(edit_btn)
-
-            self.vehicles_table.setCellWidget(row, 6, action_widget)
-
-        # Re-enable sorting after population
-        self.vehicles_table.setSortingEnabled(True)
\ No newline at end of file
+        self.vehicles_model.set_rows(vehicles)
+
+    def loaded_rows(self) -> list:
+        """The vehicles list from the last populate_table (what row ids refer to)"""
+        return self.vehicles_model.store.rows
+
+    def patch_rows(self, vehicles: list):
+        """Update changed vehicles in place and add new ones at the end"""
+        self.vehicles_model.patch_rows('VehicleID', vehicles)
+
+    def show_rows(self, row_ids=None):
+        """Show only the given row ids from the last populate_table (None shows all)"""
+        self.vehicles_model.set_visible_rows(row_ids)
@@ -2,10 +2,31 @@
 Views/Admin/ViolationsManagementView.py
 Violations management page (extracted from ViolationsPage.py)
 """
+from datetime import datetime
+
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 from Views.Common.StyledWidgets import StyledWidgets
+from Views.Common.TableModels import (
+    TableColumn, LazyTableModel, TableSortProxyModel, ActionButton, ActionButtonDelegate,
+    money_value, peso
+)
+
+
+VIOLATION_COLUMNS = [
+    TableColumn("Violation ID", 'ViolationID'),
+    TableColumn("Resident Name", value=lambda v: v.get('resident_name') or 'Unknown'),
+    TableColumn("Vehicle Plate", 'PlateNo'),
+    TableColumn("Violation Type", 'ViolationName'),
+    TableColumn("Date", 'date'),
+    TableColumn("Fine Amount", value=money_value('FineAmount'), display=peso),
+    TableColumn("Status", value=lambda v: str(v.get('status', 'UNPAID')),
+                foreground=lambda status: "#4caf50" if status == 'PAID' else "#f44336"),
+    TableColumn("Actions"),
+]
+
+VIEW_BUTTON = ActionButton('view', "View", "#2196f3", "#42a5f5")
 
 
 class ViolationsManagementView(QWidget):
@@ -16,9 +37,16 @@ class ViolationsManagementView(QWidget):
     refresh_requested = pyqtSignal()
     add_violation_requested = pyqtSignal()
     view_violation_requested = pyqtSignal(str)  # violation_id
+    more_rows_requested = pyqtSignal()  # scrolled near the end of the loaded rows
+
+    # Rows from the bottom at which the next page is requested
+    LOAD_MORE_THRESHOLD = 20
 
     def __init__(self):
         super().__init__()
+        self.has_more_rows = False
+        self.last_page_row = None  # last row of the latest page, in server order
+        self._loading_more = False
         self._setup_ui()
 
     def _setup_ui(self):
@@ -59,15 +87,21 @@ class ViolationsManagementView(QWidget):
         layout.addLayout(filter_layout)
 
         # Violations table
-        self.violations_table = QTableWidget()
-        self.violations_table.setColumnCount(8)
-        self.violations_table.setHorizontalHeaderLabels([
-            "Violation ID", "Resident Name", "Vehicle Plate", "Violation Type",
-            "Date", "Fine Amount", "Status", "Actions"
-        ])
+        self.violations_model = LazyTableModel(VIOLATION_COLUMNS, self)
+        self.violations_proxy = TableSortProxyModel(self)
+        self.violations_proxy.setSourceModel(self.violations_model)
+
+        self.violations_table = QTableView()
+        self.violations_table.setModel(self.violations_proxy)
 
         StyledWidgets.style_table(self.violations_table)
 
+        actions = ActionButtonDelegate(lambda violation: [VIEW_BUTTON], self.violations_table)
+        actions.action_triggered.connect(
+            lambda action, violation: self.view_violation_requested.emit(str(violation.get('ViolationID', '')))
+        )
+        self.violations_table.setItemDelegateForColumn(7, actions)
+
         # Set column resize modes
         header_widget = self.violations_table.horizontalHeader()
         header_widget.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
@@ -85,101 +119,61 @@ class ViolationsManagementView(QWidget):
         v_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         v_header.setDefaultSectionSize(50)
 
-        # Enable sorting
+        # Enable sorting; keep the server's newest-first order until a header is clicked
+        self.violations_table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.violations_table.setSortingEnabled(True)
 
+        # Fetch further pages as the user scrolls
+        self.violations_table.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
         layout.addWidget(self.violations_table)
 
-    def populate_table(self, violations: list):
+    def _on_scrolled(self, value: int):
+        """Request the next page once the last loaded rows come into view"""
+        if not self.has_more_rows or self._loading_more:
+            return
+        remaining = self.violations_table.verticalScrollBar().maximum() - value
+        if self.violations_table.verticalScrollMode() == QAbstractItemView.ScrollMode.ScrollPerPixel:
+            remaining //= self.violations_table.verticalHeader().defaultSectionSize()
+        if remaining <= self.LOAD_MORE_THRESHOLD:
+            self._loading_more = True
+            self.more_rows_requested.emit()
+
+    def populate_table(self, violations: list, has_more: bool = False):
         """Populate table with violation data"""
-        # Disable sorting while populating
-        self.violations_table.setSortingEnabled(False)
-
-        self.violations_table.setRowCount(len(violations))
-
-        for row, violation in enumerate(violations):
-            # Violation ID
-            id_item = QTableWidgetItem(str(violation.get('ViolationID', '')))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.violations_table.setItem(row, 0, id_item)
-
-            # Resident Name
-            resident_name = str(violation.get('resident_name', 'Unknown'))
-            resident_item = QTableWidgetItem(resident_name)
-            resident_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            resident_item.setFlags(resident_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.violations_table.setItem(row, 1, resident_item)
-
-            # Vehicle Plate
-            plate_item = QTableWidgetItem(str(violation.get('PlateNo', '')))
-            plate_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            plate_item.setFlags(plate_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.violations_table.setItem(row, 2, plate_item)
-
-            # Violation Type
-            type_item = QTableWidgetItem(str(violation.get('ViolationName', '')))
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.violations_table.setItem(row, 3, type_item)
-
-            # Date
-            date_item = QTableWidgetItem(str(violation.get('date', '')))
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.violations_table.setItem(row, 4, date_item)
-
-            # Fine Amount
-            fine_amount = violation.get('FineAmount', 0)
-            try:
-                fine_amount = float(fine_amount)
-            except (ValueError, TypeError):
-                fine_amount = 0.0
-            amount_item = QTableWidgetItem(f"₱{fine_amount:.2f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            amount_item.setFlags(amount_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            amount_item.setData(Qt.ItemDataRole.UserRole, fine_amount)
-            self.violations_table.setItem(row, 5, amount_item)
-
-            # Status with color
-            status = str(violation.get('status', 'UNPAID'))
-            status_item = QTableWidgetItem(status)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status_item.setFlags(status_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            if status == 'PAID':
-                status_item.setForeground(QColor("#4caf50"))
-            else:
-                status_item.setForeground(QColor("#f44336"))
-            self.violations_table.setItem(row, 6, status_item)
-
-            # Action button - fits inside cell
-            view_btn = QPushButton("View")
-            view_btn.setToolTip("View Details")
-            view_btn.setFixedHeight(32)
-            view_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            view_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-            view_btn.setStyleSheet("""
-                QPushButton {
-                    padding: 6px 10px;
-                    background-color: #2196f3;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    font-weight: bold;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #42a5f5;
-                }
-                QPushButton:pressed {
-                    background-color: #1976d2;
-                }
-            """)
-            view_btn.clicked.connect(
-                lambda checked, v_id=str(violation.get('ViolationID', '')): self.view_violation_requested.emit(v_id)
-            )
-
-            self.violations_table.setCellWidget(row, 7, view_btn)
-
-        # Re-enable sorting after population
-        self.violations_table.setSortingEnabled(True)
\ No newline at end of file
+        self.last_page_row = None
+        self.violations_model.set_rows(violations)
+        self._page_loaded(violations, has_more)
+
+    def append_rows(self, violations: list, has_more: bool = False):
+        """Append a page of violations below the rows already loaded"""
+        self.violations_model.append_rows(violations)
+        self._page_loaded(violations, has_more)
+
+    def load_more_failed(self):
+        """Let the next scroll to the end request the page again"""
+        self._loading_more = False
+
+    def patch_rows(self, violations: list):
+        """
+        Update loaded violations in place and add newer ones at the top
+
+        Changed violations below the loaded pages are dropped: the page
+        that reaches them loads them, so adding them now would list them twice.
+        """
+        def order(v):
+            # The keyset order, newest first; a missing date sorts last
+            return v['ViolationDate'] or datetime.min, v['ViolationID']
+
+        rows = self.violations_model.store.rows
+        newest = order(rows[0]) if rows else None
+        self.violations_model.patch_rows(
+            'ViolationID', violations, prepend=True,
+            is_new=lambda v: newest is None or order(v) > newest
+        )
+
+    def _page_loaded(self, violations: list, has_more: bool):
+        if violations:
+            self.last_page_row = violations[-1]
+        self.has_more_rows = has_more
+        self._loading_more = False
@@ -0,0 +1,69 @@
+"""
+Views/Common/PageStack.py
+Stacked window pages that are built and loaded on first visit
+"""
+from PyQt6.QtWidgets import QStackedWidget, QWidget
+
+
+class PageStack(QStackedWidget):
+    """
+    QStackedWidget whose pages may be registered as factories
+
+    A factory holds its slot with an empty placeholder until the page is
+    first shown, and is then called to build the page in place. It returns
+    the page, or (page, load) where load() fetches the page's data. load
+    runs on the first visit and again on the first visit after
+    invalidate(), so revisiting a page reuses what it already shows.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._factories = {}
+        self._loaders = {}
+        self._stale = set()
+
+    def add_page(self, page) -> int:
+        """Add a page widget or a factory building it; returns the page index"""
+        if isinstance(page, QWidget):
+            return self.addWidget(page)
+
+        index = self.addWidget(QWidget())
+        self._factories[index] = page
+        return index
+
+    def is_built(self, index: int) -> bool:
+        return index not in self._factories
+
+    def page(self, index: int) -> QWidget:
+        """The page at index, built first if it is still a factory"""
+        factory = self._factories.pop(index, None)
+        if factory is not None:
+            page = factory()
+            if isinstance(page, tuple):
+                page, load = page
+                self._loaders[index] = load
+                self._stale.add(index)
+
+            placeholder = self.widget(index)
+            self.insertWidget(index, page)
+            self.removeWidget(placeholder)
+            placeholder.deleteLater()
+        return self.widget(index)
+
+    def show_page(self, index: int):
+        """Build and show a page, loading its data if it has none or it is stale"""
+        self.page(index)
+        self.setCurrentIndex(index)
+        if index in self._stale:
+            self._stale.discard(index)
+            self._loaders[index]()
+
+    def invalidate(self, index: int):
+        """The page's data changed: reload it now if showing, else on its next visit"""
+        if index not in self._loaders:
+            return
+        if index == self.currentIndex():
+            self._stale.discard(index)
+            self._loaders[index]()
+        else:
+            self._stale.add(index)
@@ -315,20 +315,20 @@ class StyledWidgets:
         return date_edit
 
     @staticmethod
-    def style_table(table: QTableWidget):
-        """Apply styling to a table widget"""
+    def style_table(table: QTableView):
+        """Apply styling to a table view (QTableView or QTableWidget)"""
         table.setFont(QFont("Segoe UI", 10))
         table.setStyleSheet("""
-                QTableWidget {
+                QTableView {
                     background-color: #2d2d2d;
                     color: #ffffff;
                     gridline-color: #3a3a3a;
                     border: none;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 10px;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: #e8bb41;
                     color: #1e1e1e;
                 }
@@ -351,8 +351,10 @@ class StyledWidgets:
                     background-color: #6a6a6a;
                 }
             """)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         table.verticalHeader().setVisible(False)
-        table.horizontalHeader().setStretchLastSection(True)
\ No newline at end of file
+        table.horizontalHeader().setStretchLastSection(True)
+        # Hover state for painted action buttons
+        table.setMouseTracking(True)
\ No newline at end of file
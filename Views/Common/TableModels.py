@@ -0,0 +1,380 @@
+"""
+Views/Common/TableModels.py
+Shared model/view layer for the data tables
+
+Rows stay as the dicts the controllers return. Cell text is produced only
+when the view paints a cell, sorting reads per-column caches built on first
+use, and a search result (row ids from the controller's SearchIndex) only
+changes which rows the model exposes, so a keystroke never allocates items
+or widgets.
+"""
+from bisect import bisect_left
+
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QRectF, QEvent, pyqtSignal
+)
+from PyQt6.QtGui import QColor, QPainter, QFont
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+
+
+SORT_ROLE = Qt.ItemDataRole.UserRole
+ROW_DATA_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class TableColumn:
+    """Describes one table column"""
+
+    def __init__(self, title: str, key: str = None, value=None, display=None, foreground=None):
+        """
+        Args:
+            title: Header text
+            key: Row dict key holding the raw value
+            value: Callable(row) -> raw value, for derived columns
+            display: Callable(raw value) -> cell text (default str)
+            foreground: Callable(raw value) -> color string or None
+        """
+        self.title = title
+        self.key = key
+        self._value = value
+        self._display = display
+        self._foreground = foreground
+
+    def value(self, row: dict):
+        if self._value:
+            return self._value(row)
+        if self.key is None:
+            return None
+        return row.get(self.key, '')
+
+    def display(self, value) -> str:
+        if self._display:
+            return self._display(value)
+        return '' if value is None else str(value)
+
+    def foreground(self, value):
+        return self._foreground(value) if self._foreground else None
+
+
+def money_value(key: str):
+    """Value function reading a numeric amount, 0.0 when missing or invalid"""
+    def value(row: dict):
+        try:
+            return float(row.get(key, 0) or 0)
+        except (ValueError, TypeError):
+            return 0.0
+    return value
+
+
+def peso(amount) -> str:
+    return f"₱{amount:,.2f}"
+
+
+class ColumnStore:
+    """Row dicts plus lazily built per-column value caches"""
+
+    def __init__(self, columns: list):
+        self.columns = columns
+        self.rows = []
+        self._values = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def set_rows(self, rows: list):
+        # Kept by reference so row ids match a SearchIndex built over the same list
+        self.rows = rows
+        self._values = {}
+
+    def append_rows(self, rows: list):
+        start = len(self.rows)
+        self.rows = self.rows + list(rows)
+        # Keep caches that were already built in step with the new rows
+        for column_index, values in self._values.items():
+            column = self.columns[column_index]
+            values.extend(column.value(row) for row in self.rows[start:])
+
+    def patch_rows(self, key: str, rows: list, prepend: bool = False):
+        """
+        Replace rows with the same key and add the rest (first or last)
+
+        The store moves to a new list, as a search may still be reading the
+        old one; SearchIndex.ensure re-indexes just the replaced and appended
+        rows of it. Returns (replaced row ids, added count).
+        """
+        positions = {row.get(key): i for i, row in enumerate(self.rows)}
+        new_rows = list(self.rows)
+        replaced = []
+        added = []
+        for row in rows:
+            i = positions.get(row.get(key))
+            if i is None:
+                added.append(row)
+            else:
+                new_rows[i] = row
+                replaced.append(i)
+
+        for column_index, values in self._values.items():
+            column = self.columns[column_index]
+            for i in replaced:
+                values[i] = column.value(new_rows[i])
+            added_values = [column.value(row) for row in added]
+            if prepend:
+                values[:0] = added_values
+            else:
+                values.extend(added_values)
+
+        if prepend:
+            self.rows = added + new_rows
+            replaced = [i + len(added) for i in replaced]
+        else:
+            self.rows = new_rows + added
+        return replaced, len(added)
+
+    def value(self, row: int, column: int):
+        """Raw column value from the column cache (built on first access)"""
+        values = self._values.get(column)
+        if values is None:
+            column_spec = self.columns[column]
+            values = [column_spec.value(r) for r in self.rows]
+            self._values[column] = values
+        return values[row]
+
+
+class LazyTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a ColumnStore
+
+    Model rows are the store rows, or the subset chosen with
+    set_visible_rows. Store row ids match positions in the list passed to
+    set_rows, i.e. the ids a SearchIndex built over that list returns.
+    """
+
+    def __init__(self, columns: list, parent=None):
+        super().__init__(parent)
+        self.store = ColumnStore(columns)
+        self._visible = None
+        self._colors = {}
+
+    # ---------- loading ----------
+    def set_rows(self, rows: list):
+        self.beginResetModel()
+        self.store.set_rows(rows)
+        self._visible = None
+        self.endResetModel()
+
+    def append_rows(self, rows: list):
+        if not rows:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        start = len(self.store)
+        self.store.append_rows(rows)
+        if self._visible is not None:
+            self._visible.extend(range(start, len(self.store)))
+        self.endInsertRows()
+
+    def patch_rows(self, key: str, rows: list, prepend: bool = False, is_new=None):
+        """
+        Update changed rows in place and insert new ones without a reset
+
+        Rows are matched on key. New rows go first (prepend) or last; while
+        a subset is shown they stay hidden until the next set_visible_rows.
+        is_new(row), if given, decides which rows that are not loaded get
+        added; the rest are dropped (e.g. rows a later page will load).
+        """
+        existing = {row.get(key) for row in self.store.rows}
+        if is_new is not None:
+            rows = [row for row in rows if row.get(key) in existing or is_new(row)]
+        if not rows:
+            return
+        added = sum(1 for row in rows if row.get(key) not in existing)
+        show_added = added and self._visible is None
+
+        if show_added:
+            first = 0 if prepend else len(self.store)
+            self.beginInsertRows(QModelIndex(), first, first + added - 1)
+        replaced, _ = self.store.patch_rows(key, rows, prepend)
+        if self._visible is not None and prepend and added:
+            self._visible = [row_id + added for row_id in self._visible]
+        if show_added:
+            self.endInsertRows()
+
+        last_column = self.columnCount() - 1
+        for row_id in replaced:
+            row = self._model_row(row_id)
+            if row is not None:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+    def _model_row(self, row_id: int):
+        """Model row showing a store row id, None if it is hidden"""
+        if self._visible is None:
+            return row_id
+        i = bisect_left(self._visible, row_id)
+        if i < len(self._visible) and self._visible[i] == row_id:
+            return i
+        return None
+
+    def set_visible_rows(self, row_ids=None):
+        """Expose only the given store row ids, in load order (None shows every row)"""
+        self.beginResetModel()
+        self._visible = None if row_ids is None else sorted(row_ids)
+        self.endResetModel()
+
+    def store_row(self, row: int) -> int:
+        return row if self._visible is None else self._visible[row]
+
+    def row_data(self, row: int) -> dict:
+        return self.store.rows[self.store_row(row)]
+
+    # ---------- QAbstractTableModel ----------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.store) if self._visible is None else len(self._visible)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store.columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.store.columns[section].title
+        return None
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self.store_row(index.row())
+        column = self.store.columns[index.column()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Formatted only for the cells being painted
+            return column.display(column.value(self.store.rows[row]))
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.ForegroundRole:
+            color = column.foreground(column.value(self.store.rows[row]))
+            return self._color(color) if color else None
+        if role == SORT_ROLE:
+            return self.store.value(row, index.column())
+        if role == ROW_DATA_ROLE:
+            return self.store.rows[row]
+        return None
+
+    def _color(self, name: str) -> QColor:
+        color = self._colors.get(name)
+        if color is None:
+            color = self._colors[name] = QColor(name)
+        return color
+
+
+class TableSortProxyModel(QSortFilterProxyModel):
+    """Header-click sorting over a LazyTableModel using the raw column values"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(SORT_ROLE)
+
+    def row_data(self, proxy_row: int) -> dict:
+        source = self.mapToSource(self.index(proxy_row, 0))
+        return self.sourceModel().row_data(source.row())
+
+    def lessThan(self, left, right):
+        model = self.sourceModel()
+        a = model.store.value(model.store_row(left.row()), left.column())
+        b = model.store.value(model.store_row(right.row()), right.column())
+        a = '' if a is None else a
+        b = '' if b is None else b
+        try:
+            return a < b
+        except TypeError:
+            return str(a) < str(b)
+
+
+class ActionButton:
+    """A button painted inside an action cell"""
+
+    def __init__(self, action: str, text: str, background: str, hover: str = None,
+                 color: str = '#ffffff', width: int = None, height: int = 32,
+                 clickable: bool = True):
+        self.action = action
+        self.text = text
+        self.background = background
+        self.hover = hover or background
+        self.color = color
+        self.width = width
+        self.height = height
+        self.clickable = clickable
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """
+    Paints per-row action buttons instead of creating a widget per row
+
+    buttons_for_row(row dict) returns the ActionButtons for that row;
+    clicks are reported through action_triggered(action, row dict).
+    """
+
+    action_triggered = pyqtSignal(str, object)
+
+    SPACING = 5
+    MARGIN = 6
+
+    def __init__(self, buttons_for_row, parent=None):
+        super().__init__(parent)
+        self.buttons_for_row = buttons_for_row
+        self._font = QFont("Segoe UI", 9, QFont.Weight.Bold)
+
+    def _layout(self, rect, buttons):
+        """Rectangles for the buttons, centred in the cell"""
+        inner_width = rect.width() - 2 * self.MARGIN
+        flexible = [b for b in buttons if b.width is None]
+        fixed_width = sum(b.width for b in buttons if b.width is not None)
+        spacing = self.SPACING * (len(buttons) - 1)
+        flex_width = (inner_width - fixed_width - spacing) / len(flexible) if flexible else 0
+
+        total = fixed_width + spacing + flex_width * len(flexible)
+        x = rect.x() + (rect.width() - total) / 2
+        rects = []
+        for button in buttons:
+            width = button.width if button.width is not None else flex_width
+            height = min(button.height, rect.height())
+            y = rect.y() + (rect.height() - height) / 2
+            rects.append(QRectF(x, y, width, height))
+            x += width + self.SPACING
+        return rects
+
+    def paint(self, painter, option, index):
+        row = index.data(ROW_DATA_ROLE)
+        buttons = self.buttons_for_row(row) if row is not None else []
+        if not buttons:
+            return
+
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._font)
+        for button, rect in zip(buttons, self._layout(option.rect, buttons)):
+            background = button.hover if hovered and button.clickable else button.background
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(background))
+            painter.drawRoundedRect(rect, 5, 5)
+            painter.setPen(QColor(button.color))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, button.text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            row = index.data(ROW_DATA_ROLE)
+            buttons = self.buttons_for_row(row) if row is not None else []
+            position = event.position()
+            for button, rect in zip(buttons, self._layout(option.rect, buttons)):
+                if button.clickable and rect.contains(position):
+                    self.action_triggered.emit(button.action, row)
+                    return True
+        return super().editorEvent(event, model, option, index)
@@ -1,3 +1,4 @@
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QSizePolicy
 
@@ -95,6 +96,16 @@ class DashboardView(QWidget):
     # ------------------------------------------------------------------
     # public update helpers
     # ------------------------------------------------------------------
+    def show_loading(self):
+        """Placeholder cards and chart until the first data arrives"""
+        self.update_statistics({
+            "total_violations": "…", "unpaid_violations": "…", "paid_violations": "…"
+        })
+        loading = QLabel("Loading…")
+        loading.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        loading.setStyleSheet("color: #aaaaaa;")
+        self.update_chart(loading)
+
     def update_statistics(self, stats: dict):
         """Update statistics cards"""
         # Clear existing cards
@@ -112,7 +123,10 @@ class DashboardView(QWidget):
         self.stats_layout.addWidget(paid_card)
 
     def update_chart(self, chart_widget):
-        """Update chart display"""
+        """Update chart display (a chart already shown updates itself in place)"""
+        if self.chart_container.indexOf(chart_widget) >= 0:
+            return
+
         # Clear existing chart
         while self.chart_container.count():
             item = self.chart_container.takeAt(0)
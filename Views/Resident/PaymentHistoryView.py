@@ -1,8 +1,19 @@
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView, QAbstractItemView
 
 from Views.Common.StyledWidgets import StyledWidgets
+from Views.Common.TableModels import TableColumn, LazyTableModel, TableSortProxyModel, money_value, peso
+
+
+PAYMENT_COLUMNS = [
+    TableColumn("Payment ID", 'PaymentID'),
+    TableColumn("Violation ID", 'ViolationID'),
+    TableColumn("Payment Type", 'PaymentType'),
+    TableColumn("Amount Paid", value=money_value('AmountPaid'), display=peso),
+    TableColumn("Payment Date", 'payment_date'),
+    TableColumn("Receipt No", 'ReceiptNo'),
+]
 
 
 class PaymentHistoryView(QWidget):
@@ -25,12 +36,12 @@ class PaymentHistoryView(QWidget):
         layout.addWidget(header)
 
         # Payment history table
-        self.payment_history_table = QTableWidget()
-        self.payment_history_table.setColumnCount(6)
-        self.payment_history_table.setHorizontalHeaderLabels([
-            "Payment ID", "Violation ID", "Payment Type",
-            "Amount Paid", "Payment Date", "Receipt No"
-        ])
+        self.payment_history_model = LazyTableModel(PAYMENT_COLUMNS, self)
+        self.payment_history_proxy = TableSortProxyModel(self)
+        self.payment_history_proxy.setSourceModel(self.payment_history_model)
+
+        self.payment_history_table = QTableView()
+        self.payment_history_table.setModel(self.payment_history_proxy)
 
         # Apply styling
         StyledWidgets.style_table(self.payment_history_table)
@@ -45,9 +56,9 @@ class PaymentHistoryView(QWidget):
         header_widget.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Receipt No
 
         # Enable selection and interaction
-        self.payment_history_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.payment_history_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.payment_history_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.payment_history_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.payment_history_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.payment_history_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.payment_history_table.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
         # Enable sorting
@@ -61,58 +72,4 @@ class PaymentHistoryView(QWidget):
 
     def populate_table(self, payments: list):
         """Populate table with payment history"""
-        # Disable sorting while populating
-        self.payment_history_table.setSortingEnabled(False)
-
-        self.payment_history_table.setRowCount(len(payments))
-
-        for row, payment in enumerate(payments):
-            # Payment ID
-            id_item = QTableWidgetItem(str(payment.get('PaymentID', '')))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.payment_history_table.setItem(row, 0, id_item)
-
-            # Violation ID
-            violation_item = QTableWidgetItem(str(payment.get('ViolationID', '')))
-            violation_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            violation_item.setFlags(violation_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.payment_history_table.setItem(row, 1, violation_item)
-
-            # Payment Type
-            type_item = QTableWidgetItem(str(payment.get('PaymentType', '')))
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.payment_history_table.setItem(row, 2, type_item)
-
-            # Amount
-            amount_paid = payment.get('AmountPaid', 0)
-            try:
-                amount_paid = float(amount_paid)
-            except (ValueError, TypeError):
-                amount_paid = 0.0
-            amount_item = QTableWidgetItem(f"₱{amount_paid:.2f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            amount_item.setFlags(amount_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            # Store numeric value for sorting
-            amount_item.setData(Qt.ItemDataRole.UserRole, amount_paid)
-            self.payment_history_table.setItem(row, 3, amount_item)
-
-            # Date
-            date_item = QTableWidgetItem(str(payment.get('payment_date', '')))
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.payment_history_table.setItem(row, 4, date_item)
-
-            # Receipt No
-            receipt_item = QTableWidgetItem(str(payment.get('ReceiptNo', '')))
-            receipt_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            receipt_item.setFlags(receipt_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.payment_history_table.setItem(row, 5, receipt_item)
-
-        # Re-enable sorting after population
-        self.payment_history_table.setSortingEnabled(True)
-
-        # Ensure table is visible and enabled after population
-        self.payment_history_table.setEnabled(True)
-        self.payment_history_table.setVisible(True)
\ No newline at end of file
+        self.payment_history_model.set_rows(payments)
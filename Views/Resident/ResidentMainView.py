@@ -4,11 +4,16 @@ from PyQt6.QtGui import *
 
 from Controllers.Utility.ResourceHelper import ResourceHelper
 from Views.Common.StyledWidgets import StyledWidgets
+from Views.Common.PageStack import PageStack
 
 
 class ResidentMainView(QMainWindow):
     logout_requested = pyqtSignal()
     page_changed = pyqtSignal(int)
+    data_changed = pyqtSignal()  # this window wrote to the database
+
+    # Page indices, in sidebar order
+    DASHBOARD_PAGE, VIOLATIONS_PAGE, VIOLATION_HISTORY_PAGE, PAYMENT_HISTORY_PAGE = range(4)
 
     def __init__(self, user_data: dict):
         super().__init__()
@@ -31,7 +36,7 @@ class ResidentMainView(QMainWindow):
         self._create_sidebar()
         main_layout.addWidget(self.sidebar)
 
-        self.stacked_widget = QStackedWidget()
+        self.stacked_widget = PageStack()
         self.stacked_widget.setStyleSheet("background-color: #2d2d2d;")
         main_layout.addWidget(self.stacked_widget, 1)
 
@@ -136,7 +141,7 @@ class ResidentMainView(QMainWindow):
 
         self._update_nav_buttons(button)
         self.page_changed.emit(index)
-        self.stacked_widget.setCurrentIndex(index)
+        self.stacked_widget.show_page(index)
 
     def _update_nav_buttons(self, active_btn: QPushButton):
         buttons = [self.dashboard_btn, self.violations_btn, self.violation_history_btn, self.payment_history_btn]
@@ -182,12 +187,18 @@ class ResidentMainView(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             self.logout_requested.emit()
 
-    def add_page(self, page: QWidget):
-        self.stacked_widget.addWidget(page)
+    def add_page(self, page):
+        return self.stacked_widget.add_page(page)
+
+    def page(self, index: int) -> QWidget:
+        return self.stacked_widget.page(index)
+
+    def invalidate_page(self, index: int):
+        self.stacked_widget.invalidate(index)
 
     def show_page(self, index: int):
         if 0 <= index < self.stacked_widget.count():
-            self.stacked_widget.setCurrentIndex(index)
+            self.stacked_widget.show_page(index)
             buttons = [self.dashboard_btn, self.violations_btn, self.violation_history_btn, self.payment_history_btn]
             if index < len(buttons):
                 self._update_nav_buttons(buttons[index])
\ No newline at end of file
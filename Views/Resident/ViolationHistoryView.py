@@ -1,11 +1,12 @@
 import os
 
 from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QFont, QColor
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QComboBox, QTableWidget, QHeaderView, \
-    QTableWidgetItem
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QComboBox, QTableView, QHeaderView, \
+    QAbstractItemView
 
 from Views.Common.StyledWidgets import StyledWidgets
+from Views.Common.TableModels import TableColumn, LazyTableModel, TableSortProxyModel, money_value, peso
 
 # Resolve the icon path once at module level
 CHEVRON_ICON = os.path.join(
@@ -13,6 +14,20 @@ CHEVRON_ICON = os.path.join(
 ).replace("\\", "/")
 
 
+STATUS_COLORS = {'Paid': "#4caf50", 'Unpaid': "#f44336"}
+
+HISTORY_COLUMNS = [
+    TableColumn("Violation ID", 'violation_id'),
+    TableColumn("Date", 'date'),
+    TableColumn("Vehicle Plate", 'plate_no'),
+    TableColumn("Violation Type", 'violation_type'),
+    TableColumn("Fine Amount", value=money_value('fine_amount'), display=peso),
+    TableColumn("Status", value=lambda v: str(v.get('status', 'Unknown')), foreground=STATUS_COLORS.get),
+    TableColumn("Payment Date", value=lambda v: v.get('payment_date') or 'N/A',
+                foreground=lambda date: "#757575" if date == 'N/A' else None),
+]
+
+
 class ViolationHistoryView(QWidget):
     """Violation history table view - displays all violations including paid ones"""
 
@@ -110,12 +125,12 @@ class ViolationHistoryView(QWidget):
         layout.addLayout(filter_layout)
 
         # History table
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(7)
-        self.history_table.setHorizontalHeaderLabels([
-            "Violation ID", "Date", "Vehicle Plate", "Violation Type",
-            "Fine Amount", "Status", "Payment Date"
-        ])
+        self.history_model = LazyTableModel(HISTORY_COLUMNS, self)
+        self.history_proxy = TableSortProxyModel(self)
+        self.history_proxy.setSourceModel(self.history_model)
+
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_proxy)
 
         StyledWidgets.style_table(self.history_table)
 
@@ -130,9 +145,9 @@ class ViolationHistoryView(QWidget):
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)  # Payment Date
 
         # Enable selection and interaction
-        self.history_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.history_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.history_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.history_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.history_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.history_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.history_table.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
         # Enable sorting
@@ -142,70 +157,26 @@ class ViolationHistoryView(QWidget):
 
     def populate_table(self, violations: list):
         """Populate table with violation history data"""
-        # Disable sorting while populating
-        self.history_table.setSortingEnabled(False)
-
-        self.history_table.setRowCount(len(violations))
-
-        for row, violation in enumerate(violations):
-            # Violation ID
-            id_item = QTableWidgetItem(str(violation.get('violation_id', '')))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.history_table.setItem(row, 0, id_item)
-
-            # Date
-            date_item = QTableWidgetItem(str(violation.get('date', '')))
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setFlags(date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.history_table.setItem(row, 1, date_item)
-
-            # Vehicle Plate
-            plate_item = QTableWidgetItem(str(violation.get('plate_no', '')))
-            plate_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            plate_item.setFlags(plate_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.history_table.setItem(row, 2, plate_item)
-
-            # Violation Type
-            type_item = QTableWidgetItem(str(violation.get('violation_type', '')))
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.history_table.setItem(row, 3, type_item)
-
-            # Fine Amount
-            fine_amount = violation.get('fine_amount', 0)
-            try:
-                fine_amount = float(fine_amount)
-            except (ValueError, TypeError):
-                fine_amount = 0.0
-            amount_item = QTableWidgetItem(f"₱{fine_amount:.2f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            amount_item.setFlags(amount_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            # Store numeric value for sorting
-            amount_item.setData(Qt.ItemDataRole.UserRole, fine_amount)
-            self.history_table.setItem(row, 4, amount_item)
-
-            # Status
-            status = str(violation.get('status', 'Unknown'))
-            status_item = QTableWidgetItem(status)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status_item.setFlags(status_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            if status == 'Paid':
-                status_item.setForeground(QColor("#4caf50"))
-            elif status == 'Unpaid':
-                status_item.setForeground(QColor("#f44336"))
-            self.history_table.setItem(row, 5, status_item)
-
-            # Payment Date
-            payment_date = violation.get('payment_date', 'N/A')
-            if not payment_date or payment_date == '':
-                payment_date = 'N/A'
-            payment_date_item = QTableWidgetItem(str(payment_date))
-            payment_date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            payment_date_item.setFlags(payment_date_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            if payment_date == 'N/A':
-                payment_date_item.setForeground(QColor("#757575"))
-            self.history_table.setItem(row, 6, payment_date_item)
-
-        # Re-enable sorting after population
-        self.history_table.setSortingEnabled(True)
\ No newline at end of file
+        self.history_model.set_rows(violations)
+
+    def loaded_rows(self) -> list:
+        """The violations list from the last populate_table (what row ids refer to)"""
+        return self.history_model.store.rows
+
+    def patch_rows(self, violations: list):
+        """
+        Update loaded violations in place and add newer ones at the top
+
+        Violations dated before the newest loaded one are left for the next
+        refresh, which lists them in date order.
+        """
+        rows = self.history_model.store.rows
+        newest = (rows[0]['date'] or '', rows[0]['violation_id']) if rows else None
+        self.history_model.patch_rows(
+            'violation_id', violations, prepend=True,
+            is_new=lambda v: newest is None or (v['date'] or '', v['violation_id']) > newest
+        )
+
+    def show_rows(self, row_ids=None):
+        """Show only the given row ids from the last populate_table (None shows all)"""
+        self.history_model.set_visible_rows(row_ids)
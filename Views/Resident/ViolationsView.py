@@ -1,13 +1,17 @@
 import os
 
-from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QFont, QCursor
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QHBoxLayout, QComboBox,
-    QTableWidget, QHeaderView, QTableWidgetItem, QPushButton
+    QTableView, QHeaderView
 )
 
 from Views.Common.StyledWidgets import StyledWidgets
+from Views.Common.TableModels import (
+    TableColumn, LazyTableModel, TableSortProxyModel, ActionButton, ActionButtonDelegate,
+    money_value, peso
+)
 
 # Resolve the icon path once at module level
 CHEVRON_ICON = os.path.join(
@@ -15,6 +19,19 @@ CHEVRON_ICON = os.path.join(
 ).replace("\\", "/")
 
 
+VIOLATION_COLUMNS = [
+    TableColumn("Violation ID", 'violation_id'),
+    TableColumn("Vehicle Plate", 'plate_no'),
+    TableColumn("Violation Type", 'violation_type'),
+    TableColumn("Date", 'date'),
+    TableColumn("Fine Amount", value=money_value('fine_amount'), display=peso),
+    TableColumn("Action"),
+]
+
+PAY_BUTTON = ActionButton('pay', "Pay", "#e8bb41", "#f0c855", color="#1e1e1e", width=100, height=40)
+PAID_BADGE = ActionButton('paid', "Paid", "#2e7d32", width=100, height=40, clickable=False)
+
+
 class ViolationsView(QWidget):
     """Violations table view"""
 
@@ -28,17 +45,6 @@ class ViolationsView(QWidget):
         super().__init__()
         self._setup_ui()
 
-    # ---------- helper to center widgets in table cells ----------
-    def _center_widget(self, widget: QWidget) -> QWidget:
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addStretch()
-        layout.addWidget(widget)
-        layout.addStretch()
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        return container
-
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
@@ -113,15 +119,22 @@ class ViolationsView(QWidget):
         layout.addLayout(filter_layout)
 
         # Table
-        self.violations_table = QTableWidget()
-        self.violations_table.setColumnCount(6)
-        self.violations_table.setHorizontalHeaderLabels([
-            "Violation ID", "Vehicle Plate", "Violation Type",
-            "Date", "Fine Amount", "Action"
-        ])
+        self.violations_model = LazyTableModel(VIOLATION_COLUMNS, self)
+        self.violations_proxy = TableSortProxyModel(self)
+        self.violations_proxy.setSourceModel(self.violations_model)
+
+        self.violations_table = QTableView()
+        self.violations_table.setModel(self.violations_proxy)
 
         StyledWidgets.style_table(self.violations_table)
 
+        actions = ActionButtonDelegate(
+            lambda violation: [PAY_BUTTON if violation.get("status", "Unpaid") == "Unpaid" else PAID_BADGE],
+            self.violations_table
+        )
+        actions.action_triggered.connect(lambda action, violation: self.payment_requested.emit(violation))
+        self.violations_table.setItemDelegateForColumn(5, actions)
+
         header = self.violations_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
@@ -140,63 +153,26 @@ class ViolationsView(QWidget):
         layout.addWidget(self.violations_table)
 
     def populate_table(self, violations: list):
-        self.violations_table.setRowCount(len(violations))
-
-        for row, violation in enumerate(violations):
-            def set_item(col, text):
-                item = QTableWidgetItem(str(text))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.violations_table.setItem(row, col, item)
-
-            set_item(0, violation.get("violation_id", ""))
-            set_item(1, violation.get("plate_no", ""))
-            set_item(2, violation.get("violation_type", ""))
-            set_item(3, violation.get("date", ""))
-
-            fine = float(violation.get("fine_amount", 0) or 0)
-            set_item(4, f"₱{fine:.2f}")
-
-            status = violation.get("status", "Unpaid")
-
-            if status == "Unpaid":
-                btn = QPushButton("Pay")
-                btn.setFixedSize(100, 40)
-                btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e8bb41;
-                        color: #1e1e1e;
-                        border-radius: 8px;
-                        font-weight: bold;
-                        font-size: 13px;
-                        border: none;
-                    }
-                    QPushButton:hover { background-color: #f0c855; }
-                    QPushButton:pressed { background-color: #d4a838; }
-                """)
-                btn.clicked.connect(
-                    lambda _, v=violation: self.payment_requested.emit(v)
-                )
-
-                self.violations_table.setCellWidget(
-                    row, 5, self._center_widget(btn)
-                )
-
-            else:
-                paid = QLabel("Paid")
-                paid.setFixedSize(100, 40)
-                paid.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                paid.setStyleSheet("""
-                    QLabel {
-                        background-color: #2e7d32;
-                        color: #ffffff;
-                        border-radius: 8px;
-                        font-weight: bold;
-                        font-size: 13px;
-                    }
-                """)
-
-                self.violations_table.setCellWidget(
-                    row, 5, self._center_widget(paid)
-                )
\ No newline at end of file
+        self.violations_model.set_rows(violations)
+
+    def loaded_rows(self) -> list:
+        """The violations list from the last populate_table (what row ids refer to)"""
+        return self.violations_model.store.rows
+
+    def patch_rows(self, violations: list):
+        """
+        Update loaded violations in place and add newer ones at the top
+
+        Violations dated before the newest loaded one are left for the next
+        refresh, which lists them in date order.
+        """
+        rows = self.violations_model.store.rows
+        newest = (rows[0]['date'] or '', rows[0]['violation_id']) if rows else None
+        self.violations_model.patch_rows(
+            'violation_id', violations, prepend=True,
+            is_new=lambda v: newest is None or (v['date'] or '', v['violation_id']) > newest
+        )
+
+    def show_rows(self, row_ids=None):
+        """Show only the given row ids from the last populate_table (None shows all)"""
+        self.violations_model.set_visible_rows(row_ids)
@@ -0,0 +1,216 @@
+"""
+benchmarks/bench_dataset.py
+Scratch benchmark database cloned from the RoadEyeDB schema and seeded with
+synthetic rows, so benchmarks never touch the real data
+"""
+import random
+from datetime import datetime, timedelta
+
+import mysql.connector
+
+from Models.Database import Database, load_database_config
+from Models.ChangeFeedModel import CHANGE_LOG_SQL
+from Models.DashboardSummaryModel import SUMMARY_TABLES_SQL
+from Models.IdAllocator import ID_SEQUENCES_SQL
+
+
+# Tables cloned into the scratch database, in insert order
+BENCH_TABLES = ['users', 'residents', 'vehicles', 'violation_types', 'violations', 'payments']
+
+# Generated IDs for millions of rows outgrow the real columns, so the clones get wider ones
+WIDE_ID_COLUMNS = {
+    'users': ['UserID'],
+    'residents': ['ResidentID', 'UserID'],
+    'vehicles': ['VehicleID', 'ResidentID'],
+    'violations': ['ViolationID', 'VehicleID'],
+    'payments': ['PaymentID', 'ViolationID'],
+}
+
+
+# Violations in the standard benchmark datasets
+DATASET_SCALES = {
+    'small': 1_000,
+    'medium': 100_000,
+    'large': 5_000_000,
+}
+
+
+def bench_database_name(config: dict = None) -> str:
+    """Name of the scratch schema derived from the configured database"""
+    config = config or load_database_config()
+    return f"{config['database']}_bench"
+
+
+def create_bench_schema(config: dict = None, bench_db: str = None):
+    """(Re)create the scratch schema with empty copies of the RoadEye tables"""
+    config = config or load_database_config()
+    bench_db = bench_db or bench_database_name(config)
+
+    connection = mysql.connector.connect(
+        host=config['host'], user=config['user'], password=config['password']
+    )
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"DROP DATABASE IF EXISTS `{bench_db}`")
+        cursor.execute(f"CREATE DATABASE `{bench_db}`")
+
+        for table in BENCH_TABLES:
+            cursor.execute(
+                f"CREATE TABLE `{bench_db}`.`{table}` LIKE `{config['database']}`.`{table}`"
+            )
+            for column in WIDE_ID_COLUMNS.get(table, []):
+                cursor.execute(
+                    f"ALTER TABLE `{bench_db}`.`{table}` MODIFY `{column}` varchar(16)"
+                )
+
+        # Bookkeeping tables the write paths maintain alongside the data
+        cursor.execute(f"USE `{bench_db}`")
+        for statement in [ID_SEQUENCES_SQL, CHANGE_LOG_SQL] + SUMMARY_TABLES_SQL:
+            cursor.execute(statement)
+
+        # Violation types are reference data - reuse the real ones
+        cursor.execute(
+            f"INSERT INTO `{bench_db}`.violation_types "
+            f"SELECT * FROM `{config['database']}`.violation_types"
+        )
+        connection.commit()
+        cursor.close()
+    finally:
+        connection.close()
+
+    return bench_db
+
+
+def populate_scale(scale: str, seed: int = 42, config: dict = None, bench_db: str = None) -> int:
+    """
+    Recreate the scratch schema and bulk-load a standard dataset size with
+    populate_database's generator (see DATASET_SCALES)
+
+    Returns:
+        int: Number of violations loaded
+    """
+    # Imported here: the populator pulls in every model
+    from populate_database import DatabasePopulator
+
+    config = config or load_database_config()
+    bench_db = create_bench_schema(config, bench_db)
+    violation_count = DATASET_SCALES[scale]
+    populator = DatabasePopulator(config['host'], bench_db, config['user'], config['password'])
+    if not populator.populate_bulk(violation_count, seed=seed):
+        raise RuntimeError(f"Seeding the {scale} dataset failed")
+    return violation_count
+
+
+def open_bench_database(config: dict = None, bench_db: str = None) -> Database:
+    """Database service pointed at the scratch schema"""
+    config = dict(config or load_database_config())
+    config['database'] = bench_db or bench_database_name(config)
+    return Database(**config)
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def seed_dataset(db: Database, violation_count: int, seed: int = 42,
+                 chunk_size: int = 10000, paid_ratio: float = 0.7):
+    """
+    Fill the scratch schema with a reproducible synthetic dataset
+
+    Roughly one resident per 100 violations and two vehicles per resident.
+
+    Returns:
+        dict: Number of rows inserted per table
+    """
+    rng = random.Random(seed)
+    resident_count = max(10, violation_count // 100)
+    vehicle_count = resident_count * 2
+    start_date = datetime(datetime.now().year - 2, 1, 1)
+    date_span = (datetime.now() - start_date).days
+
+    with db.get_connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT ViolationTypeID, FineAmount FROM violation_types")
+        violation_types = cursor.fetchall()
+
+        residents = (
+            (f"R{n:07d}", f"U{n:07d}", f"First{n}", None, f"Last{n % 997}",
+             rng.choice(['Male', 'Female']), f"09{rng.randint(100000000, 999999999)}",
+             f"Purok {n % 12 + 1}")
+            for n in range(1, resident_count + 1)
+        )
+        for chunk in _chunks(residents, chunk_size):
+            cursor.executemany("""
+                INSERT INTO residents (ResidentID, UserID, RFirstName, RMiddleName, RLastName,
+                                       Sex, ContactNo, Address)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """, chunk)
+            connection.commit()
+
+        vehicles = (
+            (f"VH{n:07d}", f"R{(n - 1) // 2 + 1:07d}", f"PLT{n:07d}",
+             rng.choice(['Toyota', 'Honda', 'Nissan', 'Ford']), 'Model', 'White')
+            for n in range(1, vehicle_count + 1)
+        )
+        for chunk in _chunks(vehicles, chunk_size):
+            cursor.executemany("""
+                INSERT INTO vehicles (VehicleID, ResidentID, PlateNo, Brand, Model, Color)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, chunk)
+            connection.commit()
+
+        payment_count = 0
+        violations = []
+        payments = []
+        for n in range(1, violation_count + 1):
+            violation_id = f"V{n:07d}"
+            type_id, fine = rng.choice(violation_types)
+            violation_date = start_date + timedelta(days=rng.randint(0, date_span),
+                                                    seconds=rng.randint(0, 86399))
+            violations.append((violation_id, f"VH{rng.randint(1, vehicle_count):07d}",
+                               type_id, '', violation_date))
+
+            if rng.random() < paid_ratio:
+                payment_count += 1
+                payments.append((f"P{payment_count:07d}", violation_id, 'Cash',
+                                 f"RCPT-BENCH-{payment_count:09d}", fine,
+                                 violation_date + timedelta(days=rng.randint(1, 30))))
+
+            if len(violations) >= chunk_size:
+                _insert_violation_chunk(cursor, violations, payments)
+                connection.commit()
+                violations, payments = [], []
+
+        if violations:
+            _insert_violation_chunk(cursor, violations, payments)
+            connection.commit()
+
+        cursor.close()
+
+    return {
+        'residents': resident_count,
+        'vehicles': vehicle_count,
+        'violations': violation_count,
+        'payments': payment_count
+    }
+
+
+def _insert_violation_chunk(cursor, violations, payments):
+    cursor.executemany("""
+        INSERT INTO violations (ViolationID, VehicleID, ViolationTypeID, Location,
+                                ViolationDate, IsDeleted)
+        VALUES (%s, %s, %s, %s, %s, 0)
+    """, violations)
+    if payments:
+        cursor.executemany("""
+            INSERT INTO payments (PaymentID, ViolationID, PaymentType, ReceiptNo,
+                                  AmountPaid, PaymentDate, Status)
+            VALUES (%s, %s, %s, %s, %s, %s, 'PAID')
+        """, payments)
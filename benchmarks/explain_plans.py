@@ -0,0 +1,118 @@
+"""
+benchmarks/explain_plans.py
+EXPLAIN-based regression check for the hot violation/payment access paths
+
+Fails (exit status 1) when a query stops using the index added for it by
+Models/SchemaMigrations.py. Point it at the scratch schema after seeding so
+the optimizer has realistic statistics.
+
+Usage: python -m benchmarks.explain_plans [--bench]
+"""
+import argparse
+import sys
+from datetime import date
+
+from Models.Database import Database
+from benchmarks.bench_dataset import open_bench_database
+
+
+# (description, query, params, table alias in the plan, acceptable index names)
+PLAN_EXPECTATIONS = [
+    (
+        "admin violation list",
+        """
+        SELECT ViolationID, ViolationDate
+        FROM violations
+        WHERE IsDeleted = 0
+        ORDER BY ViolationDate DESC
+        LIMIT 50
+        """,
+        (),
+        'violations',
+        {'idx_violations_deleted_date'},
+    ),
+    (
+        "monthly violations (date range)",
+        """
+        SELECT MONTH(ViolationDate), COUNT(*)
+        FROM violations
+        WHERE IsDeleted = 0
+          AND ViolationDate >= %s
+          AND ViolationDate < %s
+        GROUP BY MONTH(ViolationDate)
+        """,
+        (date(date.today().year, 1, 1), date(date.today().year + 1, 1, 1)),
+        'violations',
+        {'idx_violations_deleted_date'},
+    ),
+    (
+        "payment history",
+        """
+        SELECT PaymentID, PaymentDate
+        FROM payments
+        WHERE Status = 'PAID'
+        ORDER BY PaymentDate DESC
+        LIMIT 50
+        """,
+        (),
+        'payments',
+        {'idx_payments_status_date'},
+    ),
+    (
+        "payment lookup by violation",
+        "SELECT PaymentID, Status FROM payments WHERE ViolationID = %s",
+        ('V0000001',),
+        'payments',
+        {'uq_payments_violation'},
+    ),
+]
+
+
+def explain(db: Database, query: str, params=()):
+    """Return the EXPLAIN rows for a query as dictionaries"""
+    with db.get_connection() as connection:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("EXPLAIN " + query, params)
+        plan = cursor.fetchall()
+        cursor.close()
+    return plan
+
+
+def check_plans(db: Database):
+    """
+    Run every expectation and report the chosen index
+
+    Returns:
+        list: Descriptions of the queries whose plan regressed
+    """
+    failures = []
+    for description, query, params, table, indexes in PLAN_EXPECTATIONS:
+        plan = explain(db, query, params)
+        row = next((r for r in plan if r['table'] == table), plan[0])
+        chosen = row.get('key')
+        ok = chosen in indexes
+        print(f"{'ok  ' if ok else 'FAIL'} {description:35s} key={chosen} "
+              f"type={row.get('type')} rows={row.get('rows')} extra={row.get('Extra')}")
+        if not ok:
+            failures.append(description)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--bench', action='store_true', help='check the seeded scratch schema')
+    args = parser.parse_args()
+
+    db = open_bench_database() if args.bench else Database.from_config()
+    db.check_and_migrate()
+    failures = check_plans(db)
+    db.close()
+
+    if failures:
+        print(f"\n{len(failures)} query plan(s) regressed: {', '.join(failures)}")
+        sys.exit(1)
+    print("\nAll query plans use their indexes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+benchmarks/id_allocation_benchmark.py
+Many parallel inserters: every new violation must get a distinct ID
+
+Each worker thread stands in for a separate client process with its own
+Database, and so its own cached ID blocks. A collision shows up as an
+insert rejected by the primary key. --legacy runs the previous
+MAX()+1 generation instead for comparison.
+
+Usage: python -m benchmarks.id_allocation_benchmark [--workers 16] [--inserts 500]
+"""
+import argparse
+import sys
+import threading
+import time
+
+from mysql.connector import Error
+
+from Models.Database import load_database_config
+from Models.IdAllocator import format_id
+from benchmarks.bench_dataset import create_bench_schema, open_bench_database, seed_dataset
+
+
+def legacy_violation_id(cursor) -> str:
+    """Previous implementation: scan for the highest number in the caller's transaction"""
+    cursor.execute("SELECT MAX(CAST(SUBSTRING(ViolationID, 2) AS UNSIGNED)) FROM violations")
+    return format_id('V', (cursor.fetchone()[0] or 0) + 1)
+
+
+def run_inserter(db, inserts: int, vehicle_id: str, type_id: str, legacy: bool, results: list):
+    """Insert violations one transaction at a time; appends (inserted, rejected)"""
+    inserted = rejected = 0
+    for _ in range(inserts):
+        try:
+            violation_id = None if legacy else db.id_allocator.next_id('violations')
+            with db.get_connection() as connection:
+                cursor = connection.cursor()
+                if legacy:
+                    violation_id = legacy_violation_id(cursor)
+                cursor.execute("""
+                    INSERT INTO violations (ViolationID, VehicleID, ViolationTypeID, Location,
+                                            ViolationDate, IsDeleted)
+                    VALUES (%s, %s, %s, '', NOW(), 0)
+                """, (violation_id, vehicle_id, type_id))
+                connection.commit()
+                cursor.close()
+            inserted += 1
+        except Error:
+            rejected += 1
+    results.append((inserted, rejected))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=16, help='parallel inserters (one Database each)')
+    parser.add_argument('--inserts', type=int, default=500, help='inserts per worker')
+    parser.add_argument('--block-size', type=int, default=10, help='IDs reserved per round trip')
+    parser.add_argument('--legacy', action='store_true', help='use the old MAX()+1 IDs')
+    args = parser.parse_args()
+
+    config = load_database_config()
+    config['pool_size'] = 1
+    config['id_block_size'] = args.block_size
+
+    create_bench_schema(config)
+    db = open_bench_database(config)
+    seed_dataset(db, 1000)
+    with db.get_connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT VehicleID FROM vehicles LIMIT 1")
+        vehicle_id = cursor.fetchone()[0]
+        cursor.execute("SELECT ViolationTypeID FROM violation_types LIMIT 1")
+        type_id = cursor.fetchone()[0]
+        cursor.execute("SELECT COUNT(*) FROM violations")
+        seeded = cursor.fetchone()[0]
+        cursor.close()
+
+    clients = [open_bench_database(config) for _ in range(args.workers)]
+    results = []
+    threads = [
+        threading.Thread(target=run_inserter,
+                         args=(client, args.inserts, vehicle_id, type_id, args.legacy, results))
+        for client in clients
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    inserted = sum(r[0] for r in results)
+    rejected = sum(r[1] for r in results)
+    with db.get_connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT COUNT(*), COUNT(DISTINCT ViolationID) FROM violations")
+        rows, distinct = cursor.fetchone()
+        cursor.close()
+
+    ok = rejected == 0 and rows == distinct == seeded + inserted
+    mode = "legacy MAX()+1" if args.legacy else f"IdAllocator (block {args.block_size})"
+    print(f"{mode}: {args.workers} workers x {args.inserts} inserts in {elapsed:.2f} s "
+          f"({inserted / elapsed:,.0f} inserts/s)")
+    print(f"  inserted {inserted:,}  rejected {rejected:,}  [{'ok' if ok else 'COLLISIONS'}]")
+
+    for client in clients:
+        client.close()
+    db.close()
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+benchmarks/ingestion_benchmark.py
+Bulk detection ingestion throughput against one-at-a-time add_violation
+
+Writes a synthetic CSV of camera detections for the seeded vehicles
+(with a share of unregistered plates to exercise the error report),
+ingests it with IngestionController and reports rows per second. The
+target is at least 50k rows/s against a local MySQL.
+
+Usage: python -m benchmarks.ingestion_benchmark [--rows 500000] [--chunk-size 5000]
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from Controllers.IngestionController import IngestionController, INGEST_CHUNK_SIZE
+from Models.ViolationModel import ViolationModel
+from benchmarks.bench_dataset import create_bench_schema, open_bench_database, seed_dataset
+
+
+def write_detections(path: str, rows: int, vehicle_count: int, type_ids: list,
+                     unknown_ratio: float, seed: int):
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=1)
+    with open(path, 'w', newline='') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['PlateNo', 'ViolationTypeID', 'ViolationDate', 'Speed', 'Location'])
+        for n in range(rows):
+            if rng.random() < unknown_ratio:
+                plate = f"ZZZ{n:07d}"
+            else:
+                plate = f"PLT-{rng.randint(1, vehicle_count):07d}"
+            detected_at = start + timedelta(seconds=rng.randint(0, 86399))
+            writer.writerow([plate, rng.choice(type_ids), detected_at.isoformat(sep=' '),
+                             f"{rng.uniform(40, 140):.2f}", f"CAM-{rng.randint(1, 40):02d}"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=500_000, help='detections to ingest')
+    parser.add_argument('--chunk-size', type=int, default=INGEST_CHUNK_SIZE, help='detections per transaction')
+    parser.add_argument('--unknown-ratio', type=float, default=0.01, help='share of unregistered plates')
+    parser.add_argument('--single-rows', type=int, default=1000, help='add_violation calls for the baseline')
+    parser.add_argument('--seed', type=int, default=42, help='RNG seed')
+    args = parser.parse_args()
+
+    print("Seeding vehicles...")
+    create_bench_schema()
+    db = open_bench_database()
+    counts = seed_dataset(db, 100_000, seed=args.seed)
+
+    violation_model = ViolationModel(db)
+    type_ids = [t['ViolationTypeID'] for t in violation_model.get_violation_types()]
+
+    fd, path = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        write_detections(path, args.rows, counts['vehicles'], type_ids, args.unknown_ratio, args.seed)
+
+        controller = IngestionController(db)
+        report = controller.ingest_file(path, chunk_size=args.chunk_size)
+        errors = sum(len(batch['errors']) for batch in report['batches'])
+        failed = sum(1 for batch in report['batches'] if batch['failed'])
+        print(f"{'IngestionController.ingest_file':35s} {report['inserted']:9,} rows in "
+              f"{report['seconds']:7.2f} s  {report['rows_per_second']:9,.0f} rows/s  "
+              f"(rejected {errors:,}, failed batches {failed})")
+    finally:
+        os.remove(path)
+
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    for _ in range(args.single_rows):
+        violation_model.add_violation(f"VH{rng.randint(1, counts['vehicles']):07d}",
+                                      rng.choice(type_ids), datetime.now())
+    elapsed = time.perf_counter() - start
+    print(f"{'ViolationModel.add_violation':35s} {args.single_rows:9,} rows in "
+          f"{elapsed:7.2f} s  {args.single_rows / elapsed:9,.0f} rows/s")
+
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
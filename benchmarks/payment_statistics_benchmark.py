@@ -0,0 +1,99 @@
+"""
+benchmarks/payment_statistics_benchmark.py
+Compare the old fetch-everything payment statistics with the SQL aggregate
+
+Usage: python -m benchmarks.payment_statistics_benchmark [--rows 1000000]
+"""
+import argparse
+import statistics
+import time
+
+from Models.PaymentModel import PaymentModel
+from Models.ReportModel import ReportModel
+from benchmarks.bench_dataset import create_bench_schema, open_bench_database, seed_dataset
+
+
+def legacy_payment_statistics(db):
+    """Previous implementation: pull every row and count/sum in Python"""
+    with db.get_connection() as connection:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT v.ViolationID,
+                   vt.FineAmount,
+                   COALESCE(p.Status, 'UNPAID') as PaymentStatus
+            FROM violations v
+            INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+            INNER JOIN residents r ON vh.ResidentID = r.ResidentID
+            INNER JOIN violation_types vt ON v.ViolationTypeID = vt.ViolationTypeID
+            LEFT JOIN payments p ON v.ViolationID = p.ViolationID
+            WHERE v.IsDeleted = 0
+        """)
+        results = cursor.fetchall()
+        cursor.close()
+
+    total_violations = len(results)
+    paid_count = sum(1 for v in results if v['PaymentStatus'] == 'PAID')
+    return {
+        'total_violations': total_violations,
+        'paid_count': paid_count,
+        'unpaid_count': total_violations - paid_count,
+        'total_revenue': sum(float(v['FineAmount']) for v in results if v['PaymentStatus'] == 'PAID'),
+        'pending_revenue': sum(float(v['FineAmount']) for v in results if v['PaymentStatus'] != 'PAID')
+    }
+
+
+def time_call(func, repeat: int):
+    """Run func repeat times and return (result, list of seconds)"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return result, timings
+
+
+def same_statistics(a: dict, b: dict) -> bool:
+    return all(abs(float(a[key]) - float(b[key])) < 0.01 for key in a)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='violations to seed')
+    parser.add_argument('--seed', type=int, default=42, help='RNG seed for the dataset')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per path')
+    parser.add_argument('--reuse', action='store_true', help='skip seeding and reuse the scratch schema')
+    args = parser.parse_args()
+
+    if not args.reuse:
+        print(f"Seeding {args.rows:,} violations...")
+        create_bench_schema()
+        db = open_bench_database()
+        counts = seed_dataset(db, args.rows, seed=args.seed)
+        print(f"  seeded {counts}")
+    else:
+        db = open_bench_database()
+
+    payment_model = PaymentModel(db)
+    report_model = ReportModel(db)
+
+    paths = [
+        ('legacy python aggregation', lambda: legacy_payment_statistics(db)),
+        ('PaymentModel.get_payment_statistics', payment_model.get_payment_statistics),
+        ('ReportModel.get_payment_report_statistics', report_model.get_payment_report_statistics),
+    ]
+
+    baseline = None
+    for name, func in paths:
+        result, timings = time_call(func, args.repeat)
+        if baseline is None:
+            baseline = result
+        match = "ok" if same_statistics(baseline, result) else "MISMATCH"
+        print(f"{name:45s} min {min(timings) * 1000:9.1f} ms  "
+              f"median {statistics.median(timings) * 1000:9.1f} ms  [{match}]")
+
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,346 @@
+"""
+benchmarks/run_benchmarks.py
+Scale-parameterized benchmark suite over the scratch database
+
+Seeds one of the standard datasets (small 1k / medium 100k / large 5M
+violations, see DATASET_SCALES) with populate_database's bulk generator,
+then times the model queries, controller searches, table population and
+chart/PDF generation the admin and resident windows depend on. Results
+are written as JSON so runs can be compared; --compare flags any case
+whose median slowed down by more than --threshold against a previous
+result file and exits with status 1.
+
+Usage: python -m benchmarks.run_benchmarks [--scale small|medium|large] [--reuse]
+                                           [--repeat 5] [--output results.json]
+                                           [--compare baseline.json] [--threshold 1.25]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+from Models.PaymentModel import PaymentModel
+from Models.ReportArtifacts import ReportArtifactStore
+from Models.ReportModel import ReportModel
+from Models.ViolationModel import ViolationModel
+from Controllers.AdminController import AdminController
+from Controllers.ReportController import ReportController
+from Controllers.ResidentController import ResidentController
+from Controllers.VehicleController import VehicleController
+from Controllers.ViolationController import ViolationController
+from benchmarks.bench_dataset import DATASET_SCALES, open_bench_database, populate_scale
+
+
+# Held for the whole run once the table/chart cases have created it
+_qt_app = None
+
+
+class BenchmarkCase:
+    """One timed operation; setup runs before every timed call and is not measured"""
+
+    def __init__(self, group: str, name: str, func, setup=None):
+        self.group = group
+        self.name = name
+        self.func = func
+        self.setup = setup
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.name}"
+
+    def run(self, repeat: int) -> dict:
+        timings = []
+        result = None
+        for _ in range(repeat):
+            if self.setup:
+                self.setup()
+            start = time.perf_counter()
+            result = self.func()
+            timings.append(time.perf_counter() - start)
+        return {
+            'group': self.group,
+            'name': self.name,
+            'runs': repeat,
+            'min': min(timings),
+            'median': statistics.median(timings),
+            'mean': statistics.mean(timings),
+            'rows': _row_count(result),
+        }
+
+
+def _row_count(result):
+    """Rows a case produced, where that is meaningful (lists, tuples of (rows, ...), id sets)"""
+    if isinstance(result, tuple) and result and isinstance(result[0], list):
+        result = result[0]
+    if isinstance(result, (list, set, dict)):
+        return len(result)
+    return None
+
+
+def model_cases(db) -> list:
+    """Model reads, each timed against an empty query cache"""
+    violation_model = ViolationModel(db)
+    payment_model = PaymentModel(db)
+    report_model = ReportModel(db)
+    year = datetime.now().year
+    cold = db.query_cache.clear
+
+    return [
+        BenchmarkCase('model', 'ViolationModel.get_all_violations',
+                      violation_model.get_all_violations, cold),
+        BenchmarkCase('model', 'ViolationModel.get_violations_page',
+                      violation_model.get_violations_page, cold),
+        BenchmarkCase('model', 'ViolationModel.get_monthly_violations',
+                      lambda: violation_model.get_monthly_violations(year=year), cold),
+        BenchmarkCase('model', 'ViolationModel.get_violation_time_series (month, by type)',
+                      lambda: violation_model.get_violation_time_series(
+                          date(year - 5, 1, 1), date(year + 1, 1, 1), 'month', by_type=True), cold),
+        BenchmarkCase('model', 'PaymentModel.get_payment_statistics',
+                      payment_model.get_payment_statistics, cold),
+        BenchmarkCase('model', 'ReportModel.get_violations_report_data',
+                      report_model.get_violations_report_data, cold),
+        BenchmarkCase('model', 'ReportModel.get_revenue_analytics (month)',
+                      lambda: report_model.get_revenue_analytics(
+                          date(year - 5, 1, 1), date(year + 1, 1, 1), 'month'), cold),
+    ]
+
+
+def busiest_resident(db) -> str:
+    """Resident with the most violations, so the resident search has real work"""
+    with db.get_connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute("""
+            SELECT vh.ResidentID
+            FROM violations v
+            INNER JOIN vehicles vh ON v.VehicleID = vh.VehicleID
+            WHERE v.IsDeleted = 0
+            GROUP BY vh.ResidentID
+            ORDER BY COUNT(*) DESC
+            LIMIT 1
+        """)
+        row = cursor.fetchone()
+        cursor.close()
+    return row[0] if row else None
+
+
+def search_cases(db) -> list:
+    """Controller searches: index build on first use (cold) and per-keystroke lookups (warm)"""
+    admin_controller = AdminController({}, db)
+    vehicle_controller = VehicleController(db)
+    violation_controller = ViolationController(db)
+    residents = admin_controller.get_all_residents()
+    vehicles = vehicle_controller.get_all_vehicles()
+
+    def fresh_resident_index():
+        admin_controller.resident_index.build([])
+
+    cases = [
+        BenchmarkCase('search', 'AdminController.find_residents (cold)',
+                      lambda: admin_controller.find_residents(residents, 'san'), fresh_resident_index),
+        BenchmarkCase('search', 'AdminController.find_residents (warm)',
+                      lambda: admin_controller.find_residents(residents, 'san')),
+        BenchmarkCase('search', 'VehicleController.find_vehicles (warm)',
+                      lambda: vehicle_controller.find_vehicles(vehicles, 'toy')),
+        BenchmarkCase('search', 'ViolationController.get_violations_page (search)',
+                      lambda: violation_controller.get_violations_page(search_text='speed'),
+                      db.query_cache.clear),
+    ]
+
+    resident_id = busiest_resident(db)
+    if resident_id:
+        resident_controller = ResidentController({'ResidentID': resident_id}, db)
+        violations = resident_controller.get_violations()
+        cases.append(BenchmarkCase(
+            'search', 'ResidentController.find_violations (warm)',
+            lambda: resident_controller.find_violations(violations, 'v', 'Unpaid')
+        ))
+    return cases
+
+
+def gui_cases(db) -> list:
+    """Table population and chart rendering; skipped when PyQt6/matplotlib are missing"""
+    global _qt_app
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtWidgets import QApplication
+        from Views.Common.TableModels import LazyTableModel, TableSortProxyModel
+        from Views.Admin.ViolationsManagementView import VIOLATION_COLUMNS
+        from Controllers.Utility.ChartGenerator import ChartGenerator
+    except ImportError as e:
+        print(f"⚠️  Skipping table/chart benchmarks: {e}")
+        return []
+
+    _qt_app = QApplication.instance() or QApplication(sys.argv)
+    rows = ViolationModel(db).get_all_violations()
+    year = datetime.now().year
+    yearly_data = [ViolationModel(db).get_monthly_violations(year=y) for y in (year, year - 1)]
+    monthly_data = yearly_data[0]
+    model = LazyTableModel(VIOLATION_COLUMNS)
+    proxy = TableSortProxyModel()
+    proxy.setSourceModel(model)
+
+    def sort_by_date():
+        proxy.sort(-1)
+        proxy.sort(4, Qt.SortOrder.DescendingOrder)
+
+    chart = ChartGenerator.create_admin_dashboard_chart()
+
+    def toggle_year():
+        for y, data in zip((year, year - 1), yearly_data):
+            chart.set_data(data, ('admin', y))
+
+    return [
+        BenchmarkCase('table', 'LazyTableModel.set_rows', lambda: model.set_rows(rows)),
+        BenchmarkCase('table', 'TableSortProxyModel.sort (date)', sort_by_date),
+        BenchmarkCase('chart', 'ChartGenerator.create_admin_dashboard_chart',
+                      lambda: ChartGenerator.create_admin_dashboard_chart(monthly_data)),
+        BenchmarkCase('chart', 'MonthlyViolationsChart.set_data (year toggle)', toggle_year),
+    ]
+
+
+def export_cases(db, path: str, artifact_dir: str) -> list:
+    """
+    PDF export of the full violations report (written to path), from a
+    list, streamed and copied from the pre-built report; loading the
+    report data from its pre-built snapshot
+    """
+    artifacts = ReportArtifactStore(artifact_dir)
+    report_controller = ReportController(db, artifacts)
+    rows = report_controller.report_model.get_violations_report_data()
+
+    def export(violations_data=None):
+        success, message = report_controller.export_violations_report_to_pdf(path, violations_data)
+        if not success:
+            raise RuntimeError(message)
+        return rows
+
+    def prebuild():
+        # Builds the violations and payment reports once; later calls find them current
+        report_controller.prebuild_reports(granularities=())
+
+    return [
+        BenchmarkCase('export', 'ReportController.export_violations_report_to_pdf (list)',
+                      lambda: export(rows)),
+        BenchmarkCase('export', 'ReportController.export_violations_report_to_pdf (streamed)', export,
+                      artifacts.clear),
+        BenchmarkCase('export', 'ReportController.export_violations_report_to_pdf (pre-built)', export, prebuild),
+        BenchmarkCase('export', 'ReportController.get_violations_report_data (pre-built)',
+                      report_controller.get_violations_report_data, prebuild),
+    ]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(results: dict, baseline_path: str, threshold: float) -> list:
+    """Print median ratios against a previous result file; return the regressed case keys"""
+    with open(baseline_path, encoding='utf-8') as handle:
+        baseline = json.load(handle)
+    previous = {f"{r['group']}/{r['name']}": r for r in baseline['results']}
+    if baseline['meta'].get('scale') != results['meta']['scale']:
+        print(f"⚠️  Baseline was run at scale {baseline['meta'].get('scale')}")
+
+    print(f"\nAgainst {baseline_path} ({baseline['meta'].get('commit') or 'unknown commit'}):")
+    regressed = []
+    for result in results['results']:
+        key = f"{result['group']}/{result['name']}"
+        before = previous.get(key)
+        if not before or not before['median']:
+            print(f"  {key:70s}        new")
+            continue
+        ratio = result['median'] / before['median']
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressed.append(key)
+        print(f"  {key:70s} {ratio:6.2f}x{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=list(DATASET_SCALES), default='small', help='dataset size')
+    parser.add_argument('--reuse', action='store_true', help='skip seeding and reuse the scratch schema')
+    parser.add_argument('--seed', type=int, default=42, help='RNG seed for the dataset')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per case')
+    parser.add_argument('--groups', default='model,search,table,chart,export',
+                        help='comma-separated case groups to run')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='previous results JSON to compare medians against')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='median ratio above which a case counts as a regression')
+    args = parser.parse_args()
+
+    if not args.reuse:
+        print(f"Seeding the {args.scale} dataset ({DATASET_SCALES[args.scale]:,} violations)...")
+        populate_scale(args.scale, seed=args.seed)
+
+    db = open_bench_database()
+    groups = set(args.groups.split(','))
+    cases = []
+    if 'model' in groups:
+        cases += model_cases(db)
+    if 'search' in groups:
+        cases += search_cases(db)
+    if groups & {'table', 'chart'}:
+        cases += [case for case in gui_cases(db) if case.group in groups]
+    fd, pdf_path = tempfile.mkstemp(suffix='.pdf')
+    os.close(fd)
+    artifact_dir = tempfile.mkdtemp(prefix='report_cache-')
+    if 'export' in groups:
+        cases += export_cases(db, pdf_path, artifact_dir)
+
+    results = {
+        'meta': {
+            'scale': args.scale,
+            'violations': DATASET_SCALES[args.scale],
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'results': [],
+    }
+
+    try:
+        for case in cases:
+            result = case.run(args.repeat)
+            results['results'].append(result)
+            rows = f"{result['rows']:>10,} rows" if result['rows'] is not None else ""
+            print(f"{case.key:70s} min {result['min'] * 1000:9.1f} ms  "
+                  f"median {result['median'] * 1000:9.1f} ms  {rows}")
+    finally:
+        os.remove(pdf_path)
+        shutil.rmtree(artifact_dir, ignore_errors=True)
+        db.close()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressed = compare_results(results, args.compare, args.threshold)
+        if regressed:
+            print(f"\n❌ {len(regressed)} case(s) slower than {args.threshold:.2f}x the baseline")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
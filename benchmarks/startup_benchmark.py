@@ -0,0 +1,117 @@
+"""
+benchmarks/startup_benchmark.py
+Time from a fresh interpreter to the login window being shown
+
+Each run starts a new Python process, so nothing is imported yet. The
+process imports RoadEyeMain, creates the QApplication and the
+Application, and calls start(), which shows LoginView. The benchmark
+fails (exit status 1) in two cases:
+- the median time to LoginView.show() is over --budget seconds;
+- a module the login screen must not load was imported by then. These
+  are pandas, matplotlib, reportlab and the resident/admin views.
+
+--importtime prints the slowest imports of one extra run (python -X importtime).
+
+Usage: python -m benchmarks.startup_benchmark [--runs 5] [--budget 1.0] [--importtime]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use after login, never by the login screen
+DEFERRED_MODULES = (
+    'pandas',
+    'matplotlib',
+    'reportlab',
+    'Views.Admin',
+    'Views.Resident',
+    'Controllers.Utility.ChartGenerator',
+    'Controllers.Utility.PDFGenerator',
+)
+
+_STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from PyQt6.QtWidgets import QApplication
+import RoadEyeMain
+imported = time.perf_counter()
+app = QApplication(sys.argv)
+application = RoadEyeMain.Application()
+application.start()
+app.processEvents()
+shown = time.perf_counter()
+print(json.dumps({'import': imported - start, 'login': shown - start, 'modules': sorted(sys.modules)}))
+"""
+
+
+def _environment() -> dict:
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+
+def measure_startup() -> dict:
+    """One cold start: seconds to import RoadEyeMain and to show the login window"""
+    completed = subprocess.run([sys.executable, '-c', _STARTUP_SCRIPT], cwd=REPO_ROOT, env=_environment(),
+                               capture_output=True, text=True, check=True)
+    # Application.start prints its progress; the measurement is the last line
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def deferred_imports(modules: list) -> list:
+    """The DEFERRED_MODULES entries that modules (names in sys.modules) include"""
+    return [prefix for prefix in DEFERRED_MODULES
+            if any(name == prefix or name.startswith(prefix + '.') for name in modules)]
+
+
+def print_slowest_imports(limit: int):
+    """Run one start under -X importtime and list the largest cumulative import times"""
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', _STARTUP_SCRIPT], cwd=REPO_ROOT,
+                               env=_environment(), capture_output=True, text=True, check=True)
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        entries.append((int(cumulative), name.rstrip()))
+
+    print("\nSlowest imports (cumulative):")
+    for cumulative, name in sorted(entries, reverse=True)[:limit]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='cold starts to time')
+    parser.add_argument('--budget', type=float, default=1.0,
+                        help='maximum median seconds to LoginView.show()')
+    parser.add_argument('--importtime', action='store_true', help='list the slowest imports')
+    args = parser.parse_args()
+
+    runs = [measure_startup() for _ in range(args.runs)]
+    import_median = statistics.median(run['import'] for run in runs)
+    login_median = statistics.median(run['login'] for run in runs)
+    print(f"{'import RoadEyeMain':35s} median {import_median * 1000:8.1f} ms")
+    print(f"{'LoginView.show()':35s} median {login_median * 1000:8.1f} ms  (budget {args.budget * 1000:.0f} ms)")
+
+    if args.importtime:
+        print_slowest_imports(15)
+
+    failed = False
+    loaded = deferred_imports(runs[-1]['modules'])
+    if loaded:
+        print(f"\n❌ Loaded before login: {', '.join(loaded)}")
+        failed = True
+    if login_median > args.budget:
+        print(f"\n❌ Startup over budget: {login_median:.3f} s > {args.budget:.3f} s")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
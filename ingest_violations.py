@@ -0,0 +1,78 @@
+"""
+ingest_violations.py
+Load camera/ANPR detection files into the violations table
+
+Each file is streamed in chunks; every chunk is one transaction. Rows
+that cannot be resolved (unregistered plate, unknown violation type,
+bad date) are skipped and listed in the per-batch error report.
+
+Usage: python ingest_violations.py detections.csv [more.jsonl ...]
+                                   [--format csv|jsonl] [--chunk-size 5000]
+                                   [--errors errors.csv]
+"""
+import argparse
+import csv
+import sys
+
+from Models.Database import Database
+from Controllers.IngestionController import IngestionController, INGEST_CHUNK_SIZE
+from Controllers.Utility.DetectionReader import DETECTION_FORMATS
+
+
+def print_report(path: str, report: dict):
+    print(f"\n📄 {path}")
+    for number, batch in enumerate(report['batches'], start=1):
+        status = f"❌ {batch['failed']}" if batch['failed'] else "✓"
+        print(f"  batch {number:4d}  lines {batch['first_line']}-{batch['last_line']}  "
+              f"inserted {batch['inserted']:,}/{batch['read']:,}  "
+              f"errors {len(batch['errors']):,}  {status}")
+    print(f"  read {report['read']:,}  inserted {report['inserted']:,}  rejected {report['rejected']:,}  "
+          f"in {report['seconds']:.2f} s ({report['rows_per_second']:,.0f} rows/s)")
+
+
+def write_errors(path: str, reports: list):
+    """One CSV line per rejected detection: file, batch, line, error"""
+    with open(path, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['file', 'batch', 'line', 'error'])
+        for source, report in reports:
+            for number, batch in enumerate(report['batches'], start=1):
+                for error in batch['errors']:
+                    writer.writerow([source, number, error['line'], error['error']])
+                if batch['failed']:
+                    writer.writerow([source, number, f"{batch['first_line']}-{batch['last_line']}",
+                                     batch['failed']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('files', nargs='+', help='CSV or JSON Lines detection files')
+    parser.add_argument('--format', choices=DETECTION_FORMATS, help='file format (default: from the extension)')
+    parser.add_argument('--chunk-size', type=int, default=INGEST_CHUNK_SIZE, help='detections per transaction')
+    parser.add_argument('--errors', help='write rejected detections to this CSV file')
+    args = parser.parse_args()
+
+    db = Database.from_config()
+    controller = IngestionController(db)
+
+    reports = []
+    for path in args.files:
+        try:
+            report = controller.ingest_file(path, args.format, args.chunk_size)
+        except OSError as e:
+            print(f"❌ {path}: {e}")
+            continue
+        print_report(path, report)
+        reports.append((path, report))
+
+    if args.errors:
+        write_errors(args.errors, reports)
+        print(f"\nError report written to {args.errors}")
+
+    db.close()
+    rejected = sum(report['rejected'] for _, report in reports)
+    return 1 if rejected or len(reports) < len(args.files) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
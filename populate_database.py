@@ -2,11 +2,90 @@
 populate_database.py
 Populate RoadEyeDB with diverse test data including users, vehicles, and violations
 across different months for chart visualization
+
+Usage: python populate_database.py                      (interactive, row by row)
+       python populate_database.py --bulk 1000000 [--seed 42] [--chunk-size 50000]
 """
+import argparse
 import mysql.connector
 from mysql.connector import Error
 from datetime import datetime, timedelta
 import random
+import re
+import time
+
+from Models.Database import Database
+from Models.DashboardSummaryModel import DashboardSummaryModel
+from Models.IdAllocator import ID_SEQUENCES, format_id, reserve_numbers
+from Models.UserModel import hash_password
+
+FIRST_NAMES = [
+    "Juan", "Maria", "Jose", "Ana", "Pedro", "Rosa", "Carlos", "Elena", "Luis", "Carmen",
+    "Miguel", "Sofia", "Antonio", "Isabel", "Ramon", "Teresa", "Fernando", "Patricia",
+    "Roberto", "Luz", "Ricardo", "Gloria", "Manuel", "Angela", "David", "Monica",
+    "Gabriel", "Diana", "Rafael", "Cristina", "Jorge", "Beatriz", "Alberto", "Sandra",
+    "Francisco", "Laura", "Enrique", "Melissa", "Daniel", "Vanessa"
+]
+
+LAST_NAMES = [
+    "Santos", "Reyes", "Cruz", "Garcia", "Flores", "Ramos", "Mendoza", "Torres",
+    "Rivera", "Gonzales", "Fernandez", "Lopez", "Martinez", "Rodriguez", "Perez",
+    "Sanchez", "Ramirez", "Dela Cruz", "Villanueva", "Aquino", "Bautista", "Castro",
+    "Santiago", "Navarro", "Morales", "Jimenez", "Valdez", "Diaz", "Aguilar", "Romero"
+]
+
+MIDDLE_NAMES = ["", "M.", "S.", "L.", "A.", "B."]
+
+SEX_OPTIONS = ["Male", "Female"]
+
+ADDRESSES = [
+    "Purok 1, Barangay San Miguel",
+    "Purok 2, Barangay Poblacion",
+    "Purok 3, Barangay Matina",
+    "Purok 4, Barangay Buhangin",
+    "Purok 5, Barangay Talomo",
+    "Purok 6, Barangay Agdao",
+    "Purok 7, Barangay Panacan",
+    "Purok 8, Barangay Sasa",
+    "Phase 1, Subdivision A",
+    "Phase 2, Subdivision B",
+    "Block 3, Lot 5, Village Heights",
+    "Block 4, Lot 8, Green Valley",
+    "Unit 12, Building A",
+    "Unit 15, Building B",
+]
+
+BRANDS = ["Toyota", "Honda", "Mitsubishi", "Nissan", "Suzuki", "Hyundai", "Ford",
+          "Mazda", "Isuzu", "Kia"]
+
+MODELS = {
+    "Toyota": ["Vios", "Innova", "Fortuner", "Wigo", "Rush", "Hilux"],
+    "Honda": ["City", "Civic", "CR-V", "BR-V", "Jazz", "Accord"],
+    "Mitsubishi": ["Mirage", "Montero", "Adventure", "L300", "Xpander"],
+    "Nissan": ["Navara", "Terra", "Almera", "Patrol", "Urvan"],
+    "Suzuki": ["Swift", "Dzire", "Ertiga", "Celerio", "Vitara"],
+    "Hyundai": ["Accent", "Tucson", "Kona", "Starex", "Reina"],
+    "Ford": ["Ranger", "Everest", "EcoSport", "Explorer", "Expedition"],
+    "Mazda": ["2", "3", "CX-5", "CX-9", "6"],
+    "Isuzu": ["D-Max", "mu-X", "Traviz", "Crosswind"],
+    "Kia": ["Picanto", "Soluto", "Sportage", "Carnival", "Sorento"]
+}
+
+COLORS = ["White", "Black", "Silver", "Red", "Blue", "Gray", "Brown", "Green"]
+
+PAYMENT_TYPES = ["Cash", "GCash", "Bank Transfer", "Online"]
+
+# Bulk mode: rows generated and inserted per transaction
+BULK_CHUNK_SIZE = 50000
+
+# Bulk mode loads these tables (in this order)
+BULK_TABLES = ['users', 'residents', 'vehicles', 'violations', 'payments']
+
+# Non-unique index lines of SHOW CREATE TABLE (KEY, FULLTEXT KEY, SPATIAL KEY)
+# as (definition, index name); the definition keeps prefix lengths, DESC
+# columns and index options
+SECONDARY_INDEX_PATTERN = re.compile(r'^\s*((?:FULLTEXT |SPATIAL )?KEY `((?:[^`]|``)+)` .*?),?$', re.MULTILINE)
+
 
 class DatabasePopulator:
     def __init__(self, host='localhost', database='RoadEyeDB', user='root', password=''):
@@ -15,6 +94,7 @@ class DatabasePopulator:
         self.user = user
         self.password = password
         self.connection = None
+        self.sequence_connection = None
         
     def connect(self):
         """Establish database connection"""
@@ -35,25 +115,38 @@ class DatabasePopulator:
     
     def disconnect(self):
         """Close database connection"""
+        if self.sequence_connection and self.sequence_connection.is_connected():
+            self.sequence_connection.close()
         if self.connection and self.connection.is_connected():
             self.connection.close()
             print("✅ Database connection closed")
     
-    def get_next_id(self, table, id_column, prefix):
-        """Get next available ID for a table"""
+    def reserve_ids(self, table, count):
+        """
+        Reserve count consecutive ID numbers from the table's id_sequences row
+        
+        Runs on a separate connection and commits at once, so the app and
+        other loaders never hand out the same IDs (see Models/IdAllocator.py).
+        Returns the reserved numbers as a range; format them with format_id.
+        """
+        if self.sequence_connection is None or not self.sequence_connection.is_connected():
+            self.sequence_connection = mysql.connector.connect(
+                host=self.host,
+                database=self.database,
+                user=self.user,
+                password=self.password
+            )
+        cursor = self.sequence_connection.cursor()
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(f"SELECT {id_column} FROM {table} ORDER BY {id_column} DESC LIMIT 1")
-            result = cursor.fetchone()
+            first, end = reserve_numbers(cursor, table, count)
+            self.sequence_connection.commit()
+        finally:
             cursor.close()
-            
-            if result:
-                last_num = int(result[0][len(prefix):])
-                return f"{prefix}{str(last_num + 1).zfill(3)}"
-            else:
-                return f"{prefix}001"
-        except:
-            return f"{prefix}001"
+        return range(first, end)
+    
+    def get_next_id(self, table):
+        """Get next available ID for a table"""
+        return format_id(ID_SEQUENCES[table][2], self.reserve_ids(table, 1)[0])
     
     def get_violation_types(self):
         """Get all available violation types"""
@@ -71,40 +164,6 @@ class DatabasePopulator:
         """Create multiple users with resident data"""
         print(f"\n📝 Creating {count} users and residents...")
         
-        first_names = [
-            "Juan", "Maria", "Jose", "Ana", "Pedro", "Rosa", "Carlos", "Elena", "Luis", "Carmen",
-            "Miguel", "Sofia", "Antonio", "Isabel", "Ramon", "Teresa", "Fernando", "Patricia",
-            "Roberto", "Luz", "Ricardo", "Gloria", "Manuel", "Angela", "David", "Monica",
-            "Gabriel", "Diana", "Rafael", "Cristina", "Jorge", "Beatriz", "Alberto", "Sandra",
-            "Francisco", "Laura", "Enrique", "Melissa", "Daniel", "Vanessa"
-        ]
-        
-        last_names = [
-            "Santos", "Reyes", "Cruz", "Garcia", "Flores", "Ramos", "Mendoza", "Torres",
-            "Rivera", "Gonzales", "Fernandez", "Lopez", "Martinez", "Rodriguez", "Perez",
-            "Sanchez", "Ramirez", "Dela Cruz", "Villanueva", "Aquino", "Bautista", "Castro",
-            "Santiago", "Navarro", "Morales", "Jimenez", "Valdez", "Diaz", "Aguilar", "Romero"
-        ]
-        
-        sex_options = ["Male", "Female"]
-        
-        addresses = [
-            "Purok 1, Barangay San Miguel",
-            "Purok 2, Barangay Poblacion",
-            "Purok 3, Barangay Matina",
-            "Purok 4, Barangay Buhangin",
-            "Purok 5, Barangay Talomo",
-            "Purok 6, Barangay Agdao",
-            "Purok 7, Barangay Panacan",
-            "Purok 8, Barangay Sasa",
-            "Phase 1, Subdivision A",
-            "Phase 2, Subdivision B",
-            "Block 3, Lot 5, Village Heights",
-            "Block 4, Lot 8, Green Valley",
-            "Unit 12, Building A",
-            "Unit 15, Building B",
-        ]
-        
         created_residents = []
         
         try:
@@ -112,17 +171,17 @@ class DatabasePopulator:
             
             for i in range(count):
                 # Generate IDs
-                user_id = self.get_next_id('users', 'UserID', 'U')
-                resident_id = self.get_next_id('residents', 'ResidentID', 'R')
+                user_id = self.get_next_id('users')
+                resident_id = self.get_next_id('residents')
                 
                 # Generate user data
-                first_name = random.choice(first_names)
-                last_name = random.choice(last_names)
+                first_name = random.choice(FIRST_NAMES)
+                last_name = random.choice(LAST_NAMES)
                 username = f"{first_name.lower()}.{last_name.lower()}{random.randint(1, 99)}"
                 password = "pass123"  # Simple password for testing
-                sex = random.choice(sex_options)
+                sex = random.choice(SEX_OPTIONS)
                 contact = f"09{random.randint(100000000, 999999999)}"
-                address = random.choice(addresses)
+                address = random.choice(ADDRESSES)
                 
                 # Insert user
                 user_query = """
@@ -137,7 +196,7 @@ class DatabasePopulator:
                                          Sex, ContactNo, Address)
                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                 """
-                middle_name = random.choice(["", "M.", "S.", "L.", "A.", "B."])
+                middle_name = random.choice(MIDDLE_NAMES)
                 cursor.execute(resident_query, (resident_id, user_id, first_name, middle_name,
                                               last_name, sex, contact, address))
                 
@@ -163,24 +222,6 @@ class DatabasePopulator:
         """Create 1-3 vehicles for each resident"""
         print(f"\n🚗 Creating vehicles for {len(residents)} residents...")
         
-        brands = ["Toyota", "Honda", "Mitsubishi", "Nissan", "Suzuki", "Hyundai", "Ford", 
-                 "Mazda", "Isuzu", "Kia"]
-        
-        models = {
-            "Toyota": ["Vios", "Innova", "Fortuner", "Wigo", "Rush", "Hilux"],
-            "Honda": ["City", "Civic", "CR-V", "BR-V", "Jazz", "Accord"],
-            "Mitsubishi": ["Mirage", "Montero", "Adventure", "L300", "Xpander"],
-            "Nissan": ["Navara", "Terra", "Almera", "Patrol", "Urvan"],
-            "Suzuki": ["Swift", "Dzire", "Ertiga", "Celerio", "Vitara"],
-            "Hyundai": ["Accent", "Tucson", "Kona", "Starex", "Reina"],
-            "Ford": ["Ranger", "Everest", "EcoSport", "Explorer", "Expedition"],
-            "Mazda": ["2", "3", "CX-5", "CX-9", "6"],
-            "Isuzu": ["D-Max", "mu-X", "Traviz", "Crosswind"],
-            "Kia": ["Picanto", "Soluto", "Sportage", "Carnival", "Sorento"]
-        }
-        
-        colors = ["White", "Black", "Silver", "Red", "Blue", "Gray", "Brown", "Green"]
-        
         created_vehicles = []
         
         try:
@@ -191,7 +232,7 @@ class DatabasePopulator:
                 num_vehicles = random.randint(1, 3)
                 
                 for _ in range(num_vehicles):
-                    vehicle_id = self.get_next_id('vehicles', 'VehicleID', 'VH')
+                    vehicle_id = self.get_next_id('vehicles')
                     
                     # Generate unique plate number
                     plate_no = f"{random.choice(['ABC', 'XYZ', 'DEF', 'GHI', 'JKL'])}" \
@@ -203,9 +244,9 @@ class DatabasePopulator:
                         plate_no = f"{random.choice(['MNO', 'PQR', 'STU', 'VWX'])}" \
                                   f"{random.randint(1000, 9999)}"
                     
-                    brand = random.choice(brands)
-                    model = random.choice(models[brand])
-                    color = random.choice(colors)
+                    brand = random.choice(BRANDS)
+                    model = random.choice(MODELS[brand])
+                    color = random.choice(COLORS)
                     
                     query = """
                         INSERT INTO vehicles (VehicleID, ResidentID, PlateNo, Brand, Model, Color)
@@ -252,7 +293,7 @@ class DatabasePopulator:
                 num_violations = random.randint(0, 5)
                 
                 for _ in range(num_violations):
-                    violation_id = self.get_next_id('violations', 'ViolationID', 'V')
+                    violation_id = self.get_next_id('violations')
                     
                     # Random date within the last 12 months
                     random_days = random.randint(0, 365)
@@ -292,8 +333,6 @@ class DatabasePopulator:
         """Create payments for some violations (60-80% paid)"""
         print(f"\n💰 Creating payments for violations...")
         
-        payment_types = ["Cash", "GCash", "Bank Transfer", "Online"]
-        
         try:
             cursor = self.connection.cursor()
             
@@ -302,14 +341,14 @@ class DatabasePopulator:
                                              int(len(violations) * random.uniform(0.6, 0.8)))
             
             for violation in violations_to_pay:
-                payment_id = self.get_next_id('payments', 'PaymentID', 'P')
+                payment_id = self.get_next_id('payments')
                 
                 # Generate receipt number
                 timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
                 random_suffix = ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789', k=4))
                 receipt_no = f"RCPT-{timestamp}-{random_suffix}"
                 
-                payment_type = random.choice(payment_types)
+                payment_type = random.choice(PAYMENT_TYPES)
                 
                 # Payment date is 1-30 days after violation date
                 violation_date = datetime.strptime(violation['date'], '%Y-%m-%d')
@@ -419,6 +458,8 @@ class DatabasePopulator:
             if violations:
                 self.create_payments(violations)
             
+            self.refresh_dashboard_summary()
+            
             # Show statistics
             self.show_statistics()
             
@@ -431,9 +472,264 @@ class DatabasePopulator:
         finally:
             self.disconnect()
 
+    # ------------------------------------------------------------------
+    # bulk mode
+    # ------------------------------------------------------------------
+    def populate_bulk(self, num_violations=1000000, seed=42, chunk_size=BULK_CHUNK_SIZE, end_date=None):
+        """
+        Generate a large load-test dataset quickly
+        
+        ID ranges are reserved up front, rows are generated in memory one
+        chunk at a time from a seeded RNG and inserted with executemany, one
+        transaction per chunk. Violations fall in the year before end_date
+        (default: today at midnight), so the same seed, size and end date
+        give the same data; only the IDs continue from what the database
+        holds. Unique and foreign-key checks are off and secondary indexes
+        are dropped during the load, then rebuilt once at the end.
+        """
+        if end_date is None:
+            end_date = datetime.combine(datetime.now().date(), datetime.min.time())
+        print("\n" + "="*60)
+        print(f"🚀 BULK LOADING {num_violations:,} VIOLATIONS (seed {seed}, end date {end_date:%Y-%m-%d})")
+        print("="*60)
+        
+        if not self.connect():
+            return False
+        
+        started = time.perf_counter()
+        rng = random.Random(seed)
+        
+        try:
+            violation_types = self.get_violation_types()
+            if not violation_types:
+                print("⚠️  Warning: No violation types found. Please add violation types first.")
+                return False
+            
+            # Same shape as the interactive mode: 1-3 vehicles per resident,
+            # about 2.5 violations per vehicle
+            num_residents = max(1, num_violations // 5)
+            vehicle_counts = [rng.randint(1, 3) for _ in range(num_residents)]
+            
+            user_numbers = self.reserve_ids('users', num_residents)
+            resident_numbers = self.reserve_ids('residents', num_residents)
+            vehicle_numbers = self.reserve_ids('vehicles', sum(vehicle_counts))
+            violation_numbers = self.reserve_ids('violations', num_violations)
+            
+            cursor = self.connection.cursor()
+            cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+            dropped_indexes = self._drop_secondary_indexes(cursor)
+            try:
+                self._bulk_residents(cursor, rng, user_numbers, resident_numbers, chunk_size)
+                self._bulk_vehicles(cursor, rng, resident_numbers, vehicle_counts, vehicle_numbers, chunk_size)
+                self._bulk_violations(cursor, rng, vehicle_numbers, violation_numbers, violation_types,
+                                      chunk_size, end_date)
+            except Exception:
+                self.connection.rollback()
+                raise
+            finally:
+                self._rebuild_indexes(cursor, dropped_indexes)
+                cursor.execute("SET SESSION unique_checks = 1, foreign_key_checks = 1")
+                cursor.close()
+            
+            self.refresh_dashboard_summary()
+            self.show_statistics()
+            
+            print(f"\n✅ BULK LOAD COMPLETED IN {time.perf_counter() - started:.1f} s")
+            return True
+            
+        except Exception as e:
+            print(f"\n❌ Error during bulk load: {e}")
+            return False
+        finally:
+            self.disconnect()
+    
+    @staticmethod
+    def _chunk_ranges(total, chunk_size):
+        for offset in range(0, total, chunk_size):
+            yield offset, min(offset + chunk_size, total)
+    
+    @staticmethod
+    def _report_progress(label, done, total, started=None):
+        if started is None:
+            print(f"  ✓ {label}: {done:,}/{total:,}", end='\r')
+            return
+        elapsed = time.perf_counter() - started
+        print(f"✅ {label}: {done:,} rows in {elapsed:.1f} s ({done / elapsed if elapsed else 0:,.0f} rows/s)")
+    
+    def _bulk_residents(self, cursor, rng, user_numbers, resident_numbers, chunk_size):
+        # One password for every generated account: hashing per row would dominate
+        password = hash_password("pass123")
+        started = time.perf_counter()
+        
+        for start, end in self._chunk_ranges(len(user_numbers), chunk_size):
+            count = end - start
+            first_names = rng.choices(FIRST_NAMES, k=count)
+            last_names = rng.choices(LAST_NAMES, k=count)
+            middle_names = rng.choices(MIDDLE_NAMES, k=count)
+            sexes = rng.choices(SEX_OPTIONS, k=count)
+            addresses = rng.choices(ADDRESSES, k=count)
+            contacts = [f"09{rng.randint(100000000, 999999999)}" for _ in range(count)]
+            
+            users = []
+            residents = []
+            for i, (user_number, resident_number) in enumerate(zip(user_numbers[start:end],
+                                                                   resident_numbers[start:end])):
+                user_id = format_id('U', user_number)
+                # The user number keeps generated usernames unique
+                username = f"{first_names[i].lower()}.{last_names[i].lower()}.{user_number}"
+                users.append((user_id, username, password))
+                residents.append((format_id('R', resident_number), user_id, first_names[i], middle_names[i],
+                                  last_names[i], sexes[i], contacts[i], addresses[i]))
+            
+            cursor.executemany("""
+                INSERT INTO users (UserID, Username, Password, UserType, IsActive)
+                VALUES (%s, %s, %s, 'Resident', TRUE)
+            """, users)
+            cursor.executemany("""
+                INSERT INTO residents (ResidentID, UserID, RFirstName, RMiddleName, RLastName,
+                                       Sex, ContactNo, Address)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """, residents)
+            self.connection.commit()
+            self._report_progress("Users and residents", end, len(user_numbers))
+        
+        self._report_progress("Users and residents", len(user_numbers), len(user_numbers), started)
+    
+    def _bulk_vehicles(self, cursor, rng, resident_numbers, vehicle_counts, vehicle_numbers, chunk_size):
+        started = time.perf_counter()
+        owners = [number for number, count in zip(resident_numbers, vehicle_counts) for _ in range(count)]
+        
+        for start, end in self._chunk_ranges(len(vehicle_numbers), chunk_size):
+            count = end - start
+            brands = rng.choices(BRANDS, k=count)
+            colors = rng.choices(COLORS, k=count)
+            plate_prefixes = rng.choices(['ABC', 'XYZ', 'DEF', 'GHI', 'JKL'], k=count)
+            
+            vehicles = []
+            for i, (vehicle_number, owner) in enumerate(zip(vehicle_numbers[start:end], owners[start:end])):
+                # Plates embed the unique vehicle number, so no uniqueness lookup is needed
+                vehicles.append((format_id('VH', vehicle_number), format_id('R', owner),
+                                 f"{plate_prefixes[i]}{vehicle_number:07d}", brands[i],
+                                 rng.choice(MODELS[brands[i]]), colors[i]))
+            
+            cursor.executemany("""
+                INSERT INTO vehicles (VehicleID, ResidentID, PlateNo, Brand, Model, Color)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, vehicles)
+            self.connection.commit()
+            self._report_progress("Vehicles", end, len(vehicle_numbers))
+        
+        self._report_progress("Vehicles", len(vehicle_numbers), len(vehicle_numbers), started)
+    
+    def _bulk_violations(self, cursor, rng, vehicle_numbers, violation_numbers, violation_types, chunk_size,
+                         end_date):
+        started = time.perf_counter()
+        start_date = end_date - timedelta(days=365)
+        span = int((end_date - start_date).total_seconds())
+        paid_ratio = rng.uniform(0.6, 0.8)
+        payment_count = 0
+        
+        for start, end in self._chunk_ranges(len(violation_numbers), chunk_size):
+            count = end - start
+            vehicles = rng.choices(vehicle_numbers, k=count)
+            types = rng.choices(violation_types, k=count)
+            seconds = [rng.randrange(span) for _ in range(count)]
+            paid = [rng.random() < paid_ratio for _ in range(count)]
+            
+            violations = []
+            payments = []
+            for i, number in enumerate(violation_numbers[start:end]):
+                violation_id = format_id('V', number)
+                violation_date = start_date + timedelta(seconds=seconds[i])
+                violations.append((violation_id, format_id('VH', vehicles[i]),
+                                   types[i]['ViolationTypeID'], violation_date))
+                if paid[i]:
+                    payments.append((violation_id, rng.choice(PAYMENT_TYPES), types[i]['FineAmount'],
+                                     violation_date + timedelta(days=rng.randint(1, 30))))
+            
+            cursor.executemany("""
+                INSERT INTO violations (ViolationID, VehicleID, ViolationTypeID, Location,
+                                        ViolationDate, IsDeleted)
+                VALUES (%s, %s, %s, '', %s, 0)
+            """, violations)
+            if payments:
+                payment_numbers = self.reserve_ids('payments', len(payments))
+                cursor.executemany("""
+                    INSERT INTO payments (PaymentID, ViolationID, PaymentType, ReceiptNo,
+                                          AmountPaid, PaymentDate, Status)
+                    VALUES (%s, %s, %s, %s, %s, %s, 'PAID')
+                """, [
+                    (format_id('P', payment_number), violation_id, payment_type,
+                     f"RCPT-BULK-{payment_number:09d}", amount, payment_date)
+                    for payment_number, (violation_id, payment_type, amount, payment_date)
+                    in zip(payment_numbers, payments)
+                ])
+            self.connection.commit()
+            payment_count += len(payments)
+            self._report_progress("Violations", end, len(violation_numbers))
+        
+        self._report_progress("Violations", len(violation_numbers), len(violation_numbers), started)
+        print(f"✅ Payments: {payment_count:,} rows")
+    
+    def _drop_secondary_indexes(self, cursor):
+        """
+        Drop the plain secondary indexes of the bulk tables for the load
+        
+        Definitions are taken verbatim from SHOW CREATE TABLE so they come
+        back with their prefix lengths, sort order and options. Indexes a
+        foreign key still relies on cannot be dropped and stay. Returns
+        (table, index, definition) for _rebuild_indexes.
+        """
+        dropped = []
+        for table in BULK_TABLES:
+            cursor.execute(f"SHOW CREATE TABLE `{table}`")
+            create_table = cursor.fetchall()[0][1]
+            for definition, index_name in SECONDARY_INDEX_PATTERN.findall(create_table):
+                try:
+                    cursor.execute(f"ALTER TABLE `{table}` DROP INDEX `{index_name}`")
+                    dropped.append((table, index_name, definition))
+                except Error:
+                    pass  # needed by a foreign key constraint
+        if dropped:
+            print(f"✓ Dropped {len(dropped)} secondary indexes for the load")
+        return dropped
+    
+    def _rebuild_indexes(self, cursor, dropped):
+        """Re-add dropped indexes with one ALTER TABLE (one rebuild) per table"""
+        tables = {}
+        for table, index_name, definition in dropped:
+            tables.setdefault(table, []).append(f"ADD {definition}")
+        for table, definitions in tables.items():
+            print(f"  ⏳ Rebuilding indexes on {table}...")
+            cursor.execute(f"ALTER TABLE `{table}` {', '.join(definitions)}")
+        if dropped:
+            print(f"✓ Rebuilt {len(dropped)} secondary indexes")
+    
+    def refresh_dashboard_summary(self):
+        """Rebuild the materialized dashboard totals the app reads"""
+        db = Database(host=self.host, database=self.database, user=self.user, password=self.password)
+        try:
+            summary_model = DashboardSummaryModel(db)
+            success, message = summary_model.ensure_tables()
+            if success:
+                success, message = summary_model.rebuild()
+            print(("✅ " if success else "❌ ") + message)
+        finally:
+            db.close()
+
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Populate RoadEyeDB with test data")
+    parser.add_argument('--bulk', type=int, metavar='VIOLATIONS',
+                        help='bulk-load a load-test dataset with this many violations')
+    parser.add_argument('--seed', type=int, default=42, help='RNG seed for --bulk (default: 42)')
+    parser.add_argument('--chunk-size', type=int, default=BULK_CHUNK_SIZE,
+                        help=f'rows per transaction for --bulk (default: {BULK_CHUNK_SIZE})')
+    parser.add_argument('--end-date', type=datetime.fromisoformat, metavar='YYYY-MM-DD',
+                        help='latest violation date for --bulk; fix it to reproduce a dataset (default: today)')
+    args = parser.parse_args()
+    
     print("""
 ╔═══════════════════════════════════════════════════════════╗
 ║         RoadEyeDB - Database Population Script            ║
@@ -442,11 +738,12 @@ def main():
     """)
     
     # Get user input
-    try:
-        num_users = int(input("Enter number of users to create (default 30): ") or "30")
-    except ValueError:
-        num_users = 30
-        print(f"Using default: {num_users} users")
+    num_users = 30
+    if not args.bulk:
+        try:
+            num_users = int(input("Enter number of users to create (default 30): ") or "30")
+        except ValueError:
+            print(f"Using default: {num_users} users")
     
     # Database configuration
     print("\n📋 Database Configuration:")
@@ -456,7 +753,11 @@ def main():
     password = input("Password (default: empty): ") or ""
     
     # Confirm
-    print(f"\n⚠️  This will add {num_users} users with vehicles and violations to {database}")
+    if args.bulk:
+        print(f"\n⚠️  This will bulk-load {args.bulk:,} violations with their residents, "
+              f"vehicles and payments into {database}")
+    else:
+        print(f"\n⚠️  This will add {num_users} users with vehicles and violations to {database}")
     confirm = input("Continue? (y/n): ").lower()
     
     if confirm != 'y':
@@ -465,7 +766,10 @@ def main():
     
     # Execute population
     populator = DatabasePopulator(host, database, user, password)
-    populator.populate_all(num_users)
+    if args.bulk:
+        populator.populate_bulk(args.bulk, seed=args.seed, chunk_size=args.chunk_size, end_date=args.end_date)
+    else:
+        populator.populate_all(num_users)
 
 
 if __name__ == "__main__":
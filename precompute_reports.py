@@ -0,0 +1,83 @@
+"""
+precompute_reports.py
+Pre-build the reports off-peak so the Reports page serves them instantly
+
+Builds the violations report (data and PDF), the payment report and the
+daily and monthly revenue analytics (data and PDF) into the report
+artifact cache (see Models/ReportArtifacts.py). Reports whose data has
+not changed since they were last built are skipped.
+
+Run it once from cron or Task Scheduler, or pass --at to keep it running
+and rebuild every day at that time.
+
+Usage: python precompute_reports.py [--at 02:00] [--granularities day,month]
+                                    [--cache-dir report_cache] [--clear]
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+
+from Models.Database import Database
+from Models.ReportArtifacts import ReportArtifactStore
+from Models.TimeBuckets import TIME_SERIES_GRANULARITIES
+from Controllers.ReportController import ReportController, PREBUILT_REVENUE_GRANULARITIES
+
+
+def build_reports(controller: ReportController, granularities: tuple) -> bool:
+    """Build the stale reports and print one line each; True if all are current"""
+    print(f"\n🕑 {datetime.now():%Y-%m-%d %H:%M:%S}")
+    all_current = True
+    for report, success, message in controller.prebuild_reports(granularities):
+        print(f"  {'✓' if success else '❌'} {report:40s} {message}")
+        all_current = all_current and success
+    return all_current
+
+
+def seconds_until(at: str) -> float:
+    """Seconds from now to the next HH:MM"""
+    hour, minute = (int(part) for part in at.split(':'))
+    now = datetime.now()
+    next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--at', help='stay running and rebuild every day at this time (HH:MM)')
+    parser.add_argument('--granularities', default=','.join(PREBUILT_REVENUE_GRANULARITIES),
+                        help='comma-separated revenue analytics granularities (day, week, month)')
+    parser.add_argument('--cache-dir', help='artifact directory (default: ROADEYE_REPORT_CACHE or report_cache)')
+    parser.add_argument('--clear', action='store_true', help='delete the stored reports first')
+    args = parser.parse_args()
+
+    if args.at:
+        seconds_until(args.at)  # rejects a malformed time before the first build
+    granularities = tuple(args.granularities.split(','))
+    unknown = set(granularities) - set(TIME_SERIES_GRANULARITIES)
+    if unknown:
+        parser.error(f"unknown granularity: {', '.join(sorted(unknown))}")
+
+    db = Database.from_config()
+    artifacts = ReportArtifactStore(args.cache_dir)
+    controller = ReportController(db, artifacts)
+    if args.clear:
+        print(f"Removed {artifacts.clear()} stored report file(s) from {artifacts.directory}")
+
+    all_current = False
+    try:
+        all_current = build_reports(controller, granularities)
+        while args.at:
+            time.sleep(seconds_until(args.at))
+            build_reports(controller, granularities)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.close()
+    return 0 if all_current else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -29,7 +29,7 @@ SET time_zone = "+00:00";
 
 CREATE TABLE `activity_logs` (
   `LogID` int(11) NOT NULL,
-  `UserID` varchar(5) NOT NULL,
+  `UserID` varchar(10) NOT NULL,
   `Action` varchar(255) NOT NULL,
   `TableAffected` varchar(50) DEFAULT NULL,
   `RecordID` varchar(10) DEFAULT NULL,
@@ -312,7 +312,7 @@ INSERT INTO `activity_logs` (`LogID`, `UserID`, `Action`, `TableAffected`, `Reco
 
 CREATE TABLE `admins` (
   `AdminID` varchar(5) NOT NULL,
-  `UserID` varchar(5) NOT NULL,
+  `UserID` varchar(10) NOT NULL,
   `AFirstName` varchar(100) NOT NULL,
   `ALastName` varchar(100) NOT NULL,
   `Role` varchar(50) DEFAULT 'Admin'
@@ -329,13 +329,66 @@ INSERT INTO `admins` (`AdminID`, `UserID`, `AFirstName`, `ALastName`, `Role`) VA
 
 -- --------------------------------------------------------
 
+--
+-- Table structure for table `change_log`
+--
+
+CREATE TABLE `change_log` (
+  `ChangeID` bigint(20) NOT NULL,
+  `TableName` varchar(32) NOT NULL,
+  `RecordID` varchar(20) NOT NULL,
+  `Operation` enum('INSERT','UPDATE','DELETE') NOT NULL,
+  `ChangedAt` datetime DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `dashboard_summary`
+--
+
+CREATE TABLE `dashboard_summary` (
+  `SummaryID` tinyint(4) NOT NULL DEFAULT 1,
+  `TotalViolations` int(11) NOT NULL DEFAULT 0,
+  `PaidViolations` int(11) NOT NULL DEFAULT 0,
+  `TotalRevenue` decimal(14,2) NOT NULL DEFAULT 0.00,
+  `PendingRevenue` decimal(14,2) NOT NULL DEFAULT 0.00,
+  `TotalResidents` int(11) NOT NULL DEFAULT 0,
+  `TotalVehicles` int(11) NOT NULL DEFAULT 0,
+  `UpdatedAt` datetime DEFAULT current_timestamp() ON UPDATE current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `id_sequences`
+--
+
+CREATE TABLE `id_sequences` (
+  `Name` varchar(32) NOT NULL,
+  `NextValue` bigint(20) NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Dumping data for table `id_sequences`
+--
+
+INSERT INTO `id_sequences` (`Name`, `NextValue`) VALUES
+('payments', 24),
+('residents', 28),
+('users', 31),
+('vehicles', 25),
+('violations', 21);
+
+-- --------------------------------------------------------
+
 --
 -- Table structure for table `payments`
 --
 
 CREATE TABLE `payments` (
-  `PaymentID` varchar(5) NOT NULL,
-  `ViolationID` varchar(5) NOT NULL,
+  `PaymentID` varchar(10) NOT NULL,
+  `ViolationID` varchar(10) NOT NULL,
   `PaymentType` varchar(100) NOT NULL,
   `ReceiptNo` varchar(50) NOT NULL,
   `AmountPaid` decimal(10,2) NOT NULL,
@@ -381,8 +434,8 @@ INSERT INTO `payments` (`PaymentID`, `ViolationID`, `PaymentType`, `ReceiptNo`,
 --
 
 CREATE TABLE `residents` (
-  `ResidentID` varchar(5) NOT NULL,
-  `UserID` varchar(5) NOT NULL,
+  `ResidentID` varchar(10) NOT NULL,
+  `UserID` varchar(10) NOT NULL,
   `RFirstName` varchar(100) NOT NULL,
   `RMiddleName` varchar(100) DEFAULT NULL,
   `RLastName` varchar(100) NOT NULL,
@@ -426,12 +479,35 @@ INSERT INTO `residents` (`ResidentID`, `UserID`, `RFirstName`, `RMiddleName`, `R
 
 -- --------------------------------------------------------
 
+--
+-- Table structure for table `schema_migrations`
+--
+
+CREATE TABLE `schema_migrations` (
+  `Version` int(11) NOT NULL,
+  `Description` varchar(255) NOT NULL,
+  `AppliedAt` datetime DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Dumping data for table `schema_migrations`
+--
+
+INSERT INTO `schema_migrations` (`Version`, `Description`, `AppliedAt`) VALUES
+(1, 'Add violations.IsDeleted soft-delete flag', '2026-03-01 00:00:00'),
+(2, 'Create dashboard summary tables', '2026-03-01 00:00:00'),
+(3, 'Add covering indexes for violation and payment access paths', '2026-03-01 00:00:00'),
+(4, 'Create change_log table for incremental refresh', '2026-03-01 00:00:00'),
+(5, 'Create id_sequences table and widen record ID columns', '2026-03-01 00:00:00');
+
+-- --------------------------------------------------------
+
 --
 -- Table structure for table `users`
 --
 
 CREATE TABLE `users` (
-  `UserID` varchar(5) NOT NULL,
+  `UserID` varchar(10) NOT NULL,
   `Username` varchar(100) NOT NULL,
   `Password` varchar(100) NOT NULL,
   `UserType` enum('Admin','Resident') NOT NULL,
@@ -482,8 +558,8 @@ INSERT INTO `users` (`UserID`, `Username`, `Password`, `UserType`, `CreatedAt`,
 --
 
 CREATE TABLE `vehicles` (
-  `VehicleID` varchar(5) NOT NULL,
-  `ResidentID` varchar(5) NOT NULL,
+  `VehicleID` varchar(10) NOT NULL,
+  `ResidentID` varchar(10) NOT NULL,
   `PlateNo` varchar(20) NOT NULL,
   `VehicleType` varchar(100) DEFAULT NULL,
   `Brand` varchar(100) DEFAULT NULL,
@@ -530,8 +606,8 @@ INSERT INTO `vehicles` (`VehicleID`, `ResidentID`, `PlateNo`, `VehicleType`, `Br
 --
 
 CREATE TABLE `violations` (
-  `ViolationID` varchar(5) NOT NULL,
-  `VehicleID` varchar(5) DEFAULT NULL,
+  `ViolationID` varchar(10) NOT NULL,
+  `VehicleID` varchar(10) DEFAULT NULL,
   `ViolationTypeID` varchar(5) NOT NULL,
   `Speed` decimal(10,2) DEFAULT NULL,
   `Location` varchar(100) NOT NULL,
@@ -577,6 +653,18 @@ INSERT INTO `violations` (`ViolationID`, `VehicleID`, `ViolationTypeID`, `Speed`
 
 -- --------------------------------------------------------
 
+--
+-- Table structure for table `violation_monthly_counts`
+--
+
+CREATE TABLE `violation_monthly_counts` (
+  `Year` smallint(6) NOT NULL,
+  `Month` tinyint(4) NOT NULL,
+  `ViolationCount` int(11) NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
 --
 -- Table structure for table `violation_types`
 --
@@ -616,15 +704,34 @@ ALTER TABLE `admins`
   ADD PRIMARY KEY (`AdminID`),
   ADD KEY `UserID` (`UserID`);
 
+--
+-- Indexes for table `change_log`
+--
+ALTER TABLE `change_log`
+  ADD PRIMARY KEY (`ChangeID`);
+
+--
+-- Indexes for table `dashboard_summary`
+--
+ALTER TABLE `dashboard_summary`
+  ADD PRIMARY KEY (`SummaryID`);
+
+--
+-- Indexes for table `id_sequences`
+--
+ALTER TABLE `id_sequences`
+  ADD PRIMARY KEY (`Name`);
+
 --
 -- Indexes for table `payments`
 --
 ALTER TABLE `payments`
   ADD PRIMARY KEY (`PaymentID`),
   ADD UNIQUE KEY `ReceiptNo` (`ReceiptNo`),
-  ADD KEY `ViolationID` (`ViolationID`),
+  ADD UNIQUE KEY `uq_payments_violation` (`ViolationID`),
   ADD KEY `ProcessedBy` (`ProcessedBy`),
-  ADD KEY `VerifiedBy` (`VerifiedBy`);
+  ADD KEY `VerifiedBy` (`VerifiedBy`),
+  ADD KEY `idx_payments_status_date` (`Status`,`PaymentDate`);
 
 --
 -- Indexes for table `residents`
@@ -633,6 +740,12 @@ ALTER TABLE `residents`
   ADD PRIMARY KEY (`ResidentID`),
   ADD KEY `UserID` (`UserID`);
 
+--
+-- Indexes for table `schema_migrations`
+--
+ALTER TABLE `schema_migrations`
+  ADD PRIMARY KEY (`Version`);
+
 --
 -- Indexes for table `users`
 --
@@ -656,7 +769,15 @@ ALTER TABLE `violations`
   ADD PRIMARY KEY (`ViolationID`),
   ADD KEY `VehicleID` (`VehicleID`),
   ADD KEY `ViolationTypeID` (`ViolationTypeID`),
-  ADD KEY `ProcessedBy` (`ProcessedBy`);
+  ADD KEY `ProcessedBy` (`ProcessedBy`),
+  ADD KEY `idx_violations_deleted_date` (`IsDeleted`,`ViolationDate`,`ViolationID`),
+  ADD KEY `idx_violations_vehicle_deleted_date` (`VehicleID`,`IsDeleted`,`ViolationDate`);
+
+--
+-- Indexes for table `violation_monthly_counts`
+--
+ALTER TABLE `violation_monthly_counts`
+  ADD PRIMARY KEY (`Year`,`Month`);
 
 --
 -- Indexes for table `violation_types`
@@ -675,6 +796,12 @@ ALTER TABLE `violation_types`
 ALTER TABLE `activity_logs`
   MODIFY `LogID` int(11) NOT NULL AUTO_INCREMENT, AUTO_INCREMENT=262;
 
+--
+-- AUTO_INCREMENT for table `change_log`
+--
+ALTER TABLE `change_log`
+  MODIFY `ChangeID` bigint(20) NOT NULL AUTO_INCREMENT;
+
 --
 -- Constraints for dumped tables
 --
@@ -0,0 +1,159 @@
+"""
+tests/test_change_feed.py
+ChangeFeedController against an in-memory stand-in for MySQL
+"""
+import unittest
+from contextlib import contextmanager
+
+from Controllers.ChangeFeedController import (
+    ChangeFeedController, CHANGE_GAP_GRACE_SECONDS, CHANGE_LOG_RETENTION_HOURS
+)
+from Models.DashboardSummaryModel import DashboardSummaryModel
+from Models.QueryCache import QueryCache
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.result = None
+
+    def execute(self, query, params=None):
+        if 'MAX(ChangeID)' in query:
+            self.result = [(max((change['ChangeID'] for change in self.db.change_log), default=0),)]
+        elif 'FROM change_log' in query:
+            version, limit = params
+            committed = sorted(self.db.change_log, key=lambda change: change['ChangeID'])
+            self.result = [change for change in committed if change['ChangeID'] > version][:limit]
+        elif 'FROM dashboard_summary' in query:
+            self.result = [dict(self.db.summary)]
+        else:
+            raise AssertionError(f"Unexpected query: {query}")
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, dictionary=False):
+        return FakeCursor(self.db)
+
+
+class FakeDatabase:
+    """Just enough of Models.Database for the change feed and the dashboard summary"""
+
+    def __init__(self):
+        self.query_cache = QueryCache()
+        self.change_log = []  # committed entries, in commit order
+        self.next_change_id = 1
+        self.summary = {
+            'TotalViolations': 10, 'PaidViolations': 4, 'TotalRevenue': 2000, 'PendingRevenue': 3000,
+            'TotalResidents': 5, 'TotalVehicles': 7
+        }
+
+    @contextmanager
+    def get_connection(self):
+        yield FakeConnection(self)
+
+    def begin_write(self, table_name: str, record_id: str, operation: str = 'INSERT'):
+        """Another client's change entry, inserted (so its ChangeID is taken) but not committed"""
+        change = {'ChangeID': self.next_change_id, 'TableName': table_name,
+                  'RecordID': record_id, 'Operation': operation}
+        self.next_change_id += 1
+        return change
+
+    def commit(self, change):
+        self.change_log.append(change)
+
+    def write_from_another_client(self, table_name: str, record_id: str, operation: str = 'INSERT'):
+        self.commit(self.begin_write(table_name, record_id, operation))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ChangeFeedControllerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.db = FakeDatabase()
+        self.clock = FakeClock()
+        self.feed = ChangeFeedController(self.db, clock=self.clock)
+        self.summary_model = DashboardSummaryModel(self.db)
+        self.assertEqual(self.feed.poll(), {})
+
+    def test_foreign_violation_invalidates_dashboard_summary(self):
+        self.assertEqual(self.summary_model.get_summary()['total_violations'], 10)
+
+        # Another client adds a violation; its transaction also updates the summary
+        self.db.summary['TotalViolations'] = 11
+        self.db.write_from_another_client('violations', 'VI011')
+        self.assertEqual(self.summary_model.get_summary()['total_violations'], 10)  # still cached
+
+        self.assertEqual(self.feed.poll(), {'violations': {'VI011'}})
+        self.assertEqual(self.summary_model.get_summary()['total_violations'], 11)
+
+    def test_foreign_payment_invalidates_dashboard_summary(self):
+        self.summary_model.get_summary()
+        self.db.summary['PaidViolations'] = 5
+        self.db.write_from_another_client('payments', 'VI003', 'UPDATE')
+
+        self.feed.poll()
+        self.assertEqual(self.summary_model.get_summary()['paid_violations'], 5)
+
+    def test_no_changes_keeps_cache(self):
+        self.summary_model.get_summary()
+        self.assertEqual(self.feed.poll(), {})
+        self.assertEqual(self.db.query_cache.stats()['invalidations'], 0)
+
+    def test_change_committed_out_of_order_is_delivered(self):
+        # Client A holds change 1 uncommitted while client B commits change 2
+        slow = self.db.begin_write('violations', 'VI010')
+        self.db.write_from_another_client('violations', 'VI011')
+        self.assertEqual(self.feed.poll(), {'violations': {'VI011'}})
+
+        self.db.commit(slow)
+        self.assertEqual(self.feed.poll(), {'violations': {'VI010'}})
+        self.assertEqual(self.feed.poll(), {})
+        self.assertEqual(self.feed.version, 2)
+
+    def test_write_open_when_the_window_starts_is_delivered(self):
+        slow = self.db.begin_write('payments', 'VI001', 'UPDATE')
+        self.db.write_from_another_client('violations', 'VI011')
+        feed = ChangeFeedController(self.db, clock=self.clock)
+        self.assertEqual(feed.poll(), {})
+
+        self.db.commit(slow)
+        self.assertEqual(feed.poll(), {'payments': {'VI001'}})
+
+    def test_rolled_back_change_stops_holding_the_position(self):
+        self.db.begin_write('violations', 'VI010')  # never committed
+        self.db.write_from_another_client('violations', 'VI011')
+        self.feed.poll()
+        self.assertEqual(self.feed.version, 0)
+
+        self.clock.now += CHANGE_GAP_GRACE_SECONDS
+        self.assertEqual(self.feed.poll(), {})
+        self.assertEqual(self.feed.version, 2)
+
+    def test_window_idle_past_retention_reloads(self):
+        self.db.write_from_another_client('violations', 'VI011')
+        self.clock.now += CHANGE_LOG_RETENTION_HOURS * 3600 + 1
+        self.assertIsNone(self.feed.poll())
+        self.assertEqual(self.feed.poll(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()